@@ -0,0 +1,151 @@
+"""Measures how long importing mentior takes in a fresh interpreter.
+
+Each scenario runs in its own subprocess, so that nothing is cached between
+runs. Besides importing, the first request and response are encoded and
+decoded, which includes building the schemas that pydantic defers to first
+use, and a first `status()` call is made against the bundled mock server,
+which runs in this process. The modules that take longest to import are
+listed as well.
+
+Run with `python benchmarks/import_time.py` from the repository root.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from mentior.mock import MockServer
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_STATUS = (
+    '{"apiName":"VTubeStudioPublicAPI","apiVersion":"1.0","timestamp":0,'
+    '"requestID":"1","messageType":"APIStateResponse","data":{"active":true,'
+    '"vTubeStudioVersion":"1.0","currentSessionAuthenticated":true}}'
+)
+
+SCENARIOS = {
+    "import mentior": "import mentior",
+    "import client": "from mentior import authenticate",
+    "first status round": (
+        "from mentior import types\n"
+        "from mentior.models.base import encode_request\n"
+        "encode_request('APIStateRequest')\n"
+        f"types.StatusResponse.parse({_STATUS!r})"
+    ),
+    "first status call": (
+        "import asyncio\n"
+        "import mentior\n"
+        "async def first_status():\n"
+        "    async with mentior.authenticate(port=PORT, store=None) as vts:\n"
+        "        await vts.status()\n"
+        "asyncio.run(first_status())"
+    ),
+}
+
+_TIMER = """
+import time
+PORT = {port}
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+@contextmanager
+def mock_server() -> Iterator[int]:
+    """Runs the mock server on a thread of its own, yielding its port."""
+    loop = asyncio.new_event_loop()
+    server = MockServer()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    try:
+        yield server.port
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def run(code: str, port: int) -> float:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(port=port, code=code)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return float(out.stdout)
+
+
+def slowest_modules(code: str, count: int) -> List[Dict[str, float]]:
+    """The modules with the highest self import time, in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    modules = []
+    for line in out.stderr.splitlines():
+        fields = line[len("import time:") :].split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            modules.append(
+                {
+                    "module": fields[2].strip(),
+                    "self_ms": int(fields[0]) / 1e3,
+                    "cumulative_ms": int(fields[1]) / 1e3,
+                }
+            )
+    return sorted(modules, key=lambda m: m["self_ms"], reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict] = {"scenarios_ms": {}}
+    with mock_server() as port:
+        for name, code in SCENARIOS.items():
+            samples = [run(code, port) * 1e3 for _ in range(args.runs)]
+            results["scenarios_ms"][name] = {
+                "runs": args.runs,
+                "min": min(samples),
+                "median": statistics.median(samples),
+                "max": max(samples),
+            }
+            print(
+                f"{name:<24} min {min(samples):7.1f} ms"
+                f"  median {statistics.median(samples):7.1f} ms"
+            )
+
+    results["slowest_modules"] = slowest_modules(
+        SCENARIOS["first status round"], args.top
+    )
+    print("slowest modules")
+    for m in results["slowest_modules"]:
+        print(f"  {m['module']:<48} {m['self_ms']:7.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Replays a recorded session and reports per-request latencies.
+
+Sessions are recorded with `mentior.recording.SessionRecorder`. By default
+the requests are replayed against the bundled mock server, which answers
+requests that refer to models or items of the recorded session with errors,
+but still reproduces the traffic shape. Pass `--port` to replay against a
+running VTS instead.
+
+Run with `python benchmarks/replay.py session.mtrc --speed 4` from the
+repository root. `--speed 0` replays as fast as possible.
+"""
+
+import argparse
+import asyncio
+import json
+from contextlib import AsyncExitStack
+from typing import Any, Dict
+
+import mentior
+from mentior.instrument import MetricsCollector
+from mentior.mock import MockServer
+from mentior.recording import replay
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    async with AsyncExitStack() as stack:
+        port = args.port
+        if port is None:
+            server = MockServer(latency=args.latency)
+            port = (await stack.enter_async_context(server)).port
+        vts = await stack.enter_async_context(
+            mentior.authenticate(port=port, store=None)
+        )
+        metrics = MetricsCollector()
+        vts.add_hook(metrics)
+        results = await replay(
+            vts,
+            args.log,
+            speed=args.speed or None,
+            max_in_flight=args.max_in_flight,
+        )
+        results["metrics"] = metrics.snapshot()
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", help="session log to replay")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--port", help="replay against VTS on this port")
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(
+        f"{results['requests']} requests in {results['duration']:.2f} s,"
+        f" errors {results['errors']}"
+    )
+    for message_type, m in sorted(results["metrics"].items()):
+        round_trip = m["round_trip"]
+        if round_trip["count"]:
+            print(
+                f"  {message_type:<32} n {round_trip['count']:6d}"
+                f"  p50 {round_trip['p50'] * 1e3:7.2f} ms"
+                f"  p99 {round_trip['p99'] * 1e3:7.2f} ms"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compares request serialization through `Request` models and `encode_request`.
+
+Run with `python benchmarks/serialization.py` from the repository root.
+"""
+
+import timeit
+
+from mentior.models.base import Request, dump_trusted, encode_request
+from mentior.models.data import ArtMeshMatcher, ArtmeshTint, ColorTint, MoveModel
+
+MOVE = dict(
+    time_in_seconds=0.1,
+    values_are_relative_to_model=False,
+    position_x=0.25,
+    position_y=-0.5,
+    position_z=None,
+    rotation=15.0,
+    size=None,
+)
+
+
+def model_path(message_type, data):
+    # Mirrors how requests were serialized before `encode_request`.
+    req = Request(message_type=message_type, data=data)
+    return req.model_dump_json(by_alias=True, exclude_none=True)
+
+
+CASES = {
+    "StatisticsRequest": {
+        "model": lambda: model_path("StatisticsRequest", None),
+        "fast": lambda: encode_request("StatisticsRequest"),
+    },
+    "HotkeyTriggerRequest": {
+        "model": lambda: model_path("HotkeyTriggerRequest", {"hotkeyID": "abc"}),
+        "fast": lambda: encode_request("HotkeyTriggerRequest", {"hotkeyID": "abc"}),
+    },
+    "MoveModelRequest": {
+        "model": lambda: model_path("MoveModelRequest", MoveModel(**MOVE)),
+        "fast": lambda: encode_request("MoveModelRequest", MoveModel(**MOVE)),
+        "fast, trusted": lambda: encode_request(
+            "MoveModelRequest", dump_trusted(MoveModel, **MOVE)
+        ),
+    },
+    "ColorTintRequest": {
+        "model": lambda: model_path(
+            "ColorTintRequest",
+            ArtmeshTint(
+                color_tint=ColorTint(color_r=200),
+                art_mesh_matcher=ArtMeshMatcher(art_mesh_number=[1, 2, 3]),
+            ),
+        ),
+        "fast": lambda: encode_request(
+            "ColorTintRequest",
+            ArtmeshTint(
+                color_tint=ColorTint(color_r=200),
+                art_mesh_matcher=ArtMeshMatcher(art_mesh_number=[1, 2, 3]),
+            ),
+        ),
+        "fast, trusted": lambda: encode_request(
+            "ColorTintRequest",
+            dump_trusted(
+                ArtmeshTint,
+                color_tint=dump_trusted(ColorTint, color_r=200),
+                art_mesh_matcher=dump_trusted(
+                    ArtMeshMatcher, art_mesh_number=[1, 2, 3]
+                ),
+            ),
+        ),
+    },
+}
+
+
+def main(number: int = 20000) -> None:
+    for message_type, paths in CASES.items():
+        print(message_type)
+        baseline = None
+        for name, fn in paths.items():
+            fn()  # warm up cached envelopes and validators
+            elapsed = min(timeit.repeat(fn, number=number, repeat=5)) / number
+            baseline = baseline or elapsed
+            print(f"  {name:<14} {elapsed * 1e6:8.2f} us  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""Measures the overhead of mentior against the bundled mock server.
+
+Reports latency percentiles, throughput and memory for serialization,
+decoding into models, lazy models and compact records, and the full round
+trip of every `AuthenticatedClient` method, plus burst and sustained-rate
+scenarios. Results are printed and written as JSON, so that runs can be
+compared across releases.
+
+Reads are not coalesced, except in the `burst_statistics_coalesced`
+scenario, which also reports how many requests the burst actually sent.
+
+Run with `python benchmarks/suite.py --output results.json` from the
+repository root.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Awaitable, Callable, Dict, List
+
+import mentior
+from mentior import types
+from mentior.client import AuthenticatedClient
+from mentior.mock import MockServer
+from mentior.models.base import encode_request
+from mentior.models.data import ArtMeshMatcher, ColorTint
+
+
+def mentior_version() -> str:
+    try:
+        return version("mentior")
+    except PackageNotFoundError:
+        return "source"
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of unsorted samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float], scale: float) -> Dict[str, float]:
+    """Percentiles and mean of samples in seconds, multiplied by `scale`."""
+    return {
+        "count": len(samples),
+        "mean": statistics.fmean(samples) * scale,
+        "p50": percentile(samples, 50) * scale,
+        "p95": percentile(samples, 95) * scale,
+        "p99": percentile(samples, 99) * scale,
+        "max": max(samples) * scale,
+    }
+
+
+def time_sync(fn: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    result = summarize(samples, 1e6)
+    result["peak_kib"] = peak_memory(fn, min(iterations, 100))
+    return result
+
+
+def peak_memory(fn: Callable[[], Any], iterations: int) -> float:
+    """Peak traced memory while calling `fn`, in KiB."""
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def time_async(
+    fn: Callable[[], Awaitable[Any]], iterations: int
+) -> Dict[str, float]:
+    await fn()
+    samples = []
+    start_all = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - start_all
+
+    result = summarize(samples, 1e3)
+    result["throughput_rps"] = iterations / elapsed
+    tracemalloc.start()
+    try:
+        for _ in range(min(iterations, 50)):
+            await fn()
+        result["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def client_calls(
+    vts: AuthenticatedClient, fixtures: Dict[str, Any]
+) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    return {
+        "status": vts.status,
+        "statistics": vts.statistics,
+        "vts_folder_info": vts.vts_folder_info,
+        "current_model": vts.current_model,
+        "available_models": vts.available_models,
+        "load_model": lambda: vts.load_model(fixtures["model_id"]),
+        "move_model": lambda: vts.move_model(0.0, position_x=0.1, rotation=5.0),
+        "model_hotkeys": vts.model_hotkeys,
+        "trigger_hotkey": lambda: vts.trigger_hotkey(fixtures["hotkey_id"]),
+        "expression_state": vts.expression_state,
+        "activate_expression": lambda: vts.activate_expression(
+            fixtures["expression_file"]
+        ),
+        "art_meshes": vts.art_meshes,
+        "tint_art_meshes": lambda: vts.tint_art_meshes(
+            ColorTint(color_r=128), ArtMeshMatcher(name_contains=["ArtMesh1"])
+        ),
+        "inject_parameters": lambda: vts.inject_parameters(
+            {"FaceAngleX": 10.0, "FaceAngleY": -5.0, "MouthOpen": 0.5}
+        ),
+    }
+
+
+async def capture_responses(vts: AuthenticatedClient) -> Dict[str, Any]:
+    """Collect raw responses to decode, keyed by response class name."""
+    requests = {
+        "StatisticsResponse": ("StatisticsRequest", None),
+        "CurrentModelResponse": ("CurrentModelRequest", None),
+        "AvailableModelsResponse": ("AvailableModelsRequest", None),
+        "HotkeysInModelResponse": ("HotkeysInCurrentModelRequest", {}),
+        "ExpressionStateResponse": ("ExpressionStateRequest", {"details": True}),
+        "ArtMeshListResponse": ("ArtMeshListRequest", None),
+        "ColorTintResponse": (
+            "ColorTintRequest",
+            {"colorTint": {"colorR": 1}, "artMeshMatcher": {"tintAll": True}},
+        ),
+    }
+    return {
+        name: await vts._request(message_type, data)
+        for name, (message_type, data) in requests.items()
+    }
+
+
+async def sustained(
+    call: Callable[[], Awaitable[Any]], rate: float, duration: float
+) -> Dict[str, Any]:
+    """Issue calls at a fixed rate without waiting for earlier responses."""
+    interval = 1 / rate
+    samples: List[float] = []
+    lateness: List[float] = []
+
+    async def timed() -> None:
+        start = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - start)
+
+    tasks = []
+    start = time.perf_counter()
+    for tick in range(int(rate * duration)):
+        deadline = start + tick * interval
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        lateness.append(max(0.0, time.perf_counter() - deadline))
+        tasks.append(asyncio.ensure_future(timed()))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "target_rate": rate,
+        "achieved_rate": len(tasks) / elapsed,
+        "latency_ms": summarize(samples, 1e3),
+        "tick_lateness_ms": summarize(lateness, 1e3),
+    }
+
+
+async def burst(call: Callable[[], Awaitable[Any]], size: int) -> Dict[str, Any]:
+    """Issue `size` calls at once, measuring each and the whole burst."""
+    samples: List[float] = []
+
+    async def timed() -> None:
+        start = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(size)))
+    elapsed = time.perf_counter() - start
+    return {
+        "size": size,
+        "total_ms": elapsed * 1e3,
+        "throughput_rps": size / elapsed,
+        "latency_ms": summarize(samples, 1e3),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mentior": mentior_version(),
+            "pydantic": version("pydantic"),
+            "websockets": version("websockets"),
+            "server_latency_s": args.latency,
+            "iterations": args.iterations,
+        }
+    }
+
+    async with MockServer(latency=args.latency, art_meshes=args.art_meshes) as server:
+        async with mentior.authenticate(port=server.port, store=None) as vts:
+            # Every call sends its own request, as before reads were coalesced,
+            # so that results stay comparable across releases.
+            vts.coalesce_reads = False
+            models = await vts.available_models()
+            hotkeys = await vts.model_hotkeys()
+            expressions = await vts.expression_state()
+            fixtures = {
+                "model_id": models.available_models[0].model_id,
+                "hotkey_id": hotkeys.available_hotkeys[0].hotkey_id,
+                "expression_file": expressions.expressions[0].file,
+            }
+
+            serialization = {}
+            for message_type, data in {
+                "StatisticsRequest": None,
+                "HotkeyTriggerRequest": {"hotkeyID": fixtures["hotkey_id"]},
+                "MoveModelRequest": {
+                    "timeInSeconds": 0.0,
+                    "valuesAreRelativeToModel": False,
+                    "positionX": 0.1,
+                },
+            }.items():
+                serialization[message_type] = time_sync(
+                    lambda: encode_request(message_type, data), args.iterations
+                )
+            results["serialization_us"] = serialization
+
+            decoding = {}
+            for name, raw in (await capture_responses(vts)).items():
+                response = getattr(types, name)
+                decoding[name] = time_sync(lambda: response.parse(raw), args.iterations)
+                decoding[f"{name} (compact)"] = time_sync(
+                    lambda: response.parse(raw, compact=True), args.iterations
+                )
+                data_model = response.__pydantic_generic_metadata__["args"][1]
+                if getattr(data_model, "lazy_fields", ()):
+                    decoding[f"{name} (lazy)"] = time_sync(
+                        lambda: response.parse(raw, lazy=True), args.iterations
+                    )
+            results["decoding_us"] = decoding
+
+            calls = client_calls(vts, fixtures)
+            results["round_trip_ms"] = {
+                name: await time_async(call, args.iterations)
+                for name, call in calls.items()
+            }
+
+            scenarios = results["scenarios"] = {
+                "burst_statistics": await burst(vts.statistics, args.burst),
+                "move_120hz": await sustained(
+                    lambda: vts.move_model(0.0, position_x=0.1), 120, args.duration
+                ),
+                "inject_120hz": await sustained(
+                    lambda: vts.inject_parameters({"FaceAngleX": 1.0}),
+                    120,
+                    args.duration,
+                ),
+            }
+            vts.coalesce_reads = True
+            sent = server.requests["StatisticsRequest"]
+            scenarios["burst_statistics_coalesced"] = await burst(
+                vts.statistics, args.burst
+            )
+            scenarios["burst_statistics_coalesced"]["requests"] = (
+                server.requests["StatisticsRequest"] - sent
+            )
+            vts.coalesce_reads = False
+    return results
+
+
+def report(results: Dict[str, Any]) -> None:
+    for section in ("serialization_us", "decoding_us", "round_trip_ms"):
+        print(section)
+        for name, r in results[section].items():
+            print(
+                f"  {name:<32} p50 {r['p50']:9.3f}  p95 {r['p95']:9.3f}"
+                f"  p99 {r['p99']:9.3f}  peak {r['peak_kib']:8.1f} KiB"
+            )
+    print("scenarios")
+    for name, r in results["scenarios"].items():
+        latency = r["latency_ms"]
+        rate = r.get("achieved_rate", r.get("throughput_rps"))
+        print(
+            f"  {name:<32} rate {rate:9.1f}/s  p50 {latency['p50']:7.3f} ms"
+            f"  p99 {latency['p99']:7.3f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--art-meshes", type=int, default=1000)
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
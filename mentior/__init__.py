@@ -1,2 +1,48 @@
-from .interface import authenticate, connect
-from .models.data import ColorTint, ArtMeshMatcher
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Names are imported from their modules on first access, so that importing
+# the package alone does not load pydantic and websockets.
+_EXPORTS = {
+    "ArtMeshIndex": ".artmesh",
+    "ClientGroup": ".group",
+    "authenticate": ".interface",
+    "authenticate_many": ".interface",
+    "connect": ".interface",
+    "MetricsCollector": ".instrument",
+    "RequestHook": ".instrument",
+    "SessionLog": ".recording",
+    "SessionRecorder": ".recording",
+    "SyncClient": ".sync",
+    "ParameterIngest": ".shm",
+    "ParameterRing": ".shm",
+    "ColorTint": ".models.data",
+    "ArtMeshMatcher": ".models.data",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_EXPORTS})
+
+
+if TYPE_CHECKING:
+    from .artmesh import ArtMeshIndex
+    from .group import ClientGroup
+    from .interface import authenticate, authenticate_many, connect
+    from .instrument import MetricsCollector, RequestHook
+    from .models.data import ColorTint, ArtMeshMatcher
+    from .recording import SessionLog, SessionRecorder
+    from .shm import ParameterIngest, ParameterRing
+    from .sync import SyncClient
@@ -0,0 +1,226 @@
+"""Animates ArtMesh tints between keyframes at a fixed frame rate."""
+
+import asyncio
+import bisect
+import time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .background import BackgroundTask, ticks
+from .models.data import ArtMeshMatcher, ColorTint
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+Easing = Callable[[float], float]
+
+EASINGS: Dict[str, Easing] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t * t,
+    "ease_out": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out": lambda t: 4 * t * t * t if t < 0.5 else 1 - (2 - 2 * t) ** 3 / 2,
+    "step": lambda t: 0.0 if t < 1 else 1.0,
+}
+
+# Quantized color channels and lighting mix of a frame.
+Frame = Tuple[int, int, int, int, float]
+
+
+def _frame(tint: ColorTint) -> Frame:
+    return (
+        tint.color_r,
+        tint.color_g,
+        tint.color_b,
+        tint.color_a,
+        tint.mix_with_scene_lighting_color,
+    )
+
+
+class TintAnimation:
+    """A tint interpolated between keyframes, given as `(seconds, tint)`.
+
+    Colors are eased between consecutive keyframes and rounded to whole
+    channel values; the lighting mix is rounded to `mix_precision` digits.
+    `easing` is a function of the progress between 0 and 1, or the name of
+    one in `EASINGS`.
+    """
+
+    def __init__(
+        self,
+        keyframes: Sequence[Tuple[float, ColorTint]],
+        matcher: ArtMeshMatcher,
+        *,
+        easing: Union[Easing, str] = "linear",
+        loop: bool = False,
+        mix_precision: int = 2,
+    ) -> None:
+        if not keyframes:
+            raise ValueError("at least one keyframe is required")
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+        self.times = [t for t, _ in keyframes]
+        self.frames = [_frame(tint) for _, tint in keyframes]
+        self.matcher = matcher
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.loop = loop
+        self.mix_precision = mix_precision
+        self.duration = self.times[-1]
+        self.finished: Optional["asyncio.Future[None]"] = None
+
+    def frame_at(self, t: float) -> Frame:
+        """The quantized tint `t` seconds into the animation."""
+        if self.loop and self.duration > 0:
+            t %= self.duration
+        i = bisect.bisect_right(self.times, t)
+        if i == 0:
+            return self.frames[0]
+        if i == len(self.times):
+            return self.frames[-1]
+        t0, t1 = self.times[i - 1], self.times[i]
+        a, b = self.frames[i - 1], self.frames[i]
+        k = self.easing((t - t0) / (t1 - t0))
+        return (
+            round(a[0] + (b[0] - a[0]) * k),
+            round(a[1] + (b[1] - a[1]) * k),
+            round(a[2] + (b[2] - a[2]) * k),
+            round(a[3] + (b[3] - a[3]) * k),
+            round(a[4] + (b[4] - a[4]) * k, self.mix_precision),
+        )
+
+    def is_over(self, t: float) -> bool:
+        return not self.loop and t >= self.duration
+
+
+class _Playing:
+    __slots__ = ("animation", "started", "last")
+
+    def __init__(self, animation: TintAnimation, started: float) -> None:
+        self.animation = animation
+        self.started = started
+        self.last: Optional[Frame] = None
+
+
+class TintAnimator:
+    """Plays any number of tint animations in one send loop.
+
+    Once per frame, the tint of every playing animation is computed, and
+    only those that changed since they were last sent are sent, all at once.
+    Playing an animation on a matcher that is already animated replaces the
+    running animation. Frames are skipped rather than queued when VTS cannot
+    keep up with `fps`.
+
+        async with vts.tint_animator(fps=30) as animator:
+            animation = animator.play(
+                [(0, ColorTint(color_r=0)), (2, ColorTint(color_b=0))],
+                ArtMeshMatcher(tint_all=True),
+                easing="ease_in_out",
+            )
+            await animation.finished
+    """
+
+    def __init__(self, client: "AuthenticatedClient", fps: float = 30.0) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self._client = client
+        self.interval = 1 / fps
+        self._playing: Dict[str, _Playing] = {}
+        self._task = BackgroundTask()
+
+    def play(
+        self,
+        keyframes: Union[TintAnimation, Sequence[Tuple[float, ColorTint]]],
+        matcher: Optional[ArtMeshMatcher] = None,
+        **kwargs,
+    ) -> TintAnimation:
+        """Start playing an animation, or keyframes for `matcher`.
+
+        Await `finished` on the returned animation to wait for its last
+        frame to be sent. It raises the error of a failed send, and is
+        cancelled when the animation is stopped or replaced.
+        """
+        if isinstance(keyframes, TintAnimation):
+            animation = keyframes
+        else:
+            if matcher is None:
+                raise ValueError("a matcher is required")
+            animation = TintAnimation(keyframes, matcher, **kwargs)
+        key = animation.matcher.model_dump_json(exclude_none=True)
+        self._cancel(key)
+        animation.finished = asyncio.get_running_loop().create_future()
+        self._playing[key] = _Playing(animation, time.monotonic())
+        self._task.start(self._run)
+        return animation
+
+    def stop(self, animation: TintAnimation) -> None:
+        """Stop an animation, leaving its last sent tint in place."""
+        for key, playing in list(self._playing.items()):
+            if playing.animation is animation:
+                self._cancel(key)
+
+    def _cancel(self, key: str) -> None:
+        playing = self._playing.pop(key, None)
+        if playing is not None and not playing.animation.finished.done():
+            playing.animation.finished.cancel()
+
+    async def close(self) -> None:
+        """Stop every animation and the send loop."""
+        for key in list(self._playing):
+            self._cancel(key)
+        await self._task.stop()
+
+    async def _send(self, key: str, playing: _Playing, frame: Frame) -> None:
+        r, g, b, a, mix = frame
+        tint = ColorTint.model_construct(
+            color_r=r,
+            color_g=g,
+            color_b=b,
+            color_a=a,
+            mix_with_scene_lighting_color=mix,
+        )
+        try:
+            await self._client.tint_art_meshes(tint, playing.animation.matcher)
+        except Exception as exc:
+            if self._playing.get(key) is playing:
+                del self._playing[key]
+            if not playing.animation.finished.done():
+                playing.animation.finished.set_exception(exc)
+
+    async def _tick(self) -> None:
+        now = time.monotonic()
+        sends = []
+        over: List[Tuple[str, _Playing]] = []
+        for key, playing in self._playing.items():
+            t = now - playing.started
+            frame = playing.animation.frame_at(t)
+            if frame != playing.last:
+                playing.last = frame
+                sends.append(self._send(key, playing, frame))
+            if playing.animation.is_over(t):
+                over.append((key, playing))
+        if sends:
+            await asyncio.gather(*sends)
+        for key, playing in over:
+            # The animation may have been replaced or failed meanwhile.
+            if self._playing.get(key) is playing:
+                del self._playing[key]
+                if not playing.animation.finished.done():
+                    playing.animation.finished.set_result(None)
+
+    async def _run(self) -> None:
+        async for _ in ticks(lambda: self.interval):
+            await self._tick()
+            if not self._playing:
+                break
+
+    async def __aenter__(self) -> "TintAnimator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,130 @@
+"""Resolves ArtMesh matchers locally, without asking VTS."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+
+from .models.data import ArtMeshes, ArtMeshMatcher
+
+Patterns = Iterable[Union[str, Pattern[str]]]
+
+
+def _key(patterns: Optional[Iterable]) -> Tuple:
+    if not patterns:
+        return ()
+    # Compiled patterns differing only in flags must not share a key.
+    return tuple(
+        (p.pattern, p.flags) if isinstance(p, re.Pattern) else p for p in patterns
+    )
+
+
+class ArtMeshIndex:
+    """An index of the ArtMeshes of a model, by number and name.
+
+    Resolves name patterns to ArtMesh numbers, so that a group of ArtMeshes
+    can be tinted with a matcher VTS does not have to evaluate, and so that
+    selections can be checked without a round trip. Resolved selections are
+    remembered, so resolving the same patterns again is a dictionary lookup.
+
+    VTS lists the tags of a model separately from its ArtMeshes, so tags
+    cannot be resolved to ArtMesh numbers.
+
+        index = await vts.art_mesh_index()
+        await vts.tint_art_meshes(tint, index.matcher(name_prefix=["Hair"]))
+    """
+
+    def __init__(self, names: Sequence[str], tags: Sequence[str] = ()) -> None:
+        self.names = list(names)
+        self.tags = list(tags)
+        self._numbers = {name: i for i, name in reversed(list(enumerate(names)))}
+        self._resolved: Dict[Tuple, List[int]] = {}
+
+    @classmethod
+    def from_art_meshes(cls, art_meshes: ArtMeshes) -> "ArtMeshIndex":
+        return cls(art_meshes.art_mesh_names, art_meshes.art_mesh_tags)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def number(self, name: str) -> Optional[int]:
+        """The number of the ArtMesh with this exact name, if any."""
+        return self._numbers.get(name)
+
+    def resolve(
+        self,
+        *,
+        name_exact: Optional[Iterable[str]] = None,
+        name_contains: Optional[Iterable[str]] = None,
+        name_prefix: Optional[Iterable[str]] = None,
+        name_regex: Optional[Patterns] = None,
+        art_mesh_number: Optional[Iterable[int]] = None,
+    ) -> List[int]:
+        """The sorted numbers of ArtMeshes matching any of the patterns.
+
+        Regular expressions match anywhere in a name, use `^` and `$` to
+        anchor them. Numbers out of range are ignored.
+        """
+        regexes = list(name_regex or ())
+        key = (
+            _key(name_exact),
+            _key(name_contains),
+            _key(name_prefix),
+            _key(regexes),
+            _key(art_mesh_number),
+        )
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return list(resolved)
+
+        exact, contains, prefixes, _, numbers = key
+        matched = {n for n in numbers if 0 <= n < len(self.names)}
+        for name in exact:
+            number = self._numbers.get(name)
+            if number is not None:
+                matched.add(number)
+        compiled = [re.compile(p) for p in regexes]
+        if contains or prefixes or compiled:
+            for number, name in enumerate(self.names):
+                if (
+                    name.startswith(prefixes)
+                    or any(c in name for c in contains)
+                    or any(r.search(name) for r in compiled)
+                ):
+                    matched.add(number)
+
+        resolved = self._resolved[key] = sorted(matched)
+        return list(resolved)
+
+    def resolve_matcher(self, matcher: ArtMeshMatcher) -> List[int]:
+        """The numbers of the ArtMeshes VTS would match.
+
+        Raises `ValueError` for matchers with tag patterns, which cannot be
+        resolved locally.
+        """
+        if matcher.tint_all:
+            return list(range(len(self.names)))
+        if matcher.tag_exact or matcher.tag_contains:
+            raise ValueError("tags cannot be resolved to ArtMesh numbers")
+        return self.resolve(
+            name_exact=matcher.name_exact,
+            name_contains=matcher.name_contains,
+            art_mesh_number=matcher.art_mesh_number,
+        )
+
+    def matcher(self, **patterns) -> ArtMeshMatcher:
+        """A matcher selecting the ArtMeshes resolved from `patterns` by number.
+
+        Takes the same arguments as `resolve`.
+        """
+        return ArtMeshMatcher(art_mesh_number=self.resolve(**patterns))
+
+    def matching_tags(
+        self,
+        tag_exact: Optional[Iterable[str]] = None,
+        tag_contains: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """The tags of the model that tag patterns would match."""
+        exact = set(tag_exact or ())
+        contains = list(tag_contains or ())
+        return [
+            tag for tag in self.tags if tag in exact or any(c in tag for c in contains)
+        ]
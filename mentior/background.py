@@ -0,0 +1,61 @@
+"""Runs the loops of streams and schedulers in the background."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Coroutine, Optional
+
+
+async def ticks(interval: Callable[[], float]) -> AsyncIterator[None]:
+    """Yield right away, then every `interval()` seconds.
+
+    Ticks that are missed because the previous one ran late are skipped
+    rather than bunched up to catch up.
+    """
+    deadline = time.monotonic()
+    while True:
+        yield
+        deadline = max(deadline + interval(), time.monotonic())
+        await asyncio.sleep(deadline - time.monotonic())
+
+
+class BackgroundTask:
+    """Holds the task of a loop, of which at most one runs at a time."""
+
+    __slots__ = ("task",)
+
+    def __init__(self) -> None:
+        self.task: Optional["asyncio.Task[Any]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self, run: Callable[[], Coroutine[Any, Any, Any]]) -> "asyncio.Task[Any]":
+        """Run `run()` in a task, unless one is running already."""
+        if not self.running:
+            self.task = asyncio.ensure_future(run())
+        return self.task
+
+    def restart(
+        self, run: Callable[[], Coroutine[Any, Any, Any]]
+    ) -> "asyncio.Task[Any]":
+        """Run `run()` in a task, cancelling the one that is running."""
+        if self.task is not None:
+            self.task.cancel()
+        self.task = asyncio.ensure_future(run())
+        return self.task
+
+    async def stop(self, cancel: bool = True) -> None:
+        """Cancel the task, or with `cancel` disabled let it end, and wait.
+
+        Re-raises the error that ended the task, if any.
+        """
+        task, self.task = self.task, None
+        if task is None:
+            return
+        if cancel:
+            task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
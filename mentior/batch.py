@@ -0,0 +1,92 @@
+"""Pipelines many requests so they share a single round trip."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class BatchItem(Generic[T]):
+    """The outcome of a single call queued in a `Batch`."""
+
+    def __init__(self) -> None:
+        self._value: Any = _MISSING
+        self._error: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self._value is not _MISSING or self._error is not None
+
+    def result(self) -> T:
+        """Returns the call result. Raises the error of a failed call."""
+        if self._error is not None:
+            raise self._error
+        if self._value is _MISSING:
+            raise RuntimeError("batch has not been sent")
+        return self._value
+
+    def error(self) -> Optional[BaseException]:
+        return self._error
+
+
+class Batch:
+    """Queues client calls and sends them back-to-back.
+
+    Any coroutine method of the client can be called on the batch, which
+    records it and returns a `BatchItem` instead of sending a request. On
+    exiting the context, every queued request is written before any response
+    is awaited, so the whole batch completes in roughly one round trip. A
+    failed call, such as one rejected with an `APIError`, only affects its own
+    item.
+
+        async with vts.batch() as b:
+            stats = b.statistics()
+            b.activate_expression("smile.exp3.json")
+        print(stats.result())
+    """
+
+    def __init__(self, client: "AuthenticatedClient") -> None:
+        self._client = client
+        self._calls: List[tuple] = []
+
+    def __getattr__(self, name: str) -> Callable[..., BatchItem]:
+        method = getattr(self._client, name)
+        if name.startswith("_") or not asyncio.iscoroutinefunction(method):
+            raise AttributeError(f"{name!r} cannot be batched")
+
+        def queue(*args: Any, **kwargs: Any) -> BatchItem:
+            item: BatchItem = BatchItem()
+            self._calls.append((method, args, kwargs, item))
+            return item
+
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def send(self) -> List[Any]:
+        """Send every queued call, returning results or errors in order."""
+        calls, self._calls = self._calls, []
+        results = await asyncio.gather(
+            *(method(*args, **kwargs) for method, args, kwargs, _ in calls),
+            return_exceptions=True,
+        )
+        for (*_, item), result in zip(calls, results):
+            if isinstance(result, BaseException):
+                item._error = result
+            else:
+                item._value = result
+        return results
+
+    async def __aenter__(self) -> "Batch":
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            await self.send()
+        else:
+            self._calls.clear()
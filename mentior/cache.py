@@ -0,0 +1,137 @@
+"""Caches API data that only changes with the loaded model or VTS config."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_MISSING = object()
+
+
+class MetadataCache:
+    """A size-bounded cache with per-entry expiry.
+
+    Entries expire `ttl` seconds after being stored, and the least recently
+    used entry is evicted once `maxsize` entries are held. The whole cache is
+    invalidated when the loaded model changes.
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0, maxsize: int = 128) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Unknown until a model is first observed.
+        self.model_id: Any = _MISSING
+        # Bumped on every invalidation, so that data fetched before one is
+        # not stored after it.
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            expires, value = self._entries[key]
+        except KeyError:
+            return default
+        if expires < time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self.generation += 1
+
+    def discard(self, method_name: str) -> None:
+        """Drop the entries of one client method, after it changed state."""
+        for key in [key for key in self._entries if key[0] == method_name]:
+            del self._entries[key]
+        # Data of that method fetched before now must not be stored either.
+        self.generation += 1
+
+    def observe_model(self, model_id: Optional[str]) -> None:
+        """Record the loaded model, invalidating the cache if it changed.
+
+        Entries stored before any model was observed may belong to another
+        model, so the first observation invalidates them too.
+        """
+        if model_id != self.model_id:
+            self.invalidate()
+        self.model_id = model_id
+
+
+def cached(method: F) -> F:
+    """Serve a client method from the client's `MetadataCache`, if enabled.
+
+    Results are keyed by method name and arguments. The cached object is
+    shared between callers and should not be mutated.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        cache: Optional[MetadataCache] = self._cache
+        if cache is None:
+            return await method(self, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            generation = cache.generation
+            value = await method(self, *args, **kwargs)
+            if cache.generation == generation:
+                cache.put(key, value)
+        return value
+
+    return wrapper  # type: ignore[return-value]
+
+
+def single_flight(method: F) -> F:
+    """Share one call of a client method between identical concurrent calls.
+
+    While a call is in flight, calls with the same arguments wait for its
+    result instead of sending requests of their own, unless `coalesce_reads`
+    is disabled on the client. Only suitable for methods without side
+    effects. The result is shared between callers and should not be mutated.
+    Cancelling one caller does not cancel the call for the others.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.coalesce_reads:
+            return await method(self, *args, **kwargs)
+
+        in_flight: Optional[Dict[Hashable, "asyncio.Task[Any]"]] = self._in_flight
+        if in_flight is None:
+            in_flight = self._in_flight = {}
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        task = in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            in_flight[key] = task
+
+            def done(task: "asyncio.Task[Any]") -> None:
+                if in_flight.get(key) is task:
+                    del in_flight[key]
+                # Mark the error as retrieved, in case every caller left.
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(done)
+        return await asyncio.shield(task)
+
+    return wrapper  # type: ignore[return-value]
@@ -1,10 +1,31 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
 from websockets import WebSocketClientProtocol
+from websockets.exceptions import ConnectionClosed
 
-from .errors import AuthenticationError
-from .models.base import Request
+from .cache import MetadataCache, cached, single_flight
+from .dispatch import DEFAULT_TIMEOUT, Dispatcher, Message
+from .errors import APIError, AuthenticationError
+from .events import Event, EventName, EventQueue, OverflowPolicy
+from .instrument import RequestHook, RequestInfo
+from .models.base import Response, dump_trusted, encode_request
 from .models.data import (
     ArtMeshMatcher,
     ArtMeshes,
@@ -12,61 +33,186 @@ from .models.data import (
     AvailableModels,
     ColorTint,
     CurrentModel,
+    EventSubscription,
     ExpressionState,
     Hotkeys,
+    InputParameter,
+    InputParameters,
+    ItemAnimation,
+    ItemAnimationControl,
+    ItemLoad,
+    ItemMove,
+    Items,
+    Live2DParameters,
+    LoadedItem,
+    MovedItem,
     MoveModel,
     Status,
     Statistics,
     VTSFolderInfo,
 )
-from .types import (
-    ArtMeshListResponse,
-    AuthResponse,
-    AuthTokenResponse,
-    AvailableModelsResponse,
-    ColorTintResponse,
-    CurrentModelResponse,
-    ExpressionActivationResponse,
-    ExpressionStateResponse,
-    HotkeyTriggerResponse,
-    HotkeysInModelResponse,
-    ModelLoadResponse,
-    MoveModelResponse,
-    RequestType,
-    StatusResponse,
-    StatisticsResponse,
-    VTSFolderInfoResponse,
+from . import types
+from .types import IDEMPOTENT_REQUESTS, RequestType
+
+if TYPE_CHECKING:
+    from .animation import TintAnimator
+    from .artmesh import ArtMeshIndex
+    from .batch import Batch
+    from .hotkeys import HotkeyScheduler
+    from .injection import ParameterInjector
+    from .items import ItemMover
+    from .motion import MotionScheduler
+    from .polling import ParameterPoller
+    from .switching import ModelSwitcher
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# The request whose response is about to be parsed, when hooks are installed.
+# Coroutines awaited in the same task share it, so `_request` can hand it to
+# the `_parse` that follows without changing every endpoint.
+_current_request: ContextVar[Optional[RequestInfo]] = ContextVar(
+    "_current_request", default=None
 )
 
 
 class Client:
     """Base class for implementing API endpoints."""
 
-    def __init__(self, ws: WebSocketClientProtocol) -> None:
+    # Disable to skip validating request data that is already trusted.
+    validate_requests: bool = True
+    # Enable to decode large lists in responses only when they are accessed.
+    lazy_responses: bool = False
+    # Enable to decode responses into unvalidated read-only records instead
+    # of models, which is cheaper for data read at a high rate.
+    compact_responses: bool = False
+    # Disable to send every read request, rather than sharing one exchange
+    # between identical reads in flight at the same time.
+    coalesce_reads: bool = True
+
+    _in_flight: Optional[Dict[Any, "asyncio.Task[Any]"]] = None
+
+    def __init__(
+        self,
+        ws: WebSocketClientProtocol,
+        *,
+        dispatcher: Optional[Dispatcher] = None,
+    ) -> None:
         self._ws = ws
+        self._dispatcher = dispatcher or Dispatcher(ws)
 
     async def _request(
         self,
         message_type: RequestType,
         data: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
     ) -> str | bytes:
-        """Send a request to the API. May optionally contain data."""
-        req = Request(message_type=message_type, data=data)
-        # Enabling `exclude_none` omits the `data` field when empty.
-        payload = req.model_dump_json(by_alias=True, exclude_none=True)
-        await self._ws.send(payload)
-        return await self._ws.recv()
+        """Send a request to the API. May optionally contain data.
+
+        Safe to call concurrently; responses are matched by request ID.
+        `timeout` overrides that of the dispatcher.
+        """
+        hooks = self._dispatcher.hooks
+        if not hooks:
+            request_id, payload = encode_request(message_type, data)
+            return await self._dispatcher.request(
+                request_id,
+                payload,
+                message_type in IDEMPOTENT_REQUESTS,
+                timeout=timeout,
+            )
+
+        info = RequestInfo(message_type)
+        _current_request.set(info)
+        for hook in hooks:
+            hook.before_serialize(info)
+
+        def sent() -> None:
+            info.sent_at = time.perf_counter()
+            for hook in hooks:
+                hook.after_send(info)
+
+        try:
+            info.request_id, payload = encode_request(message_type, data)
+            info.payload = payload
+            info.payload_size = len(payload)
+            info.serialized_at = time.perf_counter()
+            res = await self._dispatcher.request(
+                info.request_id,
+                payload,
+                message_type in IDEMPOTENT_REQUESTS,
+                sent,
+                timeout,
+            )
+        except BaseException as exc:
+            self._failed(info, exc)
+            raise
+        info.received_at = time.perf_counter()
+        info.response = res
+        info.response_size = len(res)
+        for hook in hooks:
+            hook.on_receive(info)
+        return res
+
+    def _parse(self, response: Type[Response], res: Message) -> Any:
+        """Decode the data of a response. Raises `APIError` on failure."""
+        info = _current_request.get() if self._dispatcher.hooks else None
+        if info is None:
+            return response.parse(res, self.lazy_responses, self.compact_responses)
+
+        _current_request.set(None)
+        try:
+            data = response.parse(res, self.lazy_responses, self.compact_responses)
+        except BaseException as exc:
+            self._failed(info, exc)
+            raise
+        info.parsed_at = time.perf_counter()
+        for hook in self._dispatcher.hooks:
+            hook.after_parse(info)
+        return data
 
+    def _failed(self, info: RequestInfo, exc: BaseException) -> None:
+        info.error = exc
+        for hook in self._dispatcher.hooks:
+            hook.on_error(info, exc)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Call `hook` at each stage of every request, see `RequestHook`.
+
+        Hooks are shared by all clients on the same connection.
+        """
+        self._dispatcher.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        if hook in self._dispatcher.hooks:
+            self._dispatcher.hooks.remove(hook)
+
+    def _build(
+        self, model: Type[ModelT], **fields: Any
+    ) -> Union[ModelT, Dict[str, Any]]:
+        """Build request data, validating it unless disabled."""
+        if self.validate_requests:
+            return model(**fields)
+        return dump_trusted(model, **fields)
+
+    async def close(self) -> None:
+        """Close the connection and cancel any pending requests."""
+        await self._dispatcher.close()
+
+    @single_flight
     async def status(self) -> Status:
         """Check the API connection status."""
         res = await self._request("APIStateRequest")
-        return StatusResponse.parse(res)
+        return self._parse(types.StatusResponse, res)
 
 
 class UnauthenticatedClient(Client):
     """Implements API endpoints that can be called without authenticating."""
 
     async def request_auth_token(self) -> str:
+        """Request a new token, which the user has to allow in VTS.
+
+        Waits for as long as the user takes, without a timeout.
+        """
         res = await self._request(
             "AuthenticationTokenRequest",
             {
@@ -74,8 +220,9 @@ class UnauthenticatedClient(Client):
                 "pluginDeveloper": "ArkStruct",
                 "pluginIcon": None,
             },
+            timeout=None,
         )
-        data = AuthTokenResponse.parse(res)
+        data = self._parse(types.AuthTokenResponse, res)
         return data.authentication_token
 
     async def authenticate(self, token: Optional[str] = None) -> "AuthenticatedClient":
@@ -90,36 +237,103 @@ class UnauthenticatedClient(Client):
                 "authenticationToken": token,
             },
         )
-        data = AuthResponse.parse(res)
+        data = self._parse(types.AuthResponse, res)
 
         if not data.authenticated:
             raise AuthenticationError(data.reason)
 
-        return AuthenticatedClient(self._ws)
+        return AuthenticatedClient(self._ws, dispatcher=self._dispatcher)
 
 
 class AuthenticatedClient(Client):
     """Implements API endpoints that can be called when authenticated."""
 
+    _cache: Optional[MetadataCache] = None
+    _cache_events: Optional[EventQueue] = None
+    # Configs of subscribed events, to renew subscriptions after reconnecting.
+    _event_configs: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+
+    async def enable_cache(
+        self, ttl: Optional[float] = 60.0, maxsize: int = 128
+    ) -> MetadataCache:
+        """Cache data that only changes with the loaded model or VTS config.
+
+        Covers folder info, available models, hotkeys, expression states and
+        ArtMeshes. The cache subscribes to `ModelLoadedEvent` until disabled,
+        and is invalidated when a model is loaded, in VTS or through this
+        client, or when `current_model` reports a different model. Expression
+        states are also dropped when an expression is activated through this
+        client.
+        """
+        await self.disable_cache()
+        cache = self._cache = MetadataCache(ttl, maxsize)
+        self._dispatcher.add_listener(self._observe_event)
+        # Only holds the subscription, the listener handles the events.
+        self._cache_events = EventQueue(1, "drop_newest")
+        try:
+            await self._subscribe(("ModelLoadedEvent",), self._cache_events)
+        except BaseException:
+            await self.disable_cache()
+            raise
+        return cache
+
+    async def disable_cache(self) -> None:
+        self._dispatcher.remove_listener(self._observe_event)
+        self._cache = None
+        queue, self._cache_events = self._cache_events, None
+        if queue is not None:
+            await self._unsubscribe(("ModelLoadedEvent",), queue)
+
+    def _observe_event(self, event: Event) -> None:
+        if self._cache is not None and event.message_type == "ModelLoadedEvent":
+            loaded = event.data.get("modelLoaded")
+            self._cache.observe_model(event.data.get("modelID") if loaded else None)
+
+    def batch(self) -> "Batch":
+        """Queue calls to be sent together, see `Batch`."""
+        from .batch import Batch
+
+        return Batch(self)
+
+    @single_flight
     async def statistics(self) -> Statistics:
         res = await self._request("StatisticsRequest")
-        return StatisticsResponse.parse(res)
+        return self._parse(types.StatisticsResponse, res)
 
+    @cached
+    @single_flight
     async def vts_folder_info(self) -> VTSFolderInfo:
         res = await self._request("VTSFolderInfoRequest")
-        return VTSFolderInfoResponse.parse(res)
+        return self._parse(types.VTSFolderInfoResponse, res)
 
+    @single_flight
     async def current_model(self) -> CurrentModel:
         res = await self._request("CurrentModelRequest")
-        return CurrentModelResponse.parse(res)
+        model = self._parse(types.CurrentModelResponse, res)
+        if self._cache is not None:
+            self._cache.observe_model(model.model_id if model.model_loaded else None)
+        return model
 
+    @cached
+    @single_flight
     async def available_models(self) -> AvailableModels:
         res = await self._request("AvailableModelsRequest")
-        return AvailableModelsResponse.parse(res)
+        return self._parse(types.AvailableModelsResponse, res)
 
     async def load_model(self, model_id: str) -> None:
         res = await self._request("ModelLoadRequest", {"modelID": model_id})
-        assert model_id == ModelLoadResponse.parse(res).model_id
+        assert model_id == self._parse(types.ModelLoadResponse, res).model_id
+        if self._cache is not None:
+            self._cache.observe_model(model_id)
+
+    def model_switcher(self, **kwargs: Any) -> "ModelSwitcher":
+        """Create a scheduler that waits out model load cooldowns.
+
+        Use as an async context manager to cancel a waiting switch on exit.
+        """
+        from .switching import ModelSwitcher
+
+        return ModelSwitcher(self, **kwargs)
 
     async def move_model(
         self,
@@ -134,7 +348,8 @@ class AuthenticatedClient(Client):
     ) -> None:
         res = await self._request(
             "MoveModelRequest",
-            MoveModel(
+            self._build(
+                MoveModel,
                 time_in_seconds=time_in_seconds,
                 values_are_relative_to_model=values_are_relative_to_model,
                 position_x=position_x,
@@ -144,8 +359,16 @@ class AuthenticatedClient(Client):
                 size=size,
             ),
         )
-        MoveModelResponse.parse(res)
+        self._parse(types.MoveModelResponse, res)
+
+    def motion_scheduler(self, **kwargs: Any) -> "MotionScheduler":
+        """Create a scheduler that moves the model along keyframed paths."""
+        from .motion import MotionScheduler
 
+        return MotionScheduler(self, **kwargs)
+
+    @cached
+    @single_flight
     async def model_hotkeys(
         self,
         model_id: Optional[str] = None,
@@ -155,7 +378,7 @@ class AuthenticatedClient(Client):
             "HotkeysInCurrentModelRequest",
             {"modelID": model_id, "live2DItemFileName": live2d_item_file_name},
         )
-        return HotkeysInModelResponse.parse(res)
+        return self._parse(types.HotkeysInModelResponse, res)
 
     async def trigger_hotkey(
         self,
@@ -166,8 +389,19 @@ class AuthenticatedClient(Client):
             "HotkeyTriggerRequest",
             {"hotkeyID": hotkey_id, "itemInstanceID": item_instance_id},
         )
-        assert hotkey_id == HotkeyTriggerResponse.parse(res).hotkey_id
+        assert hotkey_id == self._parse(types.HotkeyTriggerResponse, res).hotkey_id
+
+    def hotkey_scheduler(self, **kwargs: Any) -> "HotkeyScheduler":
+        """Create a scheduler that respects hotkey cooldowns and queue limits.
+
+        Use as an async context manager to cancel waiting triggers on exit.
+        """
+        from .hotkeys import HotkeyScheduler
 
+        return HotkeyScheduler(self, **kwargs)
+
+    @cached
+    @single_flight
     async def expression_state(
         self,
         details: bool = True,
@@ -180,7 +414,7 @@ class AuthenticatedClient(Client):
             "ExpressionStateRequest",
             {"details": details, "expressionFile": expression_file},
         )
-        return ExpressionStateResponse.parse(res)
+        return self._parse(types.ExpressionStateResponse, res)
 
     async def activate_expression(
         self,
@@ -194,11 +428,25 @@ class AuthenticatedClient(Client):
             "ExpressionActivationRequest",
             {"expressionFile": expression_file, "active": active},
         )
-        ExpressionActivationResponse.parse(res)
+        self._parse(types.ExpressionActivationResponse, res)
+        if self._cache is not None:
+            self._cache.discard("expression_state")
 
+    @cached
+    @single_flight
     async def art_meshes(self) -> ArtMeshes:
         res = await self._request("ArtMeshListRequest")
-        return ArtMeshListResponse.parse(res)
+        return self._parse(types.ArtMeshListResponse, res)
+
+    @cached
+    async def art_mesh_index(self) -> "ArtMeshIndex":
+        """Index the ArtMeshes of the current model to resolve matchers locally.
+
+        With the cache enabled, the index is kept until the model changes.
+        """
+        from .artmesh import ArtMeshIndex
+
+        return ArtMeshIndex.from_art_meshes(await self.art_meshes())
 
     async def tint_art_meshes(
         self,
@@ -207,9 +455,293 @@ class AuthenticatedClient(Client):
     ) -> int:
         res = await self._request(
             "ColorTintRequest",
-            ArtmeshTint(
-                color_tint=color_tint or ColorTint(),
-                art_mesh_matcher=art_mesh_matcher or ArtMeshMatcher(),
+            self._build(
+                ArtmeshTint,
+                color_tint=color_tint or self._build(ColorTint),
+                art_mesh_matcher=art_mesh_matcher or self._build(ArtMeshMatcher),
             ),
         )
-        return ColorTintResponse.parse(res).matched_art_meshes
+        return self._parse(types.ColorTintResponse, res).matched_art_meshes
+
+    def tint_animator(self, fps: float = 30.0) -> "TintAnimator":
+        """Create an engine that plays tint animations at `fps` frames a second.
+
+        Use as an async context manager to stop every animation on exit.
+        """
+        from .animation import TintAnimator
+
+        return TintAnimator(self, fps)
+
+    async def inject_parameters(
+        self,
+        values: Mapping[str, float],
+        *,
+        weights: Optional[Mapping[str, float]] = None,
+        face_found: bool = False,
+        mode: Literal["set", "add"] = "set",
+    ) -> None:
+        """Feed values for default or custom tracking parameters."""
+        weights = weights or {}
+        parameter_values = []
+        for parameter_id, value in values.items():
+            parameter = {"id": parameter_id, "value": value}
+            if parameter_id in weights:
+                parameter["weight"] = weights[parameter_id]
+            parameter_values.append(parameter)
+        res = await self._request(
+            "InjectParameterDataRequest",
+            {
+                "faceFound": face_found,
+                "mode": mode,
+                "parameterValues": parameter_values,
+            },
+        )
+        self._parse(types.InjectParameterDataResponse, res)
+
+    @single_flight
+    async def live2d_parameters(self) -> Live2DParameters:
+        """Read the Live2D parameters of the current model, with their values."""
+        res = await self._request("Live2DParameterListRequest")
+        return self._parse(types.Live2DParameterListResponse, res)
+
+    @single_flight
+    async def input_parameters(self) -> InputParameters:
+        """Read the default and custom tracking parameters, with their values."""
+        res = await self._request("InputParameterListRequest")
+        return self._parse(types.InputParameterListResponse, res)
+
+    @single_flight
+    async def parameter_value(self, name: str) -> InputParameter:
+        """Read a single default or custom tracking parameter."""
+        res = await self._request("ParameterValueRequest", {"name": name})
+        return self._parse(types.ParameterValueResponse, res)
+
+    def parameter_poller(self, rate: float = 10.0, **kwargs: Any) -> "ParameterPoller":
+        """Create a poller that reports only parameters that changed."""
+        from .polling import ParameterPoller
+
+        return ParameterPoller(self, rate, **kwargs)
+
+    def injection_stream(
+        self, rate: float = 60.0, **kwargs: Any
+    ) -> "ParameterInjector":
+        """Create a coalescing parameter stream flushed `rate` times a second.
+
+        Use as an async context manager to run it in the background.
+        """
+        from .injection import ParameterInjector
+
+        return ParameterInjector(self, rate, **kwargs)
+
+    @single_flight
+    async def items(
+        self,
+        *,
+        include_available_spots: bool = False,
+        include_item_instances_in_scene: bool = True,
+        include_available_item_files: bool = False,
+        only_items_with_file_name: Optional[str] = None,
+        only_items_with_instance_id: Optional[str] = None,
+    ) -> Items:
+        """List the items in the scene and, optionally, those available."""
+        res = await self._request(
+            "ItemListRequest",
+            {
+                "includeAvailableSpots": include_available_spots,
+                "includeItemInstancesInScene": include_item_instances_in_scene,
+                "includeAvailableItemFiles": include_available_item_files,
+                "onlyItemsWithFileName": only_items_with_file_name,
+                "onlyItemsWithInstanceID": only_items_with_instance_id,
+            },
+        )
+        return self._parse(types.ItemListResponse, res)
+
+    async def load_item(
+        self,
+        file_name: str,
+        *,
+        position_x: Optional[float] = None,
+        position_y: Optional[float] = None,
+        size: Optional[float] = None,
+        rotation: Optional[float] = None,
+        fade_time: Optional[float] = None,
+        order: Optional[int] = None,
+        fail_if_order_taken: bool = False,
+        smoothing: Optional[float] = None,
+        censored: bool = False,
+        flipped: bool = False,
+        locked: bool = False,
+        unload_when_plugin_disconnects: bool = True,
+    ) -> str:
+        """Load an item into the scene, returning its instance ID."""
+        res = await self._request(
+            "ItemLoadRequest",
+            self._build(
+                ItemLoad,
+                file_name=file_name,
+                position_x=position_x,
+                position_y=position_y,
+                size=size,
+                rotation=rotation,
+                fade_time=fade_time,
+                order=order,
+                fail_if_order_taken=fail_if_order_taken,
+                smoothing=smoothing,
+                censored=censored,
+                flipped=flipped,
+                locked=locked,
+                unload_when_plugin_disconnects=unload_when_plugin_disconnects,
+            ),
+        )
+        return self._parse(types.ItemLoadResponse, res).instance_id
+
+    async def unload_items(
+        self,
+        instance_ids: Sequence[str] = (),
+        file_names: Sequence[str] = (),
+        *,
+        unload_all_in_scene: bool = False,
+        unload_all_loaded_by_this_plugin: bool = False,
+        allow_unloading_items_loaded_by_user_or_other_plugins: bool = True,
+    ) -> List[LoadedItem]:
+        """Remove items from the scene, returning those that were removed."""
+        res = await self._request(
+            "ItemUnloadRequest",
+            {
+                "unloadAllInScene": unload_all_in_scene,
+                "unloadAllLoadedByThisPlugin": unload_all_loaded_by_this_plugin,
+                "allowUnloadingItemsLoadedByUserOrOtherPlugins": (
+                    allow_unloading_items_loaded_by_user_or_other_plugins
+                ),
+                "instanceIDs": list(instance_ids),
+                "fileNames": list(file_names),
+            },
+        )
+        return self._parse(types.ItemUnloadResponse, res).unloaded_items
+
+    async def control_item_animation(
+        self,
+        item_instance_id: str,
+        *,
+        framerate: Optional[float] = None,
+        frame: Optional[int] = None,
+        brightness: Optional[float] = None,
+        opacity: Optional[float] = None,
+        auto_stop_frames: Optional[List[int]] = None,
+        playing: Optional[bool] = None,
+    ) -> ItemAnimation:
+        """Change the appearance or animation of an item.
+
+        Values left as `None` are not changed. An empty `auto_stop_frames`
+        list removes the auto-stop frames.
+        """
+        res = await self._request(
+            "ItemAnimationControlRequest",
+            self._build(
+                ItemAnimationControl,
+                item_instance_id=item_instance_id,
+                framerate=framerate,
+                frame=frame,
+                brightness=brightness,
+                opacity=opacity,
+                set_auto_stop_frames=auto_stop_frames is not None,
+                auto_stop_frames=auto_stop_frames,
+                set_animation_play_state=playing is not None,
+                animation_play_state=playing,
+            ),
+        )
+        return self._parse(types.ItemAnimationControlResponse, res)
+
+    async def move_items(
+        self, moves: Sequence[Union[ItemMove, Dict[str, Any]]]
+    ) -> List[MovedItem]:
+        """Move several items in one request.
+
+        Moves may also be given in their serialized form, as built by `_build`.
+        Moves of unknown items do not fail the request, but are reported as
+        unsuccessful in the result.
+        """
+        res = await self._request("ItemMoveRequest", {"itemsToMove": list(moves)})
+        return self._parse(types.ItemMoveResponse, res).moved_items
+
+    def item_mover(self, **kwargs: Any) -> "ItemMover":
+        """Create a mover that sends item moves in bulk, see `ItemMover`.
+
+        Use as an async context manager to send the last moves on exit.
+        """
+        from .items import ItemMover
+
+        return ItemMover(self, **kwargs)
+
+    async def subscribe_event(
+        self,
+        event_name: EventName,
+        subscribe: bool = True,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> EventSubscription:
+        """Subscribe to or unsubscribe from an event type.
+
+        Received events are only delivered through `events`.
+        """
+        res = await self._request(
+            "EventSubscriptionRequest",
+            {"eventName": event_name, "subscribe": subscribe, "config": config or {}},
+        )
+        return self._parse(types.EventSubscriptionResponse, res)
+
+    async def events(
+        self,
+        *event_names: EventName,
+        config: Optional[Dict[str, Any]] = None,
+        maxsize: int = 64,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> AsyncIterator[Event]:
+        """Iterate over events of the given types as they arrive.
+
+        Events are buffered in a queue of `maxsize` events, with `overflow`
+        deciding what happens when it is full, see `EventQueue`. The event
+        types are subscribed to for as long as any iterator needs them; a
+        `config` replaces that of earlier subscriptions to the same types.
+
+            async for event in vts.events("ModelLoadedEvent"):
+                print(event.data["modelName"])
+        """
+        if not event_names:
+            raise ValueError("at least one event type is required")
+        queue = EventQueue(maxsize, overflow)
+        try:
+            await self._subscribe(event_names, queue, config)
+            while True:
+                yield await queue.get()
+        finally:
+            await self._unsubscribe(event_names, queue)
+
+    async def _subscribe(
+        self,
+        event_names: Sequence[str],
+        queue: EventQueue,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Deliver events to `queue`, subscribing to the types not yet."""
+        if self._event_configs is None:
+            self._event_configs = {}
+            self._dispatcher.add_reconnect_hook(self._resubscribe)
+        for event_name in event_names:
+            first = self._dispatcher.subscribe(event_name, queue)
+            if first or config is not None:
+                self._event_configs[event_name] = config
+                await self.subscribe_event(event_name, True, config)
+
+    async def _unsubscribe(self, event_names: Sequence[str], queue: EventQueue) -> None:
+        """Stop delivering events to `queue`, unsubscribing unused types."""
+        for event_name in event_names:
+            if self._dispatcher.unsubscribe(event_name, queue):
+                try:
+                    await self.subscribe_event(event_name, False)
+                except (APIError, ConnectionClosed, asyncio.TimeoutError):
+                    pass
+
+    async def _resubscribe(self) -> None:
+        for event_name in self._dispatcher.subscriptions:
+            config = self._event_configs.get(event_name)
+            await self.subscribe_event(event_name, True, config)
@@ -0,0 +1,319 @@
+"""Multiplexes concurrent requests over a single websocket connection."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic_core import from_json
+from websockets import WebSocketClientProtocol
+from websockets.exceptions import ConnectionClosed, WebSocketException
+
+from .events import Event, EventQueue
+from .instrument import RequestHook
+
+Message = Union[str, bytes]
+
+logger = logging.getLogger(__name__)
+
+# Stands for the `timeout` of the dispatcher in `Dispatcher.request`.
+DEFAULT_TIMEOUT: Any = object()
+
+
+class _Pending:
+    """A request awaiting its response."""
+
+    __slots__ = ("future", "payload", "idempotent", "sent")
+
+    def __init__(
+        self,
+        future: "asyncio.Future[Message]",
+        payload: Message,
+        idempotent: bool,
+    ) -> None:
+        self.future = future
+        self.payload = payload
+        self.idempotent = idempotent
+        self.sent = False
+
+
+class Dispatcher:
+    """Routes responses from a shared websocket to the requests awaiting them.
+
+    Every request is registered under its unique ID before being sent. A
+    background reader task resolves the matching future as each response
+    arrives, so any number of requests may be in flight at the same time.
+    Requests that receive no response within `timeout` seconds raise
+    `asyncio.TimeoutError`; a late response to such a request is discarded.
+
+    Events are delivered to every queue subscribed to their type, and to
+    every listener.
+
+    The `hooks` are not called by the dispatcher itself, but are kept here so
+    that every client sharing the connection reports to them.
+
+    When given a `connect` callable, a lost connection is replaced by a new
+    one, retrying with exponential backoff within the `backoff` bounds. The
+    reconnect hooks then run, for example to authenticate again, before
+    idempotent requests that were in flight are sent again and new requests
+    are let through. Other requests in flight fail with `ConnectionClosed`,
+    since they may already have taken effect.
+    """
+
+    def __init__(
+        self,
+        ws: WebSocketClientProtocol,
+        timeout: Optional[float] = 10.0,
+        *,
+        connect: Optional[Callable[[], Awaitable[WebSocketClientProtocol]]] = None,
+        backoff: Tuple[float, float] = (0.5, 30.0),
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        self._ws = ws
+        self.timeout = timeout
+        self._connect = connect
+        self.backoff = backoff
+        self.max_attempts = max_attempts
+        self._pending: Dict[str, _Pending] = {}
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._queues: Dict[str, List[EventQueue]] = {}
+        self._listeners: List[Callable[[Event], None]] = []
+        self._reconnect_hooks: List[Callable[[], Awaitable[None]]] = []
+        self._reconnecting: Optional["asyncio.Task[None]"] = None
+        self._connected: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+        self.hooks: List[RequestHook] = []
+
+    def _gate(self) -> asyncio.Event:
+        """The event that is set while requests may be sent."""
+        if self._connected is None:
+            self._connected = asyncio.Event()
+            self._connected.set()
+        return self._connected
+
+    def _ensure_reader(self) -> None:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._read(self._ws))
+
+    async def _wait_connected(self) -> None:
+        """Wait out a reconnection, unless called by the reconnection itself."""
+        gate = self._gate()
+        if not gate.is_set() and asyncio.current_task() is not self._reconnecting:
+            await gate.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def request(
+        self,
+        request_id: str,
+        payload: Message,
+        idempotent: bool = False,
+        on_sent: Optional[Callable[[], None]] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> Message:
+        """Send a payload and wait for the response carrying `request_id`.
+
+        Idempotent requests are sent again if the connection is replaced
+        while they are in flight. `on_sent` is called once the payload has
+        been sent. `timeout` overrides that of the dispatcher, `None` waits
+        for as long as it takes.
+        """
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        await self._wait_connected()
+        self._ensure_reader()
+
+        future = asyncio.get_running_loop().create_future()
+        pending = _Pending(future, payload, idempotent)
+        self._pending[request_id] = pending
+        try:
+            while True:
+                ws = self._ws
+                try:
+                    await ws.send(payload)
+                    break
+                except ConnectionClosed as exc:
+                    if self._connect is None:
+                        raise
+                    if asyncio.current_task() is self._reconnecting:
+                        raise
+                    # Nothing was sent, so any request can safely wait for a
+                    # new connection and try again.
+                    self._lost(ws, exc)
+                    await self._wait_connected()
+            pending.sent = True
+            if on_sent is not None:
+                on_sent()
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    def subscribe(self, event_name: str, queue: EventQueue) -> bool:
+        """Deliver events of a type to a queue.
+
+        Returns whether this is the first subscriber for the event type.
+        """
+        self._ensure_reader()
+        queues = self._queues.setdefault(event_name, [])
+        queues.append(queue)
+        return len(queues) == 1
+
+    def unsubscribe(self, event_name: str, queue: EventQueue) -> bool:
+        """Stop delivering events of a type to a queue.
+
+        Returns whether no subscribers remain for the event type.
+        """
+        queues = self._queues.get(event_name, [])
+        if queue in queues:
+            queues.remove(queue)
+            # Release the reader if it is blocked on this queue.
+            queue.close(asyncio.CancelledError())
+        if queues:
+            return False
+        self._queues.pop(event_name, None)
+        return True
+
+    @property
+    def subscriptions(self) -> List[str]:
+        """The event types that have subscribers."""
+        return list(self._queues)
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """Call `listener` with every event received."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Event], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def add_reconnect_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Run `hook` after reconnecting, before other requests are sent."""
+        self._reconnect_hooks.append(hook)
+
+    async def close(self) -> None:
+        """Close the connection and cancel every pending request."""
+        for task in (self._reconnecting, self._reader):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._reconnecting = None
+        self._reader = None
+        self._shutdown(asyncio.CancelledError())
+        await self._ws.close()
+
+    async def _read(self, ws: WebSocketClientProtocol) -> None:
+        """Read messages until the connection closes, resolving each one."""
+        while True:
+            try:
+                message = await ws.recv()
+            except ConnectionClosed as exc:
+                self._lost(ws, exc)
+                return
+            await self._dispatch(message)
+
+    async def _dispatch(self, message: Message) -> None:
+        try:
+            raw = from_json(message)
+            request_id = raw.get("requestID")
+            message_type = raw.get("messageType", "")
+        except (ValueError, AttributeError):
+            return
+
+        pending = self._pending.get(request_id)
+        if pending is not None:
+            if not pending.future.done():
+                pending.future.set_result(message)
+        elif message_type.endswith("Event"):
+            # Errors are logged rather than raised, which would stop the
+            # reader and with it every request.
+            try:
+                event = Event.model_validate(raw)
+            except Exception:
+                logger.exception("Dropping malformed %s", message_type)
+                return
+            for listener in self._listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    logger.exception("Event listener %r failed", listener)
+            for queue in self._queues.get(message_type, ()):
+                await queue.put(event)
+
+    def _lost(self, ws: WebSocketClientProtocol, exc: ConnectionClosed) -> None:
+        """Handle the loss of `ws`, reconnecting if possible."""
+        if ws is not self._ws or self._error is not None:
+            return
+        if self._connect is None:
+            self._shutdown(exc)
+            return
+
+        self._gate().clear()
+        for pending in self._pending.values():
+            if pending.sent and not pending.idempotent and not pending.future.done():
+                pending.future.set_exception(exc)
+        if self._reconnecting is None:
+            self._reconnecting = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay, max_delay = self.backoff
+        attempts = 0
+        while True:
+            attempts += 1
+            connected = False
+            try:
+                self._ws = await self._connect()
+                connected = True
+                self._reader = asyncio.ensure_future(self._read(self._ws))
+                for hook in self._reconnect_hooks:
+                    await hook()
+                break
+            except asyncio.TimeoutError as exc:
+                # Only a connection attempt that timed out is retried. A hook
+                # that timed out, for example waiting for the user to allow a
+                # new token, would only time out again. Caught first, since it
+                # is an `OSError` from Python 3.11.
+                if connected:
+                    self._reconnecting = None
+                    self._shutdown(exc)
+                    return
+                failure: BaseException = exc
+            except (OSError, WebSocketException) as exc:
+                failure = exc
+            except Exception as exc:
+                # The hooks failed for a reason reconnecting cannot fix.
+                self._reconnecting = None
+                self._shutdown(exc)
+                return
+            if self.max_attempts is not None and attempts >= self.max_attempts:
+                self._reconnecting = None
+                self._shutdown(failure)
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+        self._reconnecting = None
+        self._gate().set()
+        for pending in list(self._pending.values()):
+            if pending.sent and not pending.future.done():
+                try:
+                    await self._ws.send(pending.payload)
+                except ConnectionClosed:
+                    # The reader handles the loss of the new connection.
+                    break
+
+    def _shutdown(self, exc: BaseException) -> None:
+        """Fail every pending and future request, and end event iteration."""
+        self._error = exc
+        self._gate().set()
+        for pending in self._pending.values():
+            if pending.future.done():
+                continue
+            if isinstance(exc, asyncio.CancelledError):
+                pending.future.cancel()
+            else:
+                pending.future.set_exception(exc)
+        for queues in self._queues.values():
+            for queue in queues:
+                queue.close(exc)
@@ -1,6 +1,15 @@
+from typing import Any
+
+
 class APIError(Exception):
     """An error occured while interacting with the VTS API."""
 
+    @property
+    def error_id(self) -> Any:
+        """The `ErrorID` reported by VTS, or `None`."""
+        info = self.args[0] if self.args else None
+        return getattr(info, "error_id", None)
+
 
 class AuthenticationError(Exception):
     """An authentication error occured."""
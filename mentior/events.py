@@ -0,0 +1,103 @@
+"""Declares VTS events and the queues that deliver them to subscribers."""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Literal, Optional
+
+from pydantic import Field
+
+from .models.base import FromCamel
+
+EventName = Literal[
+    "TestEvent",
+    "ModelLoadedEvent",
+    "TrackingStatusChangedEvent",
+    "BackgroundChangedEvent",
+    "ModelConfigChangedEvent",
+    "ModelMovedEvent",
+    "ModelOutlineEvent",
+    "HotkeyTriggeredEvent",
+    "ModelAnimationEvent",
+    "ItemEvent",
+    "ModelClickedEvent",
+    "PostProcessingEvent",
+    "Live2DCubismEditorConnectedEvent",
+]
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+
+
+class Event(FromCamel):
+    """An event pushed by VTS to subscribed plugins."""
+
+    message_type: str
+    timestamp: int = 0
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class EventQueue:
+    """A bounded queue of events for a single subscriber.
+
+    When full, `overflow` decides what happens to a new event: `"drop_oldest"`
+    discards the oldest queued event, `"drop_newest"` discards the new one and
+    `"block"` makes the connection's reader wait for room, which holds back
+    every response and event on that connection until the subscriber catches
+    up.
+    """
+
+    def __init__(
+        self, maxsize: int = 64, overflow: OverflowPolicy = "drop_oldest"
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if overflow not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self._events: Deque[Event] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def full(self) -> bool:
+        return len(self._events) >= self.maxsize
+
+    async def put(self, event: Event) -> None:
+        """Queue an event, applying the overflow policy when full."""
+        if self.full():
+            if self.overflow == "drop_newest":
+                self.dropped += 1
+                return
+            if self.overflow == "drop_oldest":
+                self._events.popleft()
+                self.dropped += 1
+            else:
+                while self.full():
+                    if self._error is not None:
+                        return
+                    self._writable.clear()
+                    await self._writable.wait()
+        self._events.append(event)
+        self._readable.set()
+
+    def close(self, error: BaseException) -> None:
+        """Make `get` raise `error` once the queued events are consumed."""
+        self._error = error
+        self._readable.set()
+        self._writable.set()
+
+    async def get(self) -> Event:
+        """Wait for and remove the oldest queued event."""
+        while not self._events:
+            if self._error is not None:
+                raise self._error
+            self._readable.clear()
+            await self._readable.wait()
+        event = self._events.popleft()
+        self._writable.set()
+        return event
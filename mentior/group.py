@@ -0,0 +1,52 @@
+"""Drives several VTube Studio instances with the same calls."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Sequence
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+
+class ClientGroup:
+    """Runs each call on every client of the group at once.
+
+    Any coroutine method of `AuthenticatedClient` can be called on the group.
+    The requests to all instances are sent in the same pass of the event loop,
+    and the call returns a list holding, for each client in order, either its
+    result or the exception it raised.
+
+        async with mentior.authenticate_many(("127.0.0.1", "8001"), ...) as group:
+            results = await group.trigger_hotkey("wave")
+    """
+
+    def __init__(self, clients: Sequence["AuthenticatedClient"]) -> None:
+        self.clients = list(clients)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __getitem__(self, index: int) -> "AuthenticatedClient":
+        return self.clients[index]
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[List[Any]]]:
+        if name.startswith("_") or not self.clients:
+            raise AttributeError(name)
+        methods = [getattr(client, name) for client in self.clients]
+        if not asyncio.iscoroutinefunction(methods[0]):
+            raise AttributeError(f"{name!r} cannot be called on a group")
+
+        async def broadcast(*args: Any, **kwargs: Any) -> List[Any]:
+            return await asyncio.gather(
+                *(method(*args, **kwargs) for method in methods),
+                return_exceptions=True,
+            )
+
+        return broadcast
+
+    async def gather(
+        self, fn: Callable[["AuthenticatedClient"], Awaitable[Any]]
+    ) -> List[Any]:
+        """Run `fn` with every client at once, collecting results or errors."""
+        return await asyncio.gather(
+            *(fn(client) for client in self.clients), return_exceptions=True
+        )
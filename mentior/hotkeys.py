@@ -0,0 +1,190 @@
+"""Triggers hotkeys no faster than VTS accepts them."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from .background import BackgroundTask
+from .errors import APIError
+from .models.failure import ErrorID
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+_Key = Tuple[Optional[str], Optional[str]]
+
+
+class _Trigger:
+    __slots__ = ("future", "attempts")
+
+    def __init__(self, future: "asyncio.Future[None]") -> None:
+        self.future = future
+        self.attempts = 0
+
+
+class HotkeyScheduler:
+    """Queues hotkey triggers locally until VTS can execute them.
+
+    VTS rejects a hotkey triggered again within its `cooldown` of 5 seconds,
+    and any hotkey while its execution queue is full. Rather than sending
+    triggers that are bound to fail, the scheduler tracks the cooldown of
+    each hotkey and the number of triggers in flight, and sends each trigger
+    as soon as it is allowed.
+
+    At most `max_queued` triggers wait for each hotkey. Further triggers are
+    merged into the last waiting one, so a flood of triggers for the same
+    hotkey results in only a few requests. Triggers rejected for cooldown or
+    a full queue anyway, for example because the hotkey was also triggered
+    from elsewhere, are retried up to `max_retries` times.
+
+        async with vts.hotkey_scheduler() as hotkeys:
+            hotkeys.trigger(hotkey_id)
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        *,
+        cooldown: float = 5.0,
+        max_in_flight: int = 4,
+        max_queued: int = 1,
+        retry_delay: float = 0.25,
+        max_retries: int = 3,
+    ) -> None:
+        if max_in_flight < 1 or max_queued < 1:
+            raise ValueError("max_in_flight and max_queued must be positive")
+        self._client = client
+        self.cooldown = cooldown
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.retry_delay = retry_delay
+        self.max_retries = max_retries
+        self._queued: Dict[_Key, List[_Trigger]] = {}
+        # When each hotkey may be triggered again.
+        self._ready_at: Dict[_Key, float] = {}
+        self._in_flight: Set[_Key] = set()
+        self._paused_until = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task = BackgroundTask()
+
+    def trigger(
+        self,
+        hotkey_id: Optional[str] = None,
+        item_instance_id: Optional[str] = None,
+    ) -> "asyncio.Future[None]":
+        """Schedule a trigger of a hotkey.
+
+        Returns a future that resolves once VTS has accepted the trigger, or
+        raises the `APIError` it was finally rejected with. Merged triggers
+        share a future.
+        """
+        key = (hotkey_id, item_instance_id)
+        queued = self._queued.setdefault(key, [])
+        queued[:] = [entry for entry in queued if not entry.future.done()]
+        if len(queued) >= self.max_queued:
+            return queued[-1].future
+
+        future = asyncio.get_running_loop().create_future()
+        queued.append(_Trigger(future))
+        self._start()
+        self._wakeup.set()
+        return future
+
+    def pending(self, hotkey_id: Optional[str] = None) -> int:
+        """The number of waiting triggers, for one or all hotkeys."""
+        return sum(
+            sum(not entry.future.done() for entry in queued)
+            for key, queued in self._queued.items()
+            if hotkey_id is None or key[0] == hotkey_id
+        )
+
+    def cooldown_left(
+        self,
+        hotkey_id: Optional[str] = None,
+        item_instance_id: Optional[str] = None,
+    ) -> float:
+        """Seconds until the hotkey may be triggered again."""
+        ready_at = self._ready_at.get((hotkey_id, item_instance_id), 0.0)
+        return max(0.0, ready_at - time.monotonic())
+
+    def _start(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._task.start(self._run)
+
+    async def close(self) -> None:
+        """Stop sending, cancelling every waiting trigger."""
+        await self._task.stop()
+        for queued in self._queued.values():
+            for entry in queued:
+                entry.future.cancel()
+        self._queued.clear()
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            if self._paused_until > now:
+                next_at: Optional[float] = self._paused_until
+            else:
+                next_at = self._send_ready(now)
+            self._wakeup.clear()
+            timeout = None if next_at is None else next_at - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _send_ready(self, now: float) -> Optional[float]:
+        """Send every trigger that is allowed, returning when the next is."""
+        next_at = None
+        for key in list(self._queued):
+            if len(self._in_flight) >= self.max_in_flight:
+                break
+            queued = self._queued[key]
+            while queued and queued[0].future.done():
+                queued.pop(0)
+            if not queued:
+                del self._queued[key]
+                continue
+            if key in self._in_flight:
+                continue
+            ready_at = self._ready_at.get(key, 0.0)
+            if ready_at > now:
+                next_at = ready_at if next_at is None else min(next_at, ready_at)
+                continue
+            self._in_flight.add(key)
+            self._ready_at[key] = now + self.cooldown
+            asyncio.ensure_future(self._send(key, queued.pop(0)))
+        return next_at
+
+    async def _send(self, key: _Key, entry: _Trigger) -> None:
+        future = entry.future
+        try:
+            await self._client.trigger_hotkey(*key)
+        except APIError as exc:
+            entry.attempts += 1
+            retry = entry.attempts <= self.max_retries and not future.done()
+            if retry and exc.error_id == ErrorID.HotkeyCooldownNotOver:
+                self._ready_at[key] = time.monotonic() + self.cooldown
+                self._queued.setdefault(key, []).insert(0, entry)
+            elif retry and exc.error_id == ErrorID.HotkeyQueueFull:
+                self._paused_until = time.monotonic() + self.retry_delay
+                self._ready_at[key] = self._paused_until
+                self._queued.setdefault(key, []).insert(0, entry)
+            elif not future.done():
+                future.set_exception(exc)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(None)
+        finally:
+            self._in_flight.discard(key)
+            self._wakeup.set()
+
+    async def __aenter__(self) -> "HotkeyScheduler":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
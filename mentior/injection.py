@@ -0,0 +1,99 @@
+"""Streams tracking parameter values to VTS at a fixed rate."""
+
+import time
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Tuple
+
+from .background import BackgroundTask, ticks
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+
+class ParameterInjector:
+    """Coalesces parameter updates and flushes them once per tick.
+
+    Updates may be submitted at any rate through `set`; only the latest value
+    for each parameter is kept and sent in a single batched message per tick.
+    Parameters that have not been sent for `keep_alive` seconds are re-sent
+    with their last value, since VTS drops control of a parameter that goes
+    without data for about a second.
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        rate: float = 60.0,
+        *,
+        mode: Literal["set", "add"] = "set",
+        face_found: bool = False,
+        keep_alive: float = 0.8,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._client = client
+        self.interval = 1 / rate
+        self.mode = mode
+        self.face_found = face_found
+        self.keep_alive = keep_alive
+        # Latest (value, weight) for every parameter ever set.
+        self._values: Dict[str, Tuple[float, Optional[float]]] = {}
+        # Parameters updated since the last flush.
+        self._dirty: Dict[str, None] = {}
+        self._sent_at: Dict[str, float] = {}
+        self._task = BackgroundTask()
+
+    def set(
+        self, parameter_id: str, value: float, weight: Optional[float] = None
+    ) -> None:
+        """Queue a value for a parameter, replacing any unsent value."""
+        self._values[parameter_id] = (value, weight)
+        self._dirty[parameter_id] = None
+
+    def discard(self, parameter_id: str) -> None:
+        """Stop sending a parameter, releasing it after the VTS timeout."""
+        self._values.pop(parameter_id, None)
+        self._dirty.pop(parameter_id, None)
+        self._sent_at.pop(parameter_id, None)
+
+    async def flush(self) -> None:
+        """Send every updated or stale parameter in one message."""
+        now = time.monotonic()
+        due = dict(self._dirty)
+        for parameter_id, sent_at in self._sent_at.items():
+            if now - sent_at >= self.keep_alive:
+                due[parameter_id] = None
+        self._dirty.clear()
+        if not due:
+            return
+
+        values = {}
+        weights = {}
+        for parameter_id in due:
+            value, weight = self._values[parameter_id]
+            values[parameter_id] = value
+            if weight is not None:
+                weights[parameter_id] = weight
+            self._sent_at[parameter_id] = now
+
+        await self._client.inject_parameters(
+            values, weights=weights, face_found=self.face_found, mode=self.mode
+        )
+
+    def start(self) -> None:
+        """Start flushing in the background."""
+        self._task.start(self._run)
+
+    async def stop(self) -> None:
+        """Stop flushing. Re-raises the error that ended the stream, if any."""
+        await self._task.stop()
+
+    async def _run(self) -> None:
+        async for _ in ticks(lambda: self.interval):
+            await self.flush()
+
+    async def __aenter__(self) -> "ParameterInjector":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
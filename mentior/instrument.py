@@ -0,0 +1,200 @@
+"""Hooks into the request path, and a metrics collector built on them."""
+
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Union
+
+
+class RequestInfo:
+    """What is known about a request at each stage of its round trip.
+
+    Timestamps are `time.perf_counter` readings, which are monotonic. Those
+    of stages that have not been reached yet are `None`, as are the payload
+    and the response until they have been sent and received.
+    """
+
+    __slots__ = (
+        "message_type",
+        "request_id",
+        "payload",
+        "response",
+        "payload_size",
+        "response_size",
+        "started_at",
+        "serialized_at",
+        "sent_at",
+        "received_at",
+        "parsed_at",
+        "error",
+    )
+
+    def __init__(self, message_type: str) -> None:
+        self.message_type = message_type
+        self.request_id: Optional[str] = None
+        self.payload: Optional[Union[str, bytes]] = None
+        self.response: Optional[Union[str, bytes]] = None
+        self.payload_size = 0
+        self.response_size = 0
+        self.started_at = time.perf_counter()
+        self.serialized_at: Optional[float] = None
+        self.sent_at: Optional[float] = None
+        self.received_at: Optional[float] = None
+        self.parsed_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"RequestInfo({self.message_type!r}, {self.request_id!r})"
+
+
+class RequestHook:
+    """Base class for request hooks. Override any of the methods.
+
+    Hooks run synchronously on the request path, so they should be cheap.
+    """
+
+    def before_serialize(self, info: RequestInfo) -> None:
+        pass
+
+    def after_send(self, info: RequestInfo) -> None:
+        pass
+
+    def on_receive(self, info: RequestInfo) -> None:
+        pass
+
+    def after_parse(self, info: RequestInfo) -> None:
+        pass
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        pass
+
+
+def _bucket_bounds(low: float, high: float, per_octave: int) -> List[float]:
+    bounds = []
+    bound = low
+    while bound < high:
+        bounds.append(bound)
+        bound *= 2 ** (1 / per_octave)
+    return bounds
+
+
+class Histogram:
+    """Counts samples into logarithmic buckets.
+
+    The default buckets span 1 µs to about a minute with four buckets per
+    doubling, so percentiles are accurate to within about 19%.
+    """
+
+    _DEFAULT_BOUNDS = _bucket_bounds(1e-6, 60.0, 4)
+
+    def __init__(self, bounds: Optional[List[float]] = None) -> None:
+        self.bounds = bounds or self._DEFAULT_BOUNDS
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index >= len(self.bounds):
+                    return self.max
+                return min(self.bounds[index], self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class _TypeMetrics:
+    __slots__ = ("serialize", "round_trip", "parse", "total", "sizes", "errors")
+
+    def __init__(self) -> None:
+        self.serialize = Histogram()
+        self.round_trip = Histogram()
+        self.parse = Histogram()
+        self.total = Histogram()
+        self.sizes = Histogram(_bucket_bounds(16, 2**26, 1))
+        self.errors: Dict[str, int] = {}
+
+
+class MetricsCollector(RequestHook):
+    """Keeps latency histograms per message type, in seconds.
+
+    For each message type, records the time spent serializing, waiting for the
+    response, parsing it and in total, the payload sizes and the errors by
+    type.
+
+        metrics = MetricsCollector()
+        vts.add_hook(metrics)
+        ...
+        print(metrics.snapshot()["StatisticsRequest"]["round_trip"]["p99"])
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _TypeMetrics] = {}
+
+    def _for(self, message_type: str) -> _TypeMetrics:
+        metrics = self._metrics.get(message_type)
+        if metrics is None:
+            metrics = self._metrics[message_type] = _TypeMetrics()
+        return metrics
+
+    def after_send(self, info: RequestInfo) -> None:
+        metrics = self._for(info.message_type)
+        metrics.serialize.add(info.serialized_at - info.started_at)
+        metrics.sizes.add(info.payload_size)
+
+    def on_receive(self, info: RequestInfo) -> None:
+        self._for(info.message_type).round_trip.add(info.received_at - info.sent_at)
+
+    def after_parse(self, info: RequestInfo) -> None:
+        metrics = self._for(info.message_type)
+        metrics.parse.add(info.parsed_at - info.received_at)
+        metrics.total.add(info.parsed_at - info.started_at)
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        errors = self._for(info.message_type).errors
+        name = type(error).__name__
+        errors[name] = errors.get(name, 0) + 1
+
+    def reset(self) -> None:
+        self._metrics.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            message_type: {
+                "serialize": m.serialize.summary(),
+                "round_trip": m.round_trip.summary(),
+                "parse": m.parse.summary(),
+                "total": m.total.summary(),
+                "payload_bytes": m.sizes.summary(),
+                "errors": dict(m.errors),
+            }
+            for message_type, m in self._metrics.items()
+        }
@@ -1,24 +1,144 @@
-from contextlib import asynccontextmanager
-from typing import Optional
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional, Sequence, Tuple
 
 import websockets
 
-from .client import UnauthenticatedClient
+from .client import AuthenticatedClient, UnauthenticatedClient
+from .dispatch import Dispatcher
+from .errors import AuthenticationError
+from .group import ClientGroup
+from .tokens import FileTokenStore, TokenStore
+
+
+async def _authenticate(
+    client: UnauthenticatedClient,
+    token: Optional[str],
+    store: Optional[TokenStore],
+    key: str,
+) -> Tuple[AuthenticatedClient, str]:
+    """Authenticate with a given, stored or newly requested token.
+
+    A rejected stored token is replaced by a new one. Returns the client
+    together with the token that was accepted.
+    """
+    stored = token is None and store is not None
+    if stored:
+        token = store.load(key)
+    if token is not None:
+        try:
+            return await client.authenticate(token), token
+        except AuthenticationError:
+            if not stored:
+                raise
+            store.delete(key)
+
+    token = await client.request_auth_token()
+    if store is not None:
+        store.save(key, token)
+    return await client.authenticate(token), token
 
 
 @asynccontextmanager
-async def authenticate(host="127.0.0.1", port="8001", *, token: Optional[str] = None):
-    ws = await websockets.connect(f"ws://{host}:{port}")
+async def authenticate(
+    host="127.0.0.1",
+    port="8001",
+    *,
+    token: Optional[str] = None,
+    store: Optional[TokenStore] = FileTokenStore(),
+    reconnect: bool = False,
+    timeout: Optional[float] = 10.0,
+):
+    """Connect and authenticate with VTS, yielding an `AuthenticatedClient`.
+
+    Without a `token`, the one saved in `store` for this endpoint is used, and
+    a new one is only requested, and saved, if there is none or it is
+    rejected. Pass `store=None` to always request a new token.
+
+    Requests without a response within `timeout` seconds raise
+    `asyncio.TimeoutError`, except token requests, which wait for the user
+    to allow them. Pass `timeout=None` to wait for every response.
+
+    With `reconnect` enabled, a lost connection is reestablished and
+    authenticated again in the background, see `Dispatcher`, with the token
+    accepted last. If that was revoked in the meantime, the stored token is
+    tried next, and a new one is requested if that fails too.
+    """
+    url = f"ws://{host}:{port}"
+    ws = await websockets.connect(url)
+    dispatcher = Dispatcher(
+        ws, timeout, connect=(lambda: websockets.connect(url)) if reconnect else None
+    )
+    client = UnauthenticatedClient(ws, dispatcher=dispatcher)
     try:
-        yield await UnauthenticatedClient(ws).authenticate(token)
+        authenticated, token = await _authenticate(client, token, store, url)
+
+        async def reauthenticate():
+            nonlocal token
+            try:
+                await client.authenticate(token)
+                return
+            except AuthenticationError:
+                pass
+            # The token was revoked meanwhile, so try the stored one before
+            # requesting a new one.
+            _, token = await _authenticate(client, None, store, url)
+
+        dispatcher.add_reconnect_hook(reauthenticate)
+        yield authenticated
     finally:
-        await ws.close()
+        await client.close()
+
+
+@asynccontextmanager
+async def authenticate_many(
+    *endpoints: Tuple[str, str],
+    tokens: Optional[Sequence[Optional[str]]] = None,
+    timeout: Optional[float] = 10.0,
+    **kwargs,
+):
+    """Authenticate with several VTS instances, yielding a `ClientGroup`.
+
+    Endpoints are `(host, port)` pairs, with `tokens` matching them in order.
+    Connections are opened concurrently and all closed on exit, or as soon
+    as opening any of them fails. `timeout` and other keyword arguments are
+    passed on to `authenticate`.
+    """
+    if tokens is None:
+        tokens = [None] * len(endpoints)
+    elif len(tokens) != len(endpoints):
+        raise ValueError("expected one token per endpoint")
+
+    managers = [
+        authenticate(host, port, token=token, timeout=timeout, **kwargs)
+        for (host, port), token in zip(endpoints, tokens)
+    ]
+    async with AsyncExitStack() as stack:
+        entering = [asyncio.ensure_future(m.__aenter__()) for m in managers]
+        try:
+            if entering:
+                await asyncio.wait(entering, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Stop opening connections once one failed, also when cancelled
+            # meanwhile, and close those that were opened.
+            for task in entering:
+                task.cancel()
+            if entering:
+                await asyncio.wait(entering)
+            for manager, task in zip(managers, entering):
+                if not task.cancelled() and task.exception() is None:
+                    stack.push_async_exit(manager)
+        for task in entering:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        yield ClientGroup([task.result() for task in entering])
 
 
 @asynccontextmanager
 async def connect(host="127.0.0.1", port="8001"):
     ws = await websockets.connect(f"ws://{host}:{port}")
+    client = UnauthenticatedClient(ws)
     try:
-        yield UnauthenticatedClient(ws)
+        yield client
     finally:
-        await ws.close()
+        await client.close()
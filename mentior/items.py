@@ -0,0 +1,214 @@
+"""Moves many items at once, in as few requests as possible."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .background import BackgroundTask
+from .errors import APIError
+from .models.base import dump_trusted
+from .models.data import FadeMode, ItemMove, MovedItem
+from .models.failure import ErrorID, ErrorInfo
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+# The most items VTS moves in a single request.
+MAX_ITEMS_PER_MOVE = 64
+
+_Pending = Tuple[Dict[str, Any], "asyncio.Future[None]"]
+
+
+def _move_error(moved: MovedItem) -> APIError:
+    try:
+        error_id = ErrorID(moved.error_id)
+    except ValueError:
+        error_id = ErrorID.InternalServerError
+    message = f"could not move item {moved.item_instance_id}"
+    return APIError(ErrorInfo(errorID=error_id, message=message))
+
+
+class ItemMover:
+    """Collects item moves and sends them in bulk.
+
+    Moves made within `interval` seconds of each other, or within the same
+    event loop iteration by default, are packed into `ItemMoveRequest`s of
+    up to `max_per_request` items, which are sent concurrently. A move of an
+    item that is still waiting to be sent supersedes the waiting one: fields
+    it sets replace those of the earlier move, other fields are kept, and
+    both moves share a future.
+
+    The instance IDs of items in the scene are tracked locally, from items
+    loaded and unloaded through the mover and from `refresh`, so that moves
+    of unknown items are rejected without a round trip. Items VTS reports as
+    not found are forgotten.
+
+        async with vts.item_mover() as mover:
+            await mover.refresh()
+            for i, instance_id in enumerate(mover.instances):
+                mover.move(instance_id, 0.5, position_x=i / 20 - 1)
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        *,
+        interval: float = 0.0,
+        max_per_request: int = MAX_ITEMS_PER_MOVE,
+    ) -> None:
+        if not 0 < max_per_request <= MAX_ITEMS_PER_MOVE:
+            raise ValueError(
+                f"max_per_request must be within (0, {MAX_ITEMS_PER_MOVE}]"
+            )
+        self._client = client
+        self.interval = interval
+        self.max_per_request = max_per_request
+        # File name of each tracked item, by instance ID.
+        self.instances: Dict[str, str] = {}
+        self._pending: Dict[str, _Pending] = {}
+        self._task = BackgroundTask()
+        self._sent_at = 0.0
+
+    def track(self, instance_id: str, file_name: str = "") -> None:
+        """Allow moving an item that was loaded elsewhere."""
+        self.instances[instance_id] = file_name
+
+    def forget(self, instance_id: str) -> None:
+        self.instances.pop(instance_id, None)
+        pending = self._pending.pop(instance_id, None)
+        if pending is not None:
+            pending[1].cancel()
+
+    async def refresh(self) -> Dict[str, str]:
+        """Track exactly the items that are currently in the scene."""
+        items = await self._client.items()
+        self.instances = {
+            item.instance_id: item.file_name for item in items.item_instances_in_scene
+        }
+        for instance_id in [i for i in self._pending if i not in self.instances]:
+            self.forget(instance_id)
+        return self.instances
+
+    async def load(self, file_name: str, **kwargs: Any) -> str:
+        """Load an item and track it, see `AuthenticatedClient.load_item`."""
+        instance_id = await self._client.load_item(file_name, **kwargs)
+        self.instances[instance_id] = file_name
+        return instance_id
+
+    async def unload(self, *instance_ids: str) -> List[str]:
+        """Unload tracked items, returning the IDs of those VTS removed."""
+        unloaded = await self._client.unload_items(instance_ids)
+        for item in unloaded:
+            self.forget(item.instance_id)
+        return [item.instance_id for item in unloaded]
+
+    def move(
+        self,
+        instance_id: str,
+        time_in_seconds: float = 0.0,
+        *,
+        fade_mode: FadeMode = "linear",
+        position_x: Optional[float] = None,
+        position_y: Optional[float] = None,
+        size: Optional[float] = None,
+        rotation: Optional[float] = None,
+        order: Optional[int] = None,
+        flip: Optional[bool] = None,
+        user_can_stop: bool = True,
+    ) -> "asyncio.Future[None]":
+        """Schedule a move of an item.
+
+        Returns a future that resolves once VTS has moved the item, or raises
+        the `APIError` it was rejected with. Raises `KeyError` for items that
+        are not tracked. Fields left as `None` are not changed.
+        """
+        if instance_id not in self.instances:
+            raise KeyError(f"unknown item instance {instance_id!r}")
+        fields: Dict[str, Any] = {
+            "time_in_seconds": time_in_seconds,
+            "fade_mode": fade_mode,
+            "user_can_stop": user_can_stop,
+        }
+        for name, value in (
+            ("position_x", position_x),
+            ("position_y", position_y),
+            ("size", size),
+            ("rotation", rotation),
+            ("order", order),
+        ):
+            if value is not None:
+                fields[name] = value
+        if flip is not None:
+            fields.update(set_flip=True, flip=flip)
+
+        pending = self._pending.get(instance_id)
+        if pending is not None:
+            fields = {**pending[0], **fields}
+        if self._client.validate_requests:
+            ItemMove(item_instance_id=instance_id, **fields)
+        if pending is not None:
+            self._pending[instance_id] = (fields, pending[1])
+            return pending[1]
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[instance_id] = (fields, future)
+        self._task.start(self._run)
+        return future
+
+    def pending(self) -> int:
+        """The number of items with a move waiting to be sent."""
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """Send every waiting move now and wait for the results."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self._sent_at = time.monotonic()
+        entries = list(pending.items())
+        size = self.max_per_request
+        await asyncio.gather(
+            *(self._send(entries[i : i + size]) for i in range(0, len(entries), size))
+        )
+
+    async def close(self) -> None:
+        """Send the moves that are still waiting and stop."""
+        await self.flush()
+        await self._task.stop(cancel=False)
+
+    async def _run(self) -> None:
+        while self._pending:
+            # Let moves made in the same iteration, or interval, pile up.
+            delay = self._sent_at + self.interval - time.monotonic()
+            await asyncio.sleep(max(delay, 0.0))
+            await self.flush()
+
+    async def _send(self, entries: Sequence[Tuple[str, _Pending]]) -> None:
+        moves = [
+            dump_trusted(ItemMove, item_instance_id=instance_id, **fields)
+            for instance_id, (fields, _) in entries
+        ]
+        try:
+            results = await self._client.move_items(moves)
+        except Exception as exc:
+            for _, (_, future) in entries:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        outcomes = {moved.item_instance_id: moved for moved in results}
+        for instance_id, (_, future) in entries:
+            moved = outcomes.get(instance_id)
+            if moved is not None and not moved.success:
+                if moved.error_id == ErrorID.ItemMoveRequestInstanceIDNotFound.value:
+                    self.instances.pop(instance_id, None)
+                if not future.done():
+                    future.set_exception(_move_error(moved))
+            elif not future.done():
+                future.set_result(None)
+
+    async def __aenter__(self) -> "ItemMover":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,913 @@
+"""A local stand-in for the VTube Studio API, for tests and load runs."""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from uuid import uuid4
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from .models.failure import ErrorID
+
+EVENT_NAMES = frozenset(
+    {
+        "TestEvent",
+        "ModelLoadedEvent",
+        "TrackingStatusChangedEvent",
+        "BackgroundChangedEvent",
+        "ModelConfigChangedEvent",
+        "ModelMovedEvent",
+        "ModelOutlineEvent",
+        "HotkeyTriggeredEvent",
+        "ModelAnimationEvent",
+        "ItemEvent",
+        "ModelClickedEvent",
+        "PostProcessingEvent",
+        "Live2DCubismEditorConnectedEvent",
+    }
+)
+
+# Requests that can be made before authenticating.
+PUBLIC_REQUESTS = frozenset(
+    {"APIStateRequest", "AuthenticationTokenRequest", "AuthenticationRequest"}
+)
+
+
+# Default tracking parameters, as (name, min, max, default value).
+INPUT_PARAMETERS = (
+    ("FacePositionX", -15.0, 15.0, 0.0),
+    ("FacePositionY", -15.0, 15.0, 0.0),
+    ("FaceAngleX", -30.0, 30.0, 0.0),
+    ("FaceAngleY", -30.0, 30.0, 0.0),
+    ("FaceAngleZ", -90.0, 90.0, 0.0),
+    ("MouthSmile", 0.0, 1.0, 0.0),
+    ("MouthOpen", 0.0, 1.0, 0.0),
+    ("EyeOpenLeft", 0.0, 1.0, 1.0),
+    ("EyeOpenRight", 0.0, 1.0, 1.0),
+    ("BrowLeftY", 0.0, 1.0, 0.5),
+    ("BrowRightY", 0.0, 1.0, 0.5),
+)
+
+# Live2D parameters of every model, as (name, min, max, default value, input).
+_LIVE2D_PARAMETERS = (
+    ("ParamAngleX", -30.0, 30.0, 0.0, "FaceAngleX"),
+    ("ParamAngleY", -30.0, 30.0, 0.0, "FaceAngleY"),
+    ("ParamAngleZ", -30.0, 30.0, 0.0, "FaceAngleZ"),
+    ("ParamMouthForm", 0.0, 1.0, 0.0, "MouthSmile"),
+    ("ParamMouthOpenY", 0.0, 1.0, 0.0, "MouthOpen"),
+    ("ParamEyeLOpen", 0.0, 1.0, 1.0, "EyeOpenLeft"),
+    ("ParamEyeROpen", 0.0, 1.0, 1.0, "EyeOpenRight"),
+    ("ParamBrowLY", -1.0, 1.0, 0.0, "BrowLeftY"),
+    ("ParamBrowRY", -1.0, 1.0, 0.0, "BrowRightY"),
+)
+
+
+# Item files in the items folder, as (file name, type, frame count).
+ITEM_FILES = (
+    ("Hat.png", "PNG", 1),
+    ("Star.gif", "AnimatedGIF", 24),
+    ("Sparkles.gif", "AnimatedGIF", 60),
+    ("Glasses.jpg", "JPG", 1),
+)
+
+# The most items allowed in the scene at once.
+MAX_ITEMS = 128
+
+
+class MockError(Exception):
+    """Raised by handlers to respond with an API error."""
+
+    def __init__(self, error_id: ErrorID, message: str = "") -> None:
+        super().__init__(message or error_id.name)
+        self.error_id = error_id
+        self.message = message or error_id.name
+
+
+class _Session:
+    """State of a single client connection."""
+
+    def __init__(self, ws: Any) -> None:
+        self.ws = ws
+        self.authenticated = False
+        self.subscriptions: Dict[str, Dict[str, Any]] = {}
+
+
+def _model(index: int, art_meshes: int) -> Dict[str, Any]:
+    name = f"Model{index}"
+    return {
+        "modelID": uuid4().hex,
+        "modelName": name,
+        "vtsModelName": f"{name}.vtube.json",
+        "vtsModelIconName": f"{name}.png",
+        "live2DModelName": f"{name}.model3.json",
+        "hasPhysicsFile": True,
+        "live2DParameters": [
+            *_LIVE2D_PARAMETERS,
+            *(
+                (f"Param{i}", -1.0, 1.0, 0.0, None)
+                for i in range(40 - len(_LIVE2D_PARAMETERS))
+            ),
+        ],
+        "numberOfTextures": 2,
+        "textureResolution": 4096,
+        "artMeshNames": [f"ArtMesh{i}" for i in range(art_meshes)],
+        "artMeshTags": ["face", "hair", "body", "eyes", "mouth"],
+        "hotkeys": [
+            {
+                "name": f"Hotkey {i}",
+                "type": "ToggleExpression",
+                "description": "Toggles an expression",
+                "file": f"expression{i}.exp3.json",
+                "HotkeyID": uuid4().hex,
+                "keyCombination": [],
+                "onScreenButtonID": i + 1,
+            }
+            for i in range(8)
+        ],
+        "expressions": [
+            {
+                "name": f"Expression {i}",
+                "file": f"expression{i}.exp3.json",
+                "active": False,
+                "deactivateWhenKeyIsLetGo": False,
+                "autoDeactivateAfterSeconds": False,
+                "secondsRemaining": 0,
+                "usedInHotkeys": [],
+                "parameters": [{"name": "MouthSmile", "value": 1.0}],
+            }
+            for i in range(8)
+        ],
+    }
+
+
+class MockServer:
+    """A websocket server that answers like VTS.
+
+    Implements every request type of `types.RequestType` with plausible data
+    for a set of generated models. Responses are delayed by `latency` seconds,
+    either fixed or drawn uniformly from a `(low, high)` range. Errors can be
+    injected per request type with `fail` or at random with `error_rate`, and
+    events are sent to subscribed connections as the state changes or when
+    emitted with `emit`.
+
+    Cooldowns are disabled by default so that load runs are not throttled.
+
+        async with MockServer(latency=0.005) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                print(await vts.statistics())
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        error_rate: float = 0.0,
+        models: int = 3,
+        art_meshes: int = 100,
+        tokens: Optional[Set[str]] = None,
+        hotkey_cooldown: float = 0.0,
+        model_load_cooldown: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.hotkey_cooldown = hotkey_cooldown
+        self.model_load_cooldown = model_load_cooldown
+        self.tokens: Set[str] = set(tokens or ())
+        self.models = [_model(i, art_meshes) for i in range(models)]
+        self.current: Optional[Dict[str, Any]] = self.models[0] if self.models else None
+        self.loaded_at = time.monotonic()
+        self.position = {
+            "positionX": 0.0,
+            "positionY": 0.0,
+            "rotation": 0.0,
+            "size": 0.0,
+        }
+        self.parameters: Dict[str, float] = {}
+        # Items in the scene, by instance ID.
+        self.items: Dict[str, Dict[str, Any]] = {}
+        # Number of requests received per message type.
+        self.requests: Counter = Counter()
+        self.started_at = time.monotonic()
+        self._random = random.Random(seed)
+        self._failures: Dict[str, List[Tuple[ErrorID, str]]] = {}
+        self._hotkey_used: Dict[str, float] = {}
+        self._sessions: Dict[Any, _Session] = {}
+        self._server: Any = None
+        self._handlers: Dict[str, Callable[[_Session, Dict[str, Any]], Any]] = {
+            "APIStateRequest": self._api_state,
+            "AuthenticationTokenRequest": self._auth_token,
+            "AuthenticationRequest": self._authenticate,
+            "StatisticsRequest": self._statistics,
+            "VTSFolderInfoRequest": self._folder_info,
+            "CurrentModelRequest": self._current_model,
+            "AvailableModelsRequest": self._available_models,
+            "ModelLoadRequest": self._load_model,
+            "MoveModelRequest": self._move_model,
+            "HotkeysInCurrentModelRequest": self._hotkeys,
+            "HotkeyTriggerRequest": self._trigger_hotkey,
+            "ExpressionStateRequest": self._expression_state,
+            "ExpressionActivationRequest": self._activate_expression,
+            "ArtMeshListRequest": self._art_meshes,
+            "ColorTintRequest": self._tint,
+            "InjectParameterDataRequest": self._inject,
+            "EventSubscriptionRequest": self._subscribe,
+            "Live2DParameterListRequest": self._live2d_parameters,
+            "InputParameterListRequest": self._input_parameters,
+            "ParameterValueRequest": self._parameter_value,
+            "ItemListRequest": self._items,
+            "ItemLoadRequest": self._load_item,
+            "ItemUnloadRequest": self._unload_items,
+            "ItemAnimationControlRequest": self._animate_item,
+            "ItemMoveRequest": self._move_items,
+        }
+
+    async def start(self) -> None:
+        self._server = await websockets.serve(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def fail(
+        self,
+        message_type: str,
+        error_id: ErrorID,
+        times: int = 1,
+        message: str = "",
+    ) -> None:
+        """Answer the next `times` requests of a type with an error."""
+        self._failures.setdefault(message_type, []).extend(
+            [(error_id, message)] * times
+        )
+
+    async def emit(self, event_name: str, data: Optional[Dict[str, Any]] = None) -> int:
+        """Send an event to subscribed connections, returning how many."""
+        message = json.dumps(
+            {
+                "apiName": "VTubeStudioPublicAPI",
+                "apiVersion": "1.0",
+                "timestamp": int(time.time() * 1000),
+                "messageType": event_name,
+                "requestID": uuid4().hex,
+                "data": data or {},
+            }
+        )
+        sessions = [s for s in self._sessions.values() if event_name in s.subscriptions]
+        for session in sessions:
+            try:
+                await session.ws.send(message)
+            except ConnectionClosed:
+                pass
+        return len(sessions)
+
+    async def disconnect_all(self) -> None:
+        """Drop every connection, as if VTS were restarted."""
+        for session in list(self._sessions.values()):
+            await session.ws.close()
+
+    async def _serve(self, ws: Any, path: Optional[str] = None) -> None:
+        session = self._sessions[ws] = _Session(ws)
+        tasks: Set["asyncio.Task[None]"] = set()
+        try:
+            async for message in ws:
+                task = asyncio.ensure_future(self._respond(session, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except ConnectionClosed:
+            pass
+        finally:
+            del self._sessions[ws]
+            for task in tasks:
+                task.cancel()
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            return self._random.uniform(*self.latency)
+        return self.latency
+
+    async def _respond(self, session: _Session, message: Union[str, bytes]) -> None:
+        try:
+            request = json.loads(message)
+        except ValueError:
+            request = {}
+        message_type = request.get("messageType", "")
+        self.requests[message_type] += 1
+
+        try:
+            data = await self._handle(session, request, message_type)
+            response_type = message_type.replace("Request", "Response")
+        except MockError as exc:
+            data = {"errorID": exc.error_id.value, "message": exc.message}
+            response_type = "APIError"
+
+        delay = self._delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = {
+            "apiName": "VTubeStudioPublicAPI",
+            "apiVersion": "1.0",
+            "timestamp": int(time.time() * 1000),
+            "messageType": response_type,
+            "requestID": request.get("requestID", ""),
+            "data": data,
+        }
+        try:
+            await session.ws.send(json.dumps(response))
+        except ConnectionClosed:
+            pass
+
+    async def _handle(
+        self, session: _Session, request: Dict[str, Any], message_type: str
+    ) -> Dict[str, Any]:
+        if not message_type:
+            raise MockError(ErrorID.RequestTypeMissingOrEmpty)
+        handler = self._handlers.get(message_type)
+        if handler is None:
+            raise MockError(ErrorID.RequestTypeUnknown)
+        if message_type not in PUBLIC_REQUESTS and not session.authenticated:
+            raise MockError(ErrorID.RequestRequiresAuthetication)
+
+        failures = self._failures.get(message_type)
+        if failures:
+            raise MockError(*failures.pop(0))
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise MockError(ErrorID.InternalServerError, "injected error")
+
+        result = handler(session, request.get("data") or {})
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def _require_model(self, error_id: ErrorID) -> Dict[str, Any]:
+        if self.current is None:
+            raise MockError(error_id)
+        return self.current
+
+    def _api_state(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "active": True,
+            "vTubeStudioVersion": "1.28.0",
+            "currentSessionAuthenticated": session.authenticated,
+        }
+
+    def _auth_token(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data.get("pluginName"):
+            raise MockError(ErrorID.TokenRequestPluginNameInvalid)
+        if not data.get("pluginDeveloper"):
+            raise MockError(ErrorID.TokenRequestDeveloperNameInvalid)
+        token = uuid4().hex
+        self.tokens.add(token)
+        return {"authenticationToken": token}
+
+    def _authenticate(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data.get("authenticationToken"):
+            raise MockError(ErrorID.AuthenticationTokenMissing)
+        session.authenticated = data["authenticationToken"] in self.tokens
+        return {
+            "authenticated": session.authenticated,
+            "reason": "Token valid." if session.authenticated else "Token invalid.",
+        }
+
+    def _statistics(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "uptime": int((time.monotonic() - self.started_at) * 1000),
+            "framerate": 60,
+            "vTubeStudioVersion": "1.28.0",
+            "allowedPlugins": 50,
+            "connectedPlugins": len(self._sessions),
+            "startedWithSteam": True,
+            "windowWidth": 1920,
+            "windowHeight": 1080,
+            "windowIsFullscreen": False,
+        }
+
+    def _folder_info(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "models": "Live2DModels",
+            "backgrounds": "Backgrounds",
+            "items": "Items",
+            "config": "Config",
+            "logs": "Logs",
+            "backup": "Backup",
+        }
+
+    def _model_info(self, model: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "modelLoaded": model is self.current,
+            "modelName": model["modelName"],
+            "modelID": model["modelID"],
+            "vtsModelName": model["vtsModelName"],
+            "vtsModelIconName": model["vtsModelIconName"],
+        }
+
+    def _current_model(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        model = self.current
+        if model is None:
+            return {
+                "modelLoaded": False,
+                "modelName": "",
+                "modelID": "",
+                "vtsModelName": "",
+                "vtsModelIconName": "",
+                "live2DModelName": "",
+                "modelLoadTime": 0,
+                "timeSinceModelLoaded": 0,
+                "numberOfLive2DParameters": 0,
+                "numberOfLive2DArtmeshes": 0,
+                "hasPhysicsFile": False,
+                "numberOfTextures": 0,
+                "textureResolution": 0,
+                "modelPosition": dict(self.position),
+            }
+        return {
+            **self._model_info(model),
+            "live2DModelName": model["live2DModelName"],
+            "modelLoadTime": 500,
+            "timeSinceModelLoaded": int((time.monotonic() - self.loaded_at) * 1000),
+            "numberOfLive2DParameters": len(model["live2DParameters"]),
+            "numberOfLive2DArtmeshes": len(model["artMeshNames"]),
+            "hasPhysicsFile": model["hasPhysicsFile"],
+            "numberOfTextures": model["numberOfTextures"],
+            "textureResolution": model["textureResolution"],
+            "modelPosition": dict(self.position),
+        }
+
+    def _available_models(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "numberOfModels": len(self.models),
+            "availableModels": [self._model_info(m) for m in self.models],
+        }
+
+    async def _load_model(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        model_id = data.get("modelID")
+        if not model_id:
+            raise MockError(ErrorID.ModelIDMissing)
+        model = next((m for m in self.models if m["modelID"] == model_id), None)
+        if model is None:
+            raise MockError(ErrorID.ModelIDNotFound)
+        if time.monotonic() - self.loaded_at < self.model_load_cooldown:
+            raise MockError(ErrorID.ModelLoadCooldownNotOver)
+
+        self.current = model
+        self.loaded_at = time.monotonic()
+        await self.emit(
+            "ModelLoadedEvent",
+            {
+                "modelLoaded": True,
+                "modelName": model["modelName"],
+                "modelID": model["modelID"],
+            },
+        )
+        return {"modelID": model_id}
+
+    async def _move_model(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        self._require_model(ErrorID.MoveModelRequestNoModelLoaded)
+        if "timeInSeconds" not in data or "valuesAreRelativeToModel" not in data:
+            raise MockError(ErrorID.MoveModelRequestMissingFields)
+        relative = data["valuesAreRelativeToModel"]
+        for key in self.position:
+            if data.get(key) is not None:
+                base = self.position[key] if relative else 0.0
+                self.position[key] = base + data[key]
+        await self.emit(
+            "ModelMovedEvent",
+            {
+                "modelID": self.current["modelID"],
+                "modelName": self.current["modelName"],
+                "modelPosition": dict(self.position),
+            },
+        )
+        return {}
+
+    def _hotkeys(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        model = self.current
+        if data.get("modelID"):
+            model = next(
+                (m for m in self.models if m["modelID"] == data["modelID"]), None
+            )
+            if model is None:
+                raise MockError(ErrorID.ModelIDNotFound)
+        if model is None:
+            return {
+                "modelLoaded": False,
+                "modelName": "",
+                "modelID": "",
+                "availableHotkeys": [],
+            }
+        return {
+            "modelLoaded": model is self.current,
+            "modelName": model["modelName"],
+            "modelID": model["modelID"],
+            "availableHotkeys": model["hotkeys"],
+        }
+
+    async def _trigger_hotkey(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        model = self._require_model(ErrorID.HotkeyExecutionFailedBecauseNoModelLoaded)
+        hotkey_id = data.get("hotkeyID")
+        hotkey = next(
+            (h for h in model["hotkeys"] if hotkey_id in (h["HotkeyID"], h["name"])),
+            None,
+        )
+        if hotkey is None:
+            raise MockError(ErrorID.HotkeyIDNotFoundInModel)
+
+        now = time.monotonic()
+        used = self._hotkey_used.get(hotkey["HotkeyID"])
+        if used is not None and now - used < self.hotkey_cooldown:
+            raise MockError(ErrorID.HotkeyCooldownNotOver)
+        self._hotkey_used[hotkey["HotkeyID"]] = now
+
+        await self.emit(
+            "HotkeyTriggeredEvent",
+            {
+                "hotkeyID": hotkey["HotkeyID"],
+                "hotkeyName": hotkey["name"],
+                "hotkeyAction": hotkey["type"],
+                "hotkeyFile": hotkey["file"],
+                "hotkeyTriggeredByAPI": True,
+                "modelID": model["modelID"],
+                "modelName": model["modelName"],
+                "isLive2DItem": False,
+            },
+        )
+        return {"HotkeyID": hotkey["HotkeyID"]}
+
+    def _find_expression(
+        self, data: Dict[str, Any], error_id: ErrorID
+    ) -> Dict[str, Any]:
+        file = data.get("expressionFile")
+        expression = next(
+            (e for e in self.current["expressions"] if e["file"] == file), None
+        )
+        if expression is None:
+            raise MockError(error_id)
+        return expression
+
+    def _expression_state(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        model = self.current
+        if model is None:
+            return {
+                "modelLoaded": False,
+                "modelName": "",
+                "modelID": "",
+                "expressions": [],
+            }
+        expressions = model["expressions"]
+        if data.get("expressionFile"):
+            expressions = [
+                self._find_expression(data, ErrorID.ExpressionStateRequestFileNotFound)
+            ]
+        if not data.get("details", True):
+            expressions = [
+                {**e, "usedInHotkeys": [], "parameters": []} for e in expressions
+            ]
+        return {
+            "modelLoaded": True,
+            "modelName": model["modelName"],
+            "modelID": model["modelID"],
+            "expressions": expressions,
+        }
+
+    def _activate_expression(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        self._require_model(ErrorID.ExpressionActivationRequestNoModelLoaded)
+        expression = self._find_expression(
+            data, ErrorID.ExpressionActivationRequestFileNotFound
+        )
+        expression["active"] = bool(data.get("active", True))
+        return {}
+
+    def _art_meshes(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        model = self.current
+        names = model["artMeshNames"] if model else []
+        tags = model["artMeshTags"] if model else []
+        return {
+            "modelLoaded": model is not None,
+            "numberOfArtMeshNames": len(names),
+            "numberOfArtMeshTags": len(tags),
+            "artMeshNames": names,
+            "artMeshTags": tags,
+        }
+
+    def _tint(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        model = self._require_model(ErrorID.ColorTintRequestNoModelLoaded)
+        tint = data.get("colorTint")
+        matcher = data.get("artMeshMatcher")
+        if tint is None or matcher is None:
+            raise MockError(ErrorID.ColorTintRequestMatchOrColorMissing)
+        for key in ("colorR", "colorG", "colorB", "colorA"):
+            if not 0 <= tint.get(key, 255) <= 255:
+                raise MockError(ErrorID.ColorTintRequestInvalidColorValue)
+
+        names = model["artMeshNames"]
+        if matcher.get("tintAll"):
+            return {"matchedArtMeshes": len(names)}
+        numbers = set(matcher.get("artMeshNumber") or ())
+        exact = set(matcher.get("nameExact") or ())
+        contains = matcher.get("nameContains") or ()
+        matched = sum(
+            1
+            for i, name in enumerate(names)
+            if i in numbers or name in exact or any(c in name for c in contains)
+        )
+        return {"matchedArtMeshes": matched}
+
+    def _inject(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        values = data.get("parameterValues")
+        if not values:
+            raise MockError(ErrorID.InjectDataNoDataProvided)
+        if data.get("mode", "set") not in ("set", "add"):
+            raise MockError(ErrorID.InjectDataModeUnknown)
+        for value in values:
+            if not isinstance(value.get("value"), (int, float)):
+                raise MockError(ErrorID.InjectDataValueInvalid)
+            if data.get("mode") == "add":
+                self.parameters[value["id"]] = (
+                    self.parameters.get(value["id"], 0.0) + value["value"]
+                )
+            else:
+                self.parameters[value["id"]] = value["value"]
+        return {}
+
+    def _subscribe(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        event_name = data.get("eventName")
+        if event_name not in EVENT_NAMES:
+            raise MockError(ErrorID.EventSubscriptionRequestEventTypeUnknown)
+        if data.get("subscribe", True):
+            session.subscriptions[event_name] = data.get("config") or {}
+        else:
+            session.subscriptions.pop(event_name, None)
+        return {
+            "subscribedEventCount": len(session.subscriptions),
+            "subscribedEvents": list(session.subscriptions),
+        }
+
+    def _input_parameter(self, name: str) -> Optional[Dict[str, Any]]:
+        for parameter, low, high, default in INPUT_PARAMETERS:
+            if parameter == name:
+                return {
+                    "name": name,
+                    "addedBy": "VTube Studio",
+                    "value": self.parameters.get(name, default),
+                    "min": low,
+                    "max": high,
+                    "defaultValue": default,
+                }
+        return None
+
+    def _model_parameters(self) -> Dict[str, Any]:
+        model = self.current
+        if model is None:
+            return {"modelLoaded": False, "modelName": "", "modelID": ""}
+        return {
+            "modelLoaded": True,
+            "modelName": model["modelName"],
+            "modelID": model["modelID"],
+        }
+
+    def _live2d_parameters(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        parameters = []
+        model = self.current
+        for name, low, high, default, source in (
+            model["live2DParameters"] if model else ()
+        ):
+            value = self.parameters.get(source, default) if source else default
+            parameters.append(
+                {
+                    "name": name,
+                    "value": min(max(value, low), high),
+                    "min": low,
+                    "max": high,
+                    "defaultValue": default,
+                }
+            )
+        return {**self._model_parameters(), "parameters": parameters}
+
+    def _input_parameters(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            **self._model_parameters(),
+            "customParameters": [],
+            "defaultParameters": [
+                self._input_parameter(name) for name, *_ in INPUT_PARAMETERS
+            ],
+        }
+
+    def _parameter_value(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        parameter = self._input_parameter(data.get("name", ""))
+        if parameter is None:
+            raise MockError(ErrorID.ParameterValueRequestParameterNotFound)
+        return parameter
+
+    def _items(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        instances = [
+            item
+            for item in self.items.values()
+            if data.get("onlyItemsWithFileName") in (None, "", item["fileName"])
+            and data.get("onlyItemsWithInstanceID") in (None, "", item["instanceID"])
+        ]
+        taken = {item["order"] for item in self.items.values()}
+        return {
+            "itemsInSceneCount": len(self.items),
+            "totalItemsAllowedCount": MAX_ITEMS,
+            "canLoadItemsRightNow": len(self.items) < MAX_ITEMS,
+            "availableSpots": (
+                [order for order in range(-30, 31) if order not in taken]
+                if data.get("includeAvailableSpots")
+                else []
+            ),
+            "itemInstancesInScene": (
+                [dict(item) for item in instances]
+                if data.get("includeItemInstancesInScene")
+                else []
+            ),
+            "availableItemFiles": (
+                [
+                    {
+                        "fileName": name,
+                        "type": type_,
+                        "loadedCount": sum(
+                            item["fileName"] == name for item in self.items.values()
+                        ),
+                    }
+                    for name, type_, _ in ITEM_FILES
+                ]
+                if data.get("includeAvailableItemFiles")
+                else []
+            ),
+        }
+
+    async def _load_item(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        file_name = data.get("fileName")
+        if not file_name:
+            raise MockError(ErrorID.ItemFileNameMissing)
+        file = next((f for f in ITEM_FILES if f[0] == file_name), None)
+        if file is None:
+            raise MockError(ErrorID.ItemFileNameNotFound)
+        if len(self.items) >= MAX_ITEMS:
+            raise MockError(ErrorID.CannotLoadItemSceneFull)
+        taken = {item["order"] for item in self.items.values()}
+        order = data.get("order")
+        if order is None:
+            order = next(o for o in range(1, MAX_ITEMS + 2) if o not in taken)
+        elif order in taken:
+            if data.get("failIfOrderTaken"):
+                raise MockError(ErrorID.ItemOrderAlreadyTaken)
+            order = next(
+                o for o in range(order, order + MAX_ITEMS + 1) if o not in taken
+            )
+
+        instance_id = uuid4().hex
+        self.items[instance_id] = {
+            "fileName": file_name,
+            "instanceID": instance_id,
+            "order": order,
+            "type": file[1],
+            "censored": bool(data.get("censored")),
+            "flipped": bool(data.get("flipped")),
+            "locked": bool(data.get("locked")),
+            "smoothing": data.get("smoothing", 0.0),
+            "framerate": 15.0 if file[2] > 1 else 0.0,
+            "frameCount": file[2],
+            "currentFrame": 0,
+            "pinnedToModel": False,
+            "pinnedModelID": "",
+            "pinnedArtMeshID": "",
+            "groupName": "",
+            "sceneName": "",
+            "fromWorkshop": False,
+            "positionX": data.get("positionX", 0.0),
+            "positionY": data.get("positionY", 0.5),
+            "size": data.get("size", 0.32),
+            "rotation": data.get("rotation", 0.0),
+        }
+        await self._item_event("Added", self.items[instance_id])
+        return {"instanceID": instance_id, "fileName": file_name}
+
+    async def _item_event(self, event_type: str, item: Dict[str, Any]) -> None:
+        await self.emit(
+            "ItemEvent",
+            {
+                "itemEventType": event_type,
+                "itemInstanceID": item["instanceID"],
+                "itemFileName": item["fileName"],
+                "itemPosition": {"x": item["positionX"], "y": item["positionY"]},
+            },
+        )
+
+    async def _unload_items(
+        self, session: _Session, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if data.get("unloadAllInScene") or data.get("unloadAllLoadedByThisPlugin"):
+            unload = list(self.items)
+        else:
+            ids = set(data.get("instanceIDs") or ())
+            names = set(data.get("fileNames") or ())
+            unload = [
+                instance_id
+                for instance_id, item in self.items.items()
+                if instance_id in ids or item["fileName"] in names
+            ]
+        unloaded = []
+        for instance_id in unload:
+            item = self.items.pop(instance_id)
+            unloaded.append({"instanceID": instance_id, "fileName": item["fileName"]})
+            await self._item_event("Removed", item)
+        return {"unloadedItems": unloaded}
+
+    def _animate_item(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        item = self.items.get(data.get("itemInstanceID", ""))
+        if item is None:
+            raise MockError(ErrorID.ItemAnimationControlInstanceIDNotFound)
+        animates = (
+            any(data.get(key) is not None for key in ("framerate", "frame"))
+            or data.get("setAutoStopFrames")
+            or data.get("setAnimationPlayState")
+        )
+        if animates and item["frameCount"] <= 1:
+            raise MockError(ErrorID.ItemAnimationControlSimpleImageDoesNotSupportAnim)
+        frames = data.get("autoStopFrames") or []
+        if data.get("setAutoStopFrames"):
+            if len(frames) > 1024:
+                raise MockError(ErrorID.ItemAnimationControlTooManyAutoStopFrames)
+            if any(not 0 <= f < item["frameCount"] for f in frames):
+                raise MockError(ErrorID.ItemAnimationControlAutoStopFramesInvalid)
+        if data.get("framerate") is not None:
+            item["framerate"] = data["framerate"]
+        if data.get("frame") is not None:
+            item["currentFrame"] = min(data["frame"], item["frameCount"] - 1)
+        if data.get("setAnimationPlayState"):
+            item["playing"] = bool(data.get("animationPlayState"))
+        return {
+            "frame": item["currentFrame"],
+            "animationPlaying": item.get("playing", item["frameCount"] > 1),
+        }
+
+    def _move_items(self, session: _Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        moved = []
+        for move in data.get("itemsToMove") or ():
+            instance_id = move.get("itemInstanceID", "")
+            item = self.items.get(instance_id)
+            error_id = -1
+            if item is None:
+                error_id = ErrorID.ItemMoveRequestInstanceIDNotFound.value
+            elif move.get("fadeMode", "linear") not in (
+                "linear",
+                "easeIn",
+                "easeOut",
+                "easeBoth",
+                "overshoot",
+                "zip",
+            ):
+                error_id = ErrorID.ItemMoveRequestInvalidFadeMode.value
+            else:
+                for key in ("positionX", "positionY", "size", "rotation", "order"):
+                    if move.get(key) is not None:
+                        item[key] = move[key]
+                if move.get("setFlip"):
+                    item["flipped"] = bool(move.get("flip"))
+            moved.append(
+                {
+                    "itemInstanceID": instance_id,
+                    "success": error_id == -1,
+                    "errorID": error_id,
+                }
+            )
+        return {"movedItems": moved}
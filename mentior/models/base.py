@@ -1,19 +1,37 @@
 """Declares the classes necessary for interacting with the API."""
 
+import itertools
+from functools import lru_cache
 from typing import (
     Any,
+    ClassVar,
     Dict,
     Generic,
+    List,
     Literal,
     Optional,
+    Tuple,
+    Type,
     TypeVar,
     Union,
+    get_args,
+    get_origin,
 )
-from uuid import UUID, uuid4
+from uuid import uuid4
 
-from pydantic import AliasGenerator, BaseModel, ConfigDict
+from pydantic import (
+    AliasGenerator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    model_serializer,
+)
 from pydantic.alias_generators import to_camel
+from pydantic_core import PydanticUndefined, from_json, to_json
 
+from .compact import decoder as compact_decoder
 from .failure import ErrorInfo
 from ..errors import APIError
 
@@ -28,6 +46,7 @@ class ToCamel(BaseModel):
     model_config = ConfigDict(
         alias_generator=AliasGenerator(serialization_alias=to_camel),
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
@@ -37,17 +56,50 @@ class FromCamel(BaseModel):
     model_config = ConfigDict(
         alias_generator=AliasGenerator(validation_alias=to_camel),
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
+class CamelData(BaseModel):
+    """Utility class for data sent in requests.
+
+    Fields are serialized into camelcase and can be populated by either name.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+        protected_namespaces=(),
+        defer_build=True,
+    )
+
+
+# IDs only need to be unique per connection, so a per-process random prefix
+# and a counter are used, which is several times cheaper than `uuid4`.
+_ID_PREFIX = uuid4().hex[:12]
+_ID_COUNTER = itertools.count()
+
+
+def new_request_id() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER)}"
+
+
 class Metadata(BaseModel):
     """Metadata included in every message."""
 
     api_name: str = "VTubeStudioPublicAPI"
     api_version: str = "1.0"
-    request_id: UUID = uuid4()
+    # A fresh ID per message lets responses be matched to their requests.
+    request_id: str = Field(
+        default_factory=new_request_id,
+        serialization_alias="requestID",
+        validation_alias="requestID",
+    )
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class Request(Metadata, ToCamel, Generic[MessageT, DataT]):
@@ -81,5 +133,212 @@ class Response(Metadata, FromCamel, Generic[MessageT, DataT]):
             raise APIError(self.data)
 
     @classmethod
-    def parse(cls, src: Union[str, bytes]) -> DataT:
-        return cls.model_validate_json(src).unwrap()
+    def parse(
+        cls, src: Union[str, bytes], lazy: bool = False, compact: bool = False
+    ) -> DataT:
+        """Returns the data of a response. Raises `APIError` on failure.
+
+        With `lazy` enabled, the `lazy_fields` of the data model are decoded
+        item by item on access instead of up front. With `compact` enabled,
+        the data is returned as an unvalidated read-only record with the same
+        attribute names, see `compact.decoder`.
+        """
+        return _decoder(cls).decode(src, lazy, compact)
+
+
+@lru_cache(maxsize=None)
+def _serialized_fields(model: type) -> Tuple[Tuple[str, str, Any], ...]:
+    """Lists the name, serialized name and default of each field of a model."""
+    return tuple(
+        (name, field.serialization_alias or name, field.default)
+        for name, field in model.model_fields.items()
+    )
+
+
+def dump_trusted(model: type, **fields: Any) -> Dict[str, Any]:
+    """Builds the serialized form of `model` from trusted values.
+
+    Skips validation and model construction entirely, producing the same data
+    as dumping a validated instance by alias with `exclude_none`.
+    """
+    data = {}
+    for name, alias, default in _serialized_fields(model):
+        value = fields.get(name, default)
+        if value is not None and value is not PydanticUndefined:
+            data[alias] = value
+    return data
+
+
+@lru_cache(maxsize=None)
+def _envelope(message_type: str) -> Tuple[str, str]:
+    """Precompiles the JSON surrounding the request ID of a message type."""
+    marker = new_request_id()
+    head = Request(message_type=message_type, data=None, requestID=marker)
+    payload = head.model_dump_json(by_alias=True, exclude_none=True)
+    prefix, suffix = payload.split(marker)
+    # Leave the closing brace off so that the data field can be appended.
+    return prefix, suffix[:-1]
+
+
+def encode_request(
+    message_type: str,
+    data: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+    request_id: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Serializes a request without building a `Request` model.
+
+    Produces the same JSON as dumping a `Request` by alias with `exclude_none`
+    by splicing the ID and data into a cached envelope for the message type.
+    Returns the request ID together with the payload.
+    """
+    if request_id is None:
+        request_id = new_request_id()
+    prefix, suffix = _envelope(message_type)
+    if data is None:
+        return request_id, f"{prefix}{request_id}{suffix}}}"
+    # Like a model field, `exclude_none` only applies to nested models here.
+    body = to_json(data, by_alias=True, exclude_none=True).decode()
+    return request_id, f'{prefix}{request_id}{suffix},"data":{body}}}'
+
+
+class LazyList(list):
+    """A list that validates each item the first time it is read.
+
+    Every item is validated at once when the list is compared with another,
+    and before the model holding it is serialized. Not meant to be modified.
+    """
+
+    __slots__ = ("_adapter", "_decoded", "_pending")
+
+    def __init__(self, items: List[Any], adapter: TypeAdapter) -> None:
+        super().__init__(items)
+        self._adapter = adapter
+        self._decoded = [False] * len(items)
+        self._pending = len(items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = list.__getitem__(self, index)
+        if not self._decoded[index]:
+            item = self._adapter.validate_python(item)
+            list.__setitem__(self, index, item)
+            self._decoded[index] = True
+            self._pending -= 1
+        return item
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __reversed__(self):
+        return (self[i] for i in reversed(range(len(self))))
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item is value or item == value for item in self)
+
+    def decode_all(self) -> None:
+        """Validate every item not read yet."""
+        if self._pending:
+            for _ in self:
+                pass
+
+    def __eq__(self, other: Any) -> bool:
+        self.decode_all()
+        if isinstance(other, LazyList):
+            other.decode_all()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        self.decode_all()
+        if isinstance(other, LazyList):
+            other.decode_all()
+        return list.__ne__(self, other)
+
+    def __repr__(self) -> str:
+        return f"LazyList({len(self)} items)"
+
+
+class LazyFields(FromCamel):
+    """Utility class for data models with `lazy_fields`.
+
+    Decodes the items of lazily decoded fields before the model is dumped.
+    """
+
+    lazy_fields: ClassVar[Tuple[str, ...]] = ()
+
+    # Without a return annotation, the JSON schema is still that of the model.
+    @model_serializer(mode="wrap")
+    def _decode_lazy_fields(self, handler: SerializerFunctionWrapHandler):
+        for name in self.lazy_fields:
+            value = self.__dict__.get(name)
+            if isinstance(value, LazyList):
+                value.decode_all()
+        return handler(self)
+
+
+def _list_item_type(annotation: Any) -> Any:
+    """Returns the item type of a `List` annotation, which may be `Optional`."""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    (item,) = get_args(annotation)
+    return item
+
+
+class _Decoder:
+    """Decodes the responses of one parametrized `Response` class.
+
+    Parses the JSON once, then validates only the branch selected by the
+    message type, which avoids trying the data model and `ErrorInfo` in turn.
+    """
+
+    def __init__(self, response: Type[Response]) -> None:
+        message_type, self.data_model = response.__pydantic_generic_metadata__["args"]
+        (self.message_type,) = get_args(message_type)
+        self.response = response
+        # Validation alias, field name and item adapter of every lazy field.
+        self.lazy_fields = [
+            (
+                field.validation_alias or name,
+                name,
+                TypeAdapter(_list_item_type(field.annotation)),
+            )
+            for name, field in self.data_model.model_fields.items()
+            if name in getattr(self.data_model, "lazy_fields", ())
+        ]
+
+    def decode(
+        self, src: Union[str, bytes], lazy: bool = False, compact: bool = False
+    ) -> Any:
+        try:
+            raw = from_json(src)
+            message_type = raw["messageType"]
+            data = raw["data"]
+        except (ValueError, TypeError, KeyError):
+            message_type = None
+
+        if message_type == self.message_type:
+            if compact:
+                return compact_decoder(self.data_model)(data)
+            if lazy and self.lazy_fields:
+                return self._decode_lazy(data)
+            return self.data_model.model_validate(data)
+        if message_type == "APIError":
+            raise APIError(ErrorInfo.model_validate(data))
+        # Let the full model report whatever is wrong with the response.
+        return self.response.model_validate_json(src).unwrap()
+
+    def _decode_lazy(self, data: Dict[str, Any]) -> Any:
+        deferred = {}
+        for alias, name, adapter in self.lazy_fields:
+            items = data.get(alias)
+            if isinstance(items, list):
+                deferred[name] = LazyList(items, adapter)
+                data[alias] = []
+        model = self.data_model.model_validate(data)
+        model.__dict__.update(deferred)
+        return model
+
+
+@lru_cache(maxsize=None)
+def _decoder(response: Type[Response]) -> _Decoder:
+    return _Decoder(response)
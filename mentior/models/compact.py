@@ -0,0 +1,75 @@
+"""Compact read-only records, decoded from trusted response data."""
+
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+Converter = Callable[[Any], Any]
+
+
+@lru_cache(maxsize=None)
+def record_type(model: Type[BaseModel]) -> Type[tuple]:
+    """A named tuple with the same field names as `model`."""
+    return namedtuple(f"{model.__name__}Record", list(model.model_fields))
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _converter(annotation: Any) -> Optional[Converter]:
+    """Converts raw values of a field, or `None` to keep them as they are."""
+    annotation = _strip_optional(annotation)
+    if _is_model(annotation):
+        return decoder(annotation)
+    if get_origin(annotation) in (list, List):
+        (item,) = get_args(annotation) or (Any,)
+        item = _strip_optional(item)
+        if _is_model(item):
+            decode = decoder(item)
+            return lambda items: tuple(map(decode, items))
+        if item is float:
+            return lambda items: array("d", items)
+        return tuple
+    return None
+
+
+@lru_cache(maxsize=None)
+def decoder(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], tuple]:
+    """A function building a record of `model` from its raw JSON object.
+
+    Fields are looked up by their validation alias, without validation.
+    Nested models become records, lists become tuples, and lists of floats
+    become `array("d")`. Missing fields take their default, or `None`.
+    """
+    record = record_type(model)
+    fields: List[Tuple[str, Any, Optional[Converter]]] = []
+    for name, field in model.model_fields.items():
+        default = None if field.default is PydanticUndefined else field.default
+        fields.append(
+            (field.validation_alias or name, default, _converter(field.annotation))
+        )
+
+    def decode(data: Dict[str, Any]) -> tuple:
+        values = []
+        for alias, default, convert in fields:
+            value = data.get(alias, default)
+            if convert is not None and value is not None:
+                value = convert(value)
+            values.append(value)
+        return record(*values)
+
+    return decode
@@ -1,11 +1,11 @@
-from typing import List, Optional
+from typing import ClassVar, List, Literal, Optional, Tuple
 from pydantic import BaseModel, ConfigDict, Field
 
-from .base import FromCamel
+from .base import CamelData, FromCamel, LazyFields
 
 
 class Empty(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class Status(FromCamel):
@@ -19,6 +19,8 @@ class AuthToken(FromCamel):
 
 
 class AuthStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     authenticated: bool
     reason: str
 
@@ -36,6 +38,8 @@ class Statistics(FromCamel):
 
 
 class VTSFolderInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     models: str
     backgrounds: str
     items: str
@@ -55,10 +59,12 @@ class VTSModel(ModelID):
     vts_model_icon_name: str
 
 
-class AvailableModels(FromCamel):
+class AvailableModels(LazyFields):
     number_of_models: int
     available_models: Optional[List[VTSModel]]
 
+    lazy_fields: ClassVar[Tuple[str, ...]] = ("available_models",)
+
 
 class Position(FromCamel):
     position_x: Optional[float] = Field(ge=-1, le=1)
@@ -82,6 +88,8 @@ class CurrentModel(VTSModel):
 
 
 class MoveModel(Position):
+    model_config = CamelData.model_config
+
     position_z: Optional[float] = Field(ge=-1, le=1)
     time_in_seconds: float = Field(ge=0, le=2)
     values_are_relative_to_model: bool
@@ -100,18 +108,24 @@ class Hotkey(HotkeyID):
     on_screen_button_id: int = Field(validation_alias="onScreenButtonID")
 
 
-class Hotkeys(ModelID):
+class Hotkeys(ModelID, LazyFields):
     model_loaded: bool
     model_name: str
     available_hotkeys: List[Hotkey]
 
+    lazy_fields: ClassVar[Tuple[str, ...]] = ("available_hotkeys",)
+
 
 class HotkeyInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     id: str
 
 
 class ExpressionParam(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     value: float
 
@@ -127,21 +141,57 @@ class Expression(FromCamel):
     parameters: List[ExpressionParam]
 
 
-class ExpressionState(ModelID):
+class ExpressionState(ModelID, LazyFields):
     model_loaded: bool
     model_name: str
     expressions: List[Expression]
 
+    lazy_fields: ClassVar[Tuple[str, ...]] = ("expressions",)
 
-class ArtMeshes(FromCamel):
+
+class ArtMeshes(LazyFields):
     model_loaded: bool
     number_of_art_mesh_names: int
     number_of_art_mesh_tags: int
     art_mesh_names: List[str]
     art_mesh_tags: List[str]
 
+    lazy_fields: ClassVar[Tuple[str, ...]] = ("art_mesh_names", "art_mesh_tags")
+
 
-class ColorTint(FromCamel):
+class Live2DParameter(FromCamel):
+    name: str
+    value: float
+    min: float
+    max: float
+    default_value: float
+
+
+class Live2DParameters(ModelID, LazyFields):
+    model_loaded: bool
+    model_name: str
+    parameters: List[Live2DParameter]
+
+    lazy_fields: ClassVar[Tuple[str, ...]] = ("parameters",)
+
+
+class InputParameter(Live2DParameter):
+    added_by: str
+
+
+class InputParameters(ModelID, LazyFields):
+    model_loaded: bool
+    model_name: str
+    custom_parameters: List[InputParameter]
+    default_parameters: List[InputParameter]
+
+    lazy_fields: ClassVar[Tuple[str, ...]] = (
+        "custom_parameters",
+        "default_parameters",
+    )
+
+
+class ColorTint(CamelData):
     color_r: int = Field(default=255, ge=0, le=255)
     color_g: int = Field(default=255, ge=0, le=255)
     color_b: int = Field(default=255, ge=0, le=255)
@@ -149,7 +199,7 @@ class ColorTint(FromCamel):
     mix_with_scene_lighting_color: float = Field(default=1, ge=0, le=1)
 
 
-class ArtMeshMatcher(FromCamel):
+class ArtMeshMatcher(CamelData):
     tint_all: bool = False
     art_mesh_number: Optional[List[int]] = None
     name_exact: Optional[List[str]] = None
@@ -158,10 +208,124 @@ class ArtMeshMatcher(FromCamel):
     tag_contains: Optional[List[str]] = None
 
 
-class ArtmeshTint(FromCamel):
+class ArtmeshTint(CamelData):
     color_tint: ColorTint
     art_mesh_matcher: ArtMeshMatcher
 
 
 class TintedArtMeshes(FromCamel):
     matched_art_meshes: int
+
+
+class EventSubscription(FromCamel):
+    subscribed_event_count: int
+    subscribed_events: List[str]
+
+
+class ItemInstance(FromCamel):
+    file_name: str
+    instance_id: str = Field(validation_alias="instanceID")
+    order: int
+    type_: str = Field(validation_alias="type")
+    censored: bool
+    flipped: bool
+    locked: bool
+    smoothing: float
+    framerate: float
+    frame_count: int
+    current_frame: int
+    pinned_to_model: bool
+    pinned_model_id: str = Field(validation_alias="pinnedModelID")
+    pinned_art_mesh_id: str = Field(validation_alias="pinnedArtMeshID")
+    group_name: str
+    scene_name: str
+    from_workshop: bool
+
+
+class ItemFile(FromCamel):
+    file_name: str
+    type_: str = Field(validation_alias="type")
+    loaded_count: int
+
+
+class Items(LazyFields):
+    items_in_scene_count: int
+    total_items_allowed_count: int
+    can_load_items_right_now: bool
+    available_spots: List[int]
+    item_instances_in_scene: List[ItemInstance]
+    available_item_files: List[ItemFile]
+
+    lazy_fields: ClassVar[Tuple[str, ...]] = (
+        "item_instances_in_scene",
+        "available_item_files",
+    )
+
+
+class ItemLoad(CamelData):
+    file_name: str
+    position_x: Optional[float] = Field(default=None, ge=-1000, le=1000)
+    position_y: Optional[float] = Field(default=None, ge=-1000, le=1000)
+    size: Optional[float] = Field(default=None, ge=0, le=1)
+    rotation: Optional[float] = Field(default=None, ge=-360, le=360)
+    fade_time: Optional[float] = Field(default=None, ge=0, le=2)
+    order: Optional[int] = Field(default=None, ge=-1000, le=1000)
+    fail_if_order_taken: bool = False
+    smoothing: Optional[float] = Field(default=None, ge=0, le=1)
+    censored: bool = False
+    flipped: bool = False
+    locked: bool = False
+    unload_when_plugin_disconnects: bool = True
+
+
+class LoadedItem(FromCamel):
+    instance_id: str = Field(validation_alias="instanceID")
+    file_name: str
+
+
+class UnloadedItems(FromCamel):
+    unloaded_items: List[LoadedItem]
+
+
+class ItemAnimationControl(CamelData):
+    item_instance_id: str = Field(alias="itemInstanceID")
+    framerate: Optional[float] = Field(default=None, ge=0.1, le=120)
+    frame: Optional[int] = Field(default=None, ge=0)
+    brightness: Optional[float] = Field(default=None, ge=0, le=1)
+    opacity: Optional[float] = Field(default=None, ge=0, le=1)
+    set_auto_stop_frames: bool = False
+    auto_stop_frames: Optional[List[int]] = None
+    set_animation_play_state: bool = False
+    animation_play_state: Optional[bool] = None
+
+
+class ItemAnimation(FromCamel):
+    frame: int
+    animation_playing: bool
+
+
+FadeMode = Literal["linear", "easeIn", "easeOut", "easeBoth", "overshoot", "zip"]
+
+
+class ItemMove(CamelData):
+    item_instance_id: str = Field(alias="itemInstanceID")
+    time_in_seconds: float = Field(default=0, ge=0, le=30)
+    fade_mode: FadeMode = "linear"
+    position_x: Optional[float] = Field(default=None, ge=-1000, le=1000)
+    position_y: Optional[float] = Field(default=None, ge=-1000, le=1000)
+    size: Optional[float] = Field(default=None, ge=0, le=1)
+    rotation: Optional[float] = Field(default=None, ge=-360, le=360)
+    order: Optional[int] = Field(default=None, ge=-1000, le=1000)
+    set_flip: bool = False
+    flip: bool = False
+    user_can_stop: bool = True
+
+
+class MovedItem(FromCamel):
+    item_instance_id: str = Field(validation_alias="itemInstanceID")
+    success: bool
+    error_id: int = Field(validation_alias="errorID")
+
+
+class MovedItems(FromCamel):
+    moved_items: List[MovedItem]
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ErrorID(Enum):
@@ -232,5 +232,7 @@ class ErrorID(Enum):
 class ErrorInfo(BaseModel):
     """Error information in a response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     error_id: ErrorID = Field(..., validation_alias="errorID")
     message: str
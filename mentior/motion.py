@@ -0,0 +1,175 @@
+"""Moves the model along keyframed paths of any length."""
+
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from .background import BackgroundTask
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+# The longest move VTS accepts, in seconds.
+MAX_MOVE_TIME = 2.0
+
+_FIELDS = ("position_x", "position_y", "rotation", "size")
+
+
+class MoveKeyframe(NamedTuple):
+    """Where the model should be `time` seconds into a path.
+
+    Fields left as `None` are not moved by this keyframe.
+    """
+
+    time: float
+    position_x: Optional[float] = None
+    position_y: Optional[float] = None
+    rotation: Optional[float] = None
+    size: Optional[float] = None
+
+
+class MoveSegment(NamedTuple):
+    """A single move, starting `start` seconds into a path."""
+
+    start: float
+    duration: float
+    values: Dict[str, float]
+
+
+def _targets(keyframe: MoveKeyframe) -> Dict[str, float]:
+    return {
+        field: getattr(keyframe, field)
+        for field in _FIELDS
+        if getattr(keyframe, field) is not None
+    }
+
+
+def plan_path(
+    keyframes: Sequence[MoveKeyframe],
+    max_segment: float = MAX_MOVE_TIME,
+    start: Optional[Mapping[str, float]] = None,
+) -> List[MoveSegment]:
+    """Split a path into moves of at most `max_segment` seconds.
+
+    The path starts at time 0 from `start`, the values of the fields at that
+    time. Long stretches between keyframes are split into equal moves towards
+    linearly interpolated positions. A field without a start value or an
+    earlier keyframe to interpolate from is moved in the last of those moves
+    only, and moves that would leave every field as is are left out.
+    """
+    if not 0 < max_segment <= MAX_MOVE_TIME:
+        raise ValueError(f"max_segment must be within (0, {MAX_MOVE_TIME}]")
+    segments = []
+    last: Dict[str, float] = dict(start or {})
+    previous = 0.0
+    for keyframe in sorted(keyframes, key=lambda keyframe: keyframe.time):
+        target = _targets(keyframe)
+        span = keyframe.time - previous
+        if span < 0:
+            raise ValueError("keyframe times must not be negative")
+        count = max(1, math.ceil(span / max_segment - 1e-9))
+        for i in range(1, count + 1):
+            fraction = i / count
+            values = {}
+            for field, value in target.items():
+                if field in last:
+                    values[field] = last[field] + (value - last[field]) * fraction
+                elif i == count:
+                    values[field] = value
+            if values:
+                segments.append(
+                    MoveSegment(previous + span * (i - 1) / count, span / count, values)
+                )
+        last.update(target)
+        previous = keyframe.time
+    return segments
+
+
+class MotionScheduler:
+    """Plays keyframed paths with `move_model`, one path at a time.
+
+    Every move is sent at its planned time on a monotonic clock, `lead`
+    seconds early to make up for the time it takes to reach VTS, without
+    waiting for the response to the previous move. Timing therefore does not
+    drift with round trip times.
+
+    Playing a new path cancels the current one. VTS starts each move from
+    wherever the model is, so a path whose first keyframe is not at time 0
+    takes over smoothly. When a field is not set at time 0, the path first
+    reads the position of the model to interpolate from, and starts once it
+    is known.
+
+        motion = vts.motion_scheduler()
+        await motion.play(
+            [MoveKeyframe(1, position_x=-0.5), MoveKeyframe(6, position_x=0.5)]
+        )
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        *,
+        lead: float = 0.0,
+        max_segment: float = MAX_MOVE_TIME,
+    ) -> None:
+        self._client = client
+        self.lead = lead
+        self.max_segment = max_segment
+        self._task = BackgroundTask()
+
+    @property
+    def playing(self) -> bool:
+        return self._task.running
+
+    def play(self, keyframes: Sequence[MoveKeyframe]) -> "asyncio.Task[None]":
+        """Start playing a path, cancelling the current one.
+
+        Returns a task that completes when the path ends, or raises the error
+        of the first move that failed.
+        """
+        segments = plan_path(keyframes, self.max_segment)
+        moved = set().union(*(_targets(keyframe) for keyframe in keyframes))
+        at_start = set().union(
+            *(_targets(keyframe) for keyframe in keyframes if keyframe.time == 0)
+        )
+        if moved - at_start:
+            return self._task.restart(lambda: self._run_from_model(keyframes))
+        return self._task.restart(lambda: self._run(segments))
+
+    async def cancel(self) -> None:
+        """Stop sending moves. The move in progress in VTS completes."""
+        await self._task.stop()
+
+    async def _run_from_model(self, keyframes: Sequence[MoveKeyframe]) -> None:
+        position = (await self._client.current_model()).model_position
+        start = {
+            field: getattr(position, field)
+            for field in _FIELDS
+            if getattr(position, field) is not None
+        }
+        await self._run(plan_path(keyframes, self.max_segment, start))
+
+    async def _run(self, segments: List[MoveSegment]) -> None:
+        start = time.monotonic()
+        moves: List["asyncio.Future[None]"] = []
+        try:
+            for segment in segments:
+                delay = start + segment.start - self.lead - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                for move in moves:
+                    if move.done():
+                        move.result()
+                moves.append(
+                    asyncio.ensure_future(
+                        self._client.move_model(segment.duration, **segment.values)
+                    )
+                )
+            await asyncio.gather(*moves)
+            if segments:
+                end = start + segments[-1].start + segments[-1].duration
+                await asyncio.sleep(max(0.0, end - time.monotonic()))
+        finally:
+            for move in moves:
+                move.cancel()
@@ -0,0 +1,88 @@
+"""Mirrors model parameter values as a stream of changes."""
+
+from array import array
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Literal, Tuple
+
+from .background import ticks
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+
+class ParameterPoller:
+    """Polls parameter values and reports only those that changed.
+
+    Each poll reads every parameter in one request: the Live2D parameters of
+    the current model, or the default and custom tracking parameters when
+    `source` is `"input"`. Values are kept in an `array("d")`, and a value is
+    reported when it moved more than `threshold` away from the value last
+    reported, so slow drifts are reported too. When the parameters change,
+    for example because another model was loaded, every value is reported.
+
+    Polling is cheaper with `compact_responses` enabled on the client.
+
+        async for changes in vts.parameter_poller(rate=30):
+            print(changes)  # {"ParamAngleX": 12.5}
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        rate: float = 10.0,
+        *,
+        threshold: float = 1e-3,
+        source: Literal["live2d", "input"] = "live2d",
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if source not in ("live2d", "input"):
+            raise ValueError("source must be 'live2d' or 'input'")
+        self._client = client
+        self.interval = 1 / rate
+        self.threshold = threshold
+        self.source = source
+        self.names: Tuple[str, ...] = ()
+        # Latest polled and last reported value of each parameter in `names`.
+        self.values = array("d")
+        self._reported = array("d")
+
+    async def _read(self) -> Tuple[Tuple[str, ...], array]:
+        if self.source == "live2d":
+            parameters = (await self._client.live2d_parameters()).parameters
+        else:
+            data = await self._client.input_parameters()
+            parameters = [*data.default_parameters, *data.custom_parameters]
+        names = tuple(p.name for p in parameters)
+        return names, array("d", (p.value for p in parameters))
+
+    async def poll(self) -> Dict[str, float]:
+        """Read every parameter once, returning those that changed."""
+        names, values = await self._read()
+        self.values = values
+        if names != self.names:
+            self.names = names
+            self._reported = array("d", values)
+            return dict(zip(names, values))
+
+        changes = {}
+        reported = self._reported
+        threshold = self.threshold
+        for i, value in enumerate(values):
+            if abs(value - reported[i]) > threshold:
+                reported[i] = value
+                changes[names[i]] = value
+        return changes
+
+    def snapshot(self) -> Dict[str, float]:
+        """The latest polled value of every parameter."""
+        return dict(zip(self.names, self.values))
+
+    async def changes(self) -> AsyncIterator[Dict[str, float]]:
+        """Poll at the configured rate, yielding every non-empty change set."""
+        async for _ in ticks(lambda: self.interval):
+            changes = await self.poll()
+            if changes:
+                yield changes
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, float]]:
+        return self.changes()
@@ -0,0 +1,259 @@
+"""Records sessions to a binary log and replays them against a server."""
+
+import asyncio
+import mmap
+import struct
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
+
+from pydantic_core import from_json
+
+from .instrument import Histogram, RequestHook, RequestInfo
+
+if TYPE_CHECKING:
+    from .client import Client
+
+_MAGIC = b"MTRC"
+_VERSION = 1
+# Magic, version, and the wall clock time at which recording started.
+_HEADER = struct.Struct("<4sHxxd")
+# Kind, message type length, request ID length, flags, seconds since the
+# start of the recording and message length.
+_RECORD = struct.Struct("<BBBBdI")
+
+REQUEST = 1
+RESPONSE = 2
+ERROR = 3
+
+# The message was binary rather than text.
+_BINARY = 1
+
+# Requests that only make sense on the connection they were made on.
+_SKIPPED = frozenset({"AuthenticationTokenRequest", "AuthenticationRequest"})
+
+
+class LogRecord(NamedTuple):
+    """A message in a session log.
+
+    `message` is the request or response as sent, or a description of the
+    error for requests that failed without a response.
+    """
+
+    kind: int
+    time: float
+    message_type: str
+    request_id: str
+    message: Union[str, bytes]
+
+
+class SessionRecorder(RequestHook):
+    """Appends every request and response to a binary log.
+
+    Add the recorder to a client with `add_hook`. Each request is written
+    when it has been sent and each response when it has been received, with
+    the seconds since recording started by the monotonic clock. Records go
+    through a write buffer of `buffer_size` bytes, so the file is only
+    written to once the buffer fills up, and nothing is kept in memory.
+
+        with SessionRecorder("session.mtrc") as recorder:
+            vts.add_hook(recorder)
+            ...
+            vts.remove_hook(recorder)
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16) -> None:
+        self.path = path
+        self._file = open(path, "wb", buffering=buffer_size)
+        self._start = time.perf_counter()
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, time.time()))
+        self.records = 0
+
+    def _write(
+        self, kind: int, at: float, info: RequestInfo, message: Union[str, bytes]
+    ) -> None:
+        if self._file.closed:
+            return
+        flags = 0
+        if isinstance(message, str):
+            message = message.encode()
+        else:
+            flags = _BINARY
+        message_type = info.message_type.encode()
+        request_id = (info.request_id or "").encode()
+        self._file.write(
+            _RECORD.pack(
+                kind,
+                len(message_type),
+                len(request_id),
+                flags,
+                at - self._start,
+                len(message),
+            )
+        )
+        self._file.write(message_type)
+        self._file.write(request_id)
+        self._file.write(message)
+        self.records += 1
+
+    def after_send(self, info: RequestInfo) -> None:
+        self._write(REQUEST, info.sent_at, info, info.payload)
+
+    def on_receive(self, info: RequestInfo) -> None:
+        self._write(RESPONSE, info.received_at, info, info.response)
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        # Errors reported by VTS are already in the log as responses.
+        if info.response is None:
+            self._write(ERROR, time.perf_counter(), info, repr(error))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SessionLog:
+    """Reads a session log through a memory map.
+
+    Records are decoded one at a time as they are iterated, and the pages
+    of the file are loaded and evicted by the OS as needed, so logs of any
+    length can be read.
+
+        with SessionLog("session.mtrc") as log:
+            for record in log.requests():
+                print(record.time, record.message_type)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{path!r} is not a session log")
+        magic, version, self.started_at = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path!r} is not a session log")
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        data = self._map
+        offset = _HEADER.size
+        end = len(data)
+        while offset + _RECORD.size <= end:
+            kind, type_size, id_size, flags, at, size = _RECORD.unpack_from(
+                data, offset
+            )
+            offset += _RECORD.size
+            if offset + type_size + id_size + size > end:
+                # A record cut short, as the last one of an interrupted session.
+                return
+            message_type = data[offset : offset + type_size].decode()
+            offset += type_size
+            request_id = data[offset : offset + id_size].decode()
+            offset += id_size
+            message: Union[str, bytes] = data[offset : offset + size]
+            offset += size
+            if not flags & _BINARY:
+                message = message.decode()
+            yield LogRecord(kind, at, message_type, request_id, message)
+
+    def requests(self) -> Iterator[LogRecord]:
+        return (record for record in self if record.kind == REQUEST)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "SessionLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+async def replay(
+    client: "Client",
+    path: str,
+    *,
+    speed: Optional[float] = 1.0,
+    max_in_flight: int = 64,
+) -> Dict[str, Any]:
+    """Send the requests of a session log again, through `client`.
+
+    Requests are sent `speed` times as fast as they were recorded, or as
+    fast as possible when `speed` is `None`, with at most `max_in_flight`
+    awaiting their responses. A request that is due while that many are in
+    flight is sent late rather than skipped. Timing starts from the first
+    request in the log. Authentication requests are not replayed, since the
+    client is already authenticated.
+
+    Requests go through the request path of the client, so its hooks, such
+    as a `MetricsCollector`, see them as usual. Returns the number of
+    requests sent and failed, the time taken, and how late requests were
+    sent relative to their schedule, in seconds.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be positive")
+    slots = asyncio.Semaphore(max_in_flight)
+    tasks: Set["asyncio.Task[None]"] = set()
+    lag = Histogram()
+    errors: Dict[str, int] = {}
+    sent = 0
+
+    async def send(message_type: Any, data: Optional[Dict[str, Any]]) -> None:
+        try:
+            await client._request(message_type, data)
+        except Exception as exc:
+            name = type(exc).__name__
+            errors[name] = errors.get(name, 0) + 1
+        finally:
+            slots.release()
+
+    start = time.monotonic()
+    first: Optional[float] = None
+    with SessionLog(path) as log:
+        for record in log.requests():
+            if record.message_type in _SKIPPED:
+                continue
+            if first is None:
+                first = record.time
+            if speed is not None:
+                due = start + (record.time - first) / speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await slots.acquire()
+            if speed is not None:
+                lag.add(max(time.monotonic() - due, 0.0))
+            data = from_json(record.message).get("data")
+            task = asyncio.ensure_future(send(record.message_type, data))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+        if tasks:
+            await asyncio.gather(*list(tasks))
+
+    results: Dict[str, Any] = {
+        "requests": sent,
+        "errors": errors,
+        "duration": time.monotonic() - start,
+    }
+    if speed is not None:
+        results["lag"] = lag.summary()
+    return results
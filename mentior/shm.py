@@ -0,0 +1,316 @@
+"""Collects parameter values from other processes through shared memory."""
+
+import math
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .background import BackgroundTask, ticks
+
+if TYPE_CHECKING:
+    from .injection import ParameterInjector
+
+_MAGIC = b"MTPR"
+_VERSION = 1
+# Magic, version, capacity, record size, parameter count, names size.
+_HEADER = struct.Struct("<4sIIIII")
+# Counters, each on its own 8 byte word: next record to write, next record
+# to read and records dropped because the ring was full.
+_HEAD = 32
+_TAIL = 40
+_DROPPED = 48
+_NAMES = 64
+_COUNTER = struct.Struct("<Q")
+# Parameter index, padding, value and weight, which is NaN when unset.
+_RECORD = struct.Struct("<IIdd")
+
+# Before Python 3.13, every process that opens a segment registers it with
+# its resource tracker, which unlinks it when the process exits, and a
+# tracker shared by several processes keeps a single registration per name.
+_TRACK_ARGUMENT = sys.version_info >= (3, 13)
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    """Keep the resource tracker from unlinking a segment on exit.
+
+    Rings are unlinked by the process that created them when it closes
+    them, so that worker processes, whether started by `multiprocessing` or
+    not, can attach and exit without removing the ring.
+    """
+    if not _TRACK_ARGUMENT and os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+
+class ParameterRing:
+    """A single-producer, single-consumer ring of parameter values.
+
+    The ring is created with a fixed list of parameters, which writers refer
+    to by name or index, and opened in another process by its `name`. Each
+    worker process should write to a ring of its own. Records are published
+    by advancing an aligned 8 byte counter after they are written, so no lock
+    is needed. When the ring is full, new records are dropped and counted
+    rather than overwriting ones the reader has not seen.
+
+        ring = ParameterRing.create(["FaceAngleX", "MouthOpen"])
+        # In the worker, given ring.name:
+        ring = ParameterRing.attach(name)
+        ring.write_many({"FaceAngleX": 12.0, "MouthOpen": 0.4})
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+        magic, version, capacity, record_size, count, names_size = _HEADER.unpack_from(
+            self._buf, 0
+        )
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            raise ValueError(f"{shm.name!r} is not a parameter ring")
+        self.capacity = capacity
+        names = bytes(self._buf[_NAMES : _NAMES + names_size]).decode()
+        self.parameters: Tuple[str, ...] = tuple(names.split("\n")) if count else ()
+        self._indices = {name: i for i, name in enumerate(self.parameters)}
+        self._records = _NAMES + (names_size + 7) // 8 * 8
+
+    @classmethod
+    def create(
+        cls,
+        parameters: Sequence[str],
+        capacity: int = 4096,
+        name: Optional[str] = None,
+    ) -> "ParameterRing":
+        """Create a ring, to be closed and unlinked by the caller.
+
+        Before Python 3.13, the ring is only removed by `close`, and outlives
+        a process that exits without closing it.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if any("\n" in parameter for parameter in parameters):
+            raise ValueError("parameter names must not contain newlines")
+        names = "\n".join(parameters).encode()
+        records = _NAMES + (len(names) + 7) // 8 * 8
+        shm = shared_memory.SharedMemory(
+            name, create=True, size=records + capacity * _RECORD.size
+        )
+        _HEADER.pack_into(
+            shm.buf,
+            0,
+            _MAGIC,
+            _VERSION,
+            capacity,
+            _RECORD.size,
+            len(parameters),
+            len(names),
+        )
+        for offset in (_HEAD, _TAIL, _DROPPED):
+            _COUNTER.pack_into(shm.buf, offset, 0)
+        shm.buf[_NAMES : _NAMES + len(names)] = names
+        _untrack(shm)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "ParameterRing":
+        """Open a ring created by another process."""
+        if _TRACK_ARGUMENT:
+            return cls(shared_memory.SharedMemory(name, track=False))
+        shm = shared_memory.SharedMemory(name)
+        _untrack(shm)
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def dropped(self) -> int:
+        """The number of records dropped because the ring was full."""
+        return _COUNTER.unpack_from(self._buf, _DROPPED)[0]
+
+    def __len__(self) -> int:
+        """The number of records waiting to be read."""
+        head = _COUNTER.unpack_from(self._buf, _HEAD)[0]
+        return head - _COUNTER.unpack_from(self._buf, _TAIL)[0]
+
+    def index(self, parameter: Union[str, int]) -> int:
+        if isinstance(parameter, int):
+            if not 0 <= parameter < len(self.parameters):
+                raise IndexError(parameter)
+            return parameter
+        return self._indices[parameter]
+
+    def write(
+        self,
+        parameter: Union[str, int],
+        value: float,
+        weight: Optional[float] = None,
+    ) -> bool:
+        """Write a value, returning `False` if it was dropped."""
+        return self.write_many({parameter: value}, {parameter: weight}) == 1
+
+    def write_many(
+        self,
+        values: Mapping[Union[str, int], float],
+        weights: Optional[Mapping[Union[str, int], Optional[float]]] = None,
+    ) -> int:
+        """Write several values at once, returning how many fit."""
+        buf = self._buf
+        head = _COUNTER.unpack_from(buf, _HEAD)[0]
+        free = self.capacity - (head - _COUNTER.unpack_from(buf, _TAIL)[0])
+        written = 0
+        for parameter, value in values.items():
+            if written == free:
+                break
+            weight = weights.get(parameter) if weights else None
+            _RECORD.pack_into(
+                buf,
+                self._records + (head + written) % self.capacity * _RECORD.size,
+                self.index(parameter),
+                0,
+                value,
+                math.nan if weight is None else weight,
+            )
+            written += 1
+        # Publish the records only once they are complete.
+        _COUNTER.pack_into(buf, _HEAD, head + written)
+        if written < len(values):
+            dropped = _COUNTER.unpack_from(buf, _DROPPED)[0]
+            _COUNTER.pack_into(buf, _DROPPED, dropped + len(values) - written)
+        return written
+
+    def read(self) -> Iterator[Tuple[str, float, Optional[float]]]:
+        """Consume every waiting record as `(parameter, value, weight)`."""
+        buf = self._buf
+        head = _COUNTER.unpack_from(buf, _HEAD)[0]
+        tail = _COUNTER.unpack_from(buf, _TAIL)[0]
+        if head == tail:
+            return iter(())
+        records: List[Tuple[str, float, Optional[float]]] = []
+        start = tail % self.capacity
+        end = start + (head - tail)
+        for first, last in ((start, min(end, self.capacity)), (0, end - self.capacity)):
+            if last <= first:
+                continue
+            chunk = buf[
+                self._records
+                + first * _RECORD.size : self._records
+                + last * _RECORD.size
+            ]
+            for index, _, value, weight in _RECORD.iter_unpack(chunk):
+                records.append(
+                    (
+                        self.parameters[index],
+                        value,
+                        None if math.isnan(weight) else weight,
+                    )
+                )
+            chunk.release()
+        # Free the slots only once they have been copied out.
+        _COUNTER.pack_into(buf, _TAIL, head)
+        return iter(records)
+
+    def close(self) -> None:
+        """Detach from the ring, unlinking it if it was created here."""
+        self._buf.release()
+        self._shm.close()
+        if self.owner:
+            if not _TRACK_ARGUMENT and os.name == "posix":
+                # Balances the unregistration done by `unlink`.
+                resource_tracker.register(self._shm._name, "shared_memory")
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "ParameterRing":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParameterIngest:
+    """Feeds values written to parameter rings into a `ParameterInjector`.
+
+    Rings are drained `poll_rate` times a second. Only the latest value of
+    each parameter is kept by the injector, which sends them over the single
+    connection of its client, so any number of worker processes can supply
+    parameters without connecting to VTS themselves.
+
+        async with vts.injection_stream() as stream:
+            async with ParameterIngest(stream) as ingest:
+                ring = ingest.add_ring(["FaceAngleX", "MouthOpen"])
+                start_worker(ring.name)
+                ...
+    """
+
+    def __init__(
+        self,
+        injector: "ParameterInjector",
+        rings: Sequence[ParameterRing] = (),
+        *,
+        poll_rate: float = 250.0,
+    ) -> None:
+        if poll_rate <= 0:
+            raise ValueError("poll_rate must be positive")
+        self._injector = injector
+        self.rings = list(rings)
+        self.interval = 1 / poll_rate
+        self._task = BackgroundTask()
+
+    def add_ring(
+        self, parameters: Sequence[str], capacity: int = 4096
+    ) -> ParameterRing:
+        """Create a ring for a worker to write to, closed with the ingest."""
+        ring = ParameterRing.create(parameters, capacity)
+        self.rings.append(ring)
+        return ring
+
+    def drain(self) -> int:
+        """Pass every waiting value to the injector, returning how many."""
+        count = 0
+        for ring in self.rings:
+            for parameter, value, weight in ring.read():
+                self._injector.set(parameter, value, weight)
+                count += 1
+        return count
+
+    def start(self) -> None:
+        """Start draining in the background."""
+        self._task.start(self._run)
+
+    async def stop(self) -> None:
+        """Stop draining, passing on the values that are still waiting."""
+        await self._task.stop()
+        self.drain()
+
+    def close(self) -> None:
+        """Close every ring, unlinking those created by this process."""
+        for ring in self.rings:
+            ring.close()
+        self.rings.clear()
+
+    async def _run(self) -> None:
+        async for _ in ticks(lambda: self.interval):
+            self.drain()
+
+    async def __aenter__(self) -> "ParameterIngest":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            await self.stop()
+        finally:
+            self.close()
@@ -0,0 +1,167 @@
+"""Switches models no faster than VTS allows."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from .background import BackgroundTask
+from .errors import APIError
+from .models.failure import ErrorID
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient
+
+# Errors that only mean the model cannot be changed yet.
+_TRANSIENT = frozenset(
+    {ErrorID.ModelLoadCooldownNotOver, ErrorID.CannotCurrentlyChangeModel}
+)
+
+
+class ModelSwitcher:
+    """Loads models one at a time, skipping switches that were superseded.
+
+    VTS rejects a model load within its `cooldown` of 2 seconds after the
+    last one, and while the user has windows open that prevent changing the
+    model. Switches requested while another one waits replace it, so a burst
+    of switches loads only the last model requested, and every caller of the
+    burst shares its outcome. Loads rejected for either reason are retried
+    after a delay that starts at `retry_delay` and doubles up to
+    `max_retry_delay`, at most `max_retries` times in a row.
+
+    Once a model is loaded, its hotkeys, expressions and ArtMesh index are
+    requested in the background, so that they are ready in the cache when
+    needed. This only has an effect with the cache of the client enabled.
+
+        async with vts.model_switcher() as switcher:
+            switcher.switch(model_id)
+    """
+
+    def __init__(
+        self,
+        client: "AuthenticatedClient",
+        *,
+        cooldown: float = 2.0,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 8.0,
+        max_retries: int = 10,
+        warm: bool = True,
+    ) -> None:
+        self._client = client
+        self.cooldown = cooldown
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_retries = max_retries
+        self.warm = warm
+        # The model to load next, and the futures of every switch to it.
+        self._target: Optional[str] = None
+        self._futures: List["asyncio.Future[str]"] = []
+        self._ready_at = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task = BackgroundTask()
+        self._warming = BackgroundTask()
+
+    def switch(self, model_id: str) -> "asyncio.Future[str]":
+        """Schedule loading a model, replacing any switch that still waits.
+
+        Returns a future that resolves to the ID of the model finally loaded,
+        which is that of a later switch if this one was superseded, or raises
+        the `APIError` the load failed with.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._target = model_id
+        self._futures.append(future)
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._task.start(self._run)
+        self._wakeup.set()
+        return future
+
+    @property
+    def pending(self) -> Optional[str]:
+        """The ID of the model waiting to be loaded, if any."""
+        return self._target
+
+    def cooldown_left(self) -> float:
+        """Seconds until a model may be loaded again."""
+        return max(0.0, self._ready_at - time.monotonic())
+
+    async def close(self) -> None:
+        """Stop switching, cancelling the switch that still waits."""
+        await self._task.stop()
+        await self._warming.stop()
+        for future in self._futures:
+            future.cancel()
+        self._futures.clear()
+        self._target = None
+
+    async def _run(self) -> None:
+        attempts = 0
+        while True:
+            self._wakeup.clear()
+            if self._target is None:
+                await self._wakeup.wait()
+                continue
+            delay = self._ready_at - time.monotonic()
+            if delay > 0:
+                # Later switches in the meantime only replace the target.
+                await asyncio.sleep(delay)
+                continue
+
+            model_id, self._target = self._target, None
+            futures, self._futures = self._futures, []
+            try:
+                await self._client.load_model(model_id)
+            except APIError as exc:
+                transient = exc.error_id in _TRANSIENT
+                if transient and attempts < self.max_retries:
+                    delay = min(self.retry_delay * 2**attempts, self.max_retry_delay)
+                    attempts += 1
+                    self._ready_at = time.monotonic() + delay
+                    # Retry, unless a newer switch has taken over meanwhile.
+                    if self._target is None:
+                        self._target = model_id
+                    self._futures[:0] = futures
+                    continue
+                self._settle(futures, exc)
+            except Exception as exc:
+                self._settle(futures, exc)
+            except BaseException:
+                # Closed during the load, so the switch will not complete.
+                for future in futures:
+                    future.cancel()
+                raise
+            else:
+                self._ready_at = time.monotonic() + self.cooldown
+                self._settle(futures, None, model_id)
+                if self.warm and self._client._cache is not None:
+                    self._warming.restart(self._warm)
+            attempts = 0
+
+    def _settle(
+        self,
+        futures: List["asyncio.Future[str]"],
+        error: Optional[BaseException],
+        model_id: str = "",
+    ) -> None:
+        for future in futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(model_id)
+
+    async def _warm(self) -> None:
+        client = self._client
+        await asyncio.gather(
+            client.model_hotkeys(),
+            client.expression_state(),
+            client.art_mesh_index(),
+            return_exceptions=True,
+        )
+
+    async def __aenter__(self) -> "ModelSwitcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,186 @@
+"""A blocking client for synchronous code, backed by a background event loop."""
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
+
+from .client import AuthenticatedClient
+from .interface import authenticate
+
+Call = Union[str, Callable[[AuthenticatedClient], Awaitable[Any]]]
+
+
+class SyncClient:
+    """Shares one authenticated connection between any number of threads.
+
+    The connection lives on an event loop that runs in a background thread
+    for as long as the client is open. Calls from other threads are put on a
+    thread-safe queue, which the loop drains in batches, so that a burst of
+    calls wakes the loop only once.
+
+    Every coroutine method of `AuthenticatedClient` can be called directly,
+    blocking for at most `timeout` seconds. `submit` returns a
+    `concurrent.futures.Future` instead, and `post` does not wait at all,
+    which suits per-frame updates. Errors of posted calls are passed to
+    `on_error`, in the loop thread, or ignored.
+
+        with SyncClient(port=8001) as vts:
+            print(vts.statistics())
+            vts.post("inject_parameters", {"MouthOpen": 0.5})
+
+    Other keyword arguments are passed on to `authenticate`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: str = "8001",
+        *,
+        timeout: Optional[float] = 10.0,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.timeout = timeout
+        self.on_error = on_error
+        self._queue: "queue.SimpleQueue[Tuple]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mentior", daemon=True
+        )
+        self._thread.start()
+        self._stack = AsyncExitStack()
+        try:
+            # Not limited by `timeout`, since a new token must be approved
+            # in VTS by the user.
+            self.client: AuthenticatedClient = self._run(
+                self._stack.enter_async_context(authenticate(host, port, **kwargs))
+            )
+        except BaseException:
+            self._stop()
+            raise
+
+    def _run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def close(self) -> None:
+        """Close the connection and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._run(self._stack.aclose())
+        finally:
+            self._stop()
+
+    def _resolve(self, call: Call) -> Callable[..., Awaitable[Any]]:
+        if callable(call):
+            return lambda *args, **kwargs: call(self.client, *args, **kwargs)
+        method = getattr(self.client, call, None)
+        if call.startswith("_") or not asyncio.iscoroutinefunction(method):
+            raise AttributeError(f"{call!r} is not a coroutine method of the client")
+        return method
+
+    def _enqueue(self, item: Tuple) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("client is closed")
+            self._queue.put(item)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        with self._lock:
+            self._scheduled = False
+        while True:
+            try:
+                method, args, kwargs, future = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if future is None or future.set_running_or_notify_cancel():
+                self._loop.create_task(self._invoke(method, args, kwargs, future))
+
+    async def _invoke(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        args: Tuple,
+        kwargs: dict,
+        future: Optional[concurrent.futures.Future],
+    ) -> None:
+        try:
+            result = await method(*args, **kwargs)
+        except BaseException as exc:
+            if future is not None:
+                future.set_exception(exc)
+            elif self.on_error is not None:
+                self.on_error(exc)
+            if not isinstance(exc, Exception):
+                raise
+        else:
+            if future is not None:
+                future.set_result(result)
+
+    def submit(
+        self, call: Call, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """Start a call, returning a future for its result.
+
+        `call` is the name of a client method, or a coroutine function that
+        is passed the `AuthenticatedClient` followed by the arguments.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._enqueue((self._resolve(call), args, kwargs, future))
+        return future
+
+    def post(self, call: Call, *args: Any, **kwargs: Any) -> None:
+        """Start a call without waiting for or keeping its result."""
+        self._enqueue((self._resolve(call), args, kwargs, None))
+
+    def call(
+        self, call: Call, *args: Any, timeout: Optional[float] = None, **kwargs: Any
+    ) -> Any:
+        """Make a call and wait for its result, at most `timeout` seconds.
+
+        Raises `concurrent.futures.TimeoutError` when the result takes
+        longer. The call itself is not cancelled, since its request may
+        already have been sent.
+        """
+        future = self.submit(call, *args, **kwargs)
+        return future.result(self.timeout if timeout is None else timeout)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(AuthenticatedClient, name, None)
+        if not asyncio.iscoroutinefunction(method):
+            raise AttributeError(name)
+
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            return self.call(name, *args, **kwargs)
+
+        blocking.__doc__ = method.__doc__
+        return blocking
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,81 @@
+"""Persists authentication tokens so that they need to be requested only once."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Protocol, Union
+
+
+class TokenStore(Protocol):
+    """Storage for authentication tokens, keyed by VTS endpoint."""
+
+    def load(self, key: str) -> Optional[str]: ...
+
+    def save(self, key: str, token: str) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+def default_token_path() -> Path:
+    """The token file in the user's configuration directory."""
+    config = os.environ.get("XDG_CONFIG_HOME") or os.environ.get("APPDATA")
+    base = Path(config) if config else Path.home() / ".config"
+    return base / "mentior" / "tokens.json"
+
+
+class FileTokenStore:
+    """Stores tokens in a JSON file, readable only by the current user."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path is not None else default_token_path()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                tokens = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def _write(self, tokens: Dict[str, str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that the store is never left
+        # half written.
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(tokens, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, key: str) -> Optional[str]:
+        return self._read().get(key)
+
+    def save(self, key: str, token: str) -> None:
+        tokens = self._read()
+        tokens[key] = token
+        self._write(tokens)
+
+    def delete(self, key: str) -> None:
+        tokens = self._read()
+        if tokens.pop(key, None) is not None:
+            self._write(tokens)
+
+
+class MemoryTokenStore:
+    """Keeps tokens for the lifetime of the process only."""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        return self._tokens.get(key)
+
+    def save(self, key: str, token: str) -> None:
+        self._tokens[key] = token
+
+    def delete(self, key: str) -> None:
+        self._tokens.pop(key, None)
@@ -1,22 +1,9 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Tuple, Type
 
+from pydantic import BaseModel
+
+from .models import data
 from .models.base import Response
-from .models.data import (
-    ArtMeshes,
-    AuthStatus,
-    AuthToken,
-    AvailableModels,
-    CurrentModel,
-    Empty,
-    ExpressionState,
-    HotkeyID,
-    Hotkeys,
-    ModelID,
-    Statistics,
-    Status,
-    TintedArtMeshes,
-    VTSFolderInfo,
-)
 
 RequestType = Literal[
     "APIStateRequest",
@@ -34,20 +21,149 @@ RequestType = Literal[
     "ExpressionActivationRequest",
     "ArtMeshListRequest",
     "ColorTintRequest",
+    "InjectParameterDataRequest",
+    "EventSubscriptionRequest",
+    "Live2DParameterListRequest",
+    "InputParameterListRequest",
+    "ParameterValueRequest",
+    "ItemListRequest",
+    "ItemLoadRequest",
+    "ItemUnloadRequest",
+    "ItemAnimationControlRequest",
+    "ItemMoveRequest",
 ]
 
-StatusResponse = Response[Literal["APIStateResponse"], Status]
-AuthResponse = Response[Literal["AuthenticationResponse"], AuthStatus]
-AuthTokenResponse = Response[Literal["AuthenticationTokenResponse"], AuthToken]
-StatisticsResponse = Response[Literal["StatisticsResponse"], Statistics]
-VTSFolderInfoResponse = Response[Literal["VTSFolderInfoResponse"], VTSFolderInfo]
-CurrentModelResponse = Response[Literal["CurrentModelResponse"], CurrentModel]
-ModelLoadResponse = Response[Literal["ModelLoadResponse"], ModelID]
-MoveModelResponse = Response[Literal["MoveModelResponse"], Empty]
-AvailableModelsResponse = Response[Literal["AvailableModelsResponse"], AvailableModels]
-HotkeysInModelResponse = Response[Literal["HotkeysInCurrentModelResponse"], Hotkeys]
-HotkeyTriggerResponse = Response[Literal["HotkeyTriggerResponse"], HotkeyID]
-ExpressionStateResponse = Response[Literal["ExpressionStateResponse"], ExpressionState]
-ExpressionActivationResponse = Response[Literal["ExpressionActivationResponse"], Empty]
-ArtMeshListResponse = Response[Literal["ArtMeshListResponse"], ArtMeshes]
-ColorTintResponse = Response[Literal["ColorTintResponse"], TintedArtMeshes]
+# Requests without side effects, which are safe to send more than once.
+IDEMPOTENT_REQUESTS = frozenset(
+    {
+        "APIStateRequest",
+        "StatisticsRequest",
+        "VTSFolderInfoRequest",
+        "CurrentModelRequest",
+        "AvailableModelsRequest",
+        "HotkeysInCurrentModelRequest",
+        "ExpressionStateRequest",
+        "ArtMeshListRequest",
+        "Live2DParameterListRequest",
+        "InputParameterListRequest",
+        "ParameterValueRequest",
+        "ItemListRequest",
+    }
+)
+
+# Response types are parametrized on first access by `__getattr__` rather
+# than on import, so that only those in use are built. Type checkers see
+# them as plain aliases.
+if TYPE_CHECKING:
+    StatusResponse = Response[Literal["APIStateResponse"], data.Status]
+    AuthResponse = Response[Literal["AuthenticationResponse"], data.AuthStatus]
+    AuthTokenResponse = Response[Literal["AuthenticationTokenResponse"], data.AuthToken]
+    StatisticsResponse = Response[Literal["StatisticsResponse"], data.Statistics]
+    VTSFolderInfoResponse = Response[
+        Literal["VTSFolderInfoResponse"], data.VTSFolderInfo
+    ]
+    CurrentModelResponse = Response[Literal["CurrentModelResponse"], data.CurrentModel]
+    ModelLoadResponse = Response[Literal["ModelLoadResponse"], data.ModelID]
+    MoveModelResponse = Response[Literal["MoveModelResponse"], data.Empty]
+    AvailableModelsResponse = Response[
+        Literal["AvailableModelsResponse"], data.AvailableModels
+    ]
+    HotkeysInModelResponse = Response[
+        Literal["HotkeysInCurrentModelResponse"], data.Hotkeys
+    ]
+    HotkeyTriggerResponse = Response[Literal["HotkeyTriggerResponse"], data.HotkeyID]
+    ExpressionStateResponse = Response[
+        Literal["ExpressionStateResponse"], data.ExpressionState
+    ]
+    ExpressionActivationResponse = Response[
+        Literal["ExpressionActivationResponse"], data.Empty
+    ]
+    ArtMeshListResponse = Response[Literal["ArtMeshListResponse"], data.ArtMeshes]
+    ColorTintResponse = Response[Literal["ColorTintResponse"], data.TintedArtMeshes]
+    InjectParameterDataResponse = Response[
+        Literal["InjectParameterDataResponse"], data.Empty
+    ]
+    EventSubscriptionResponse = Response[
+        Literal["EventSubscriptionResponse"], data.EventSubscription
+    ]
+    Live2DParameterListResponse = Response[
+        Literal["Live2DParameterListResponse"], data.Live2DParameters
+    ]
+    InputParameterListResponse = Response[
+        Literal["InputParameterListResponse"], data.InputParameters
+    ]
+    ParameterValueResponse = Response[
+        Literal["ParameterValueResponse"], data.InputParameter
+    ]
+    ItemListResponse = Response[Literal["ItemListResponse"], data.Items]
+    ItemLoadResponse = Response[Literal["ItemLoadResponse"], data.LoadedItem]
+    ItemUnloadResponse = Response[Literal["ItemUnloadResponse"], data.UnloadedItems]
+    ItemAnimationControlResponse = Response[
+        Literal["ItemAnimationControlResponse"], data.ItemAnimation
+    ]
+    ItemMoveResponse = Response[Literal["ItemMoveResponse"], data.MovedItems]
+
+
+# Maps the name of each response type to its message type and data model.
+_RESPONSES: Dict[str, Tuple[Any, Type[BaseModel]]] = {
+    "StatusResponse": (Literal["APIStateResponse"], data.Status),
+    "AuthResponse": (Literal["AuthenticationResponse"], data.AuthStatus),
+    "AuthTokenResponse": (Literal["AuthenticationTokenResponse"], data.AuthToken),
+    "StatisticsResponse": (Literal["StatisticsResponse"], data.Statistics),
+    "VTSFolderInfoResponse": (Literal["VTSFolderInfoResponse"], data.VTSFolderInfo),
+    "CurrentModelResponse": (Literal["CurrentModelResponse"], data.CurrentModel),
+    "ModelLoadResponse": (Literal["ModelLoadResponse"], data.ModelID),
+    "MoveModelResponse": (Literal["MoveModelResponse"], data.Empty),
+    "AvailableModelsResponse": (
+        Literal["AvailableModelsResponse"],
+        data.AvailableModels,
+    ),
+    "HotkeysInModelResponse": (Literal["HotkeysInCurrentModelResponse"], data.Hotkeys),
+    "HotkeyTriggerResponse": (Literal["HotkeyTriggerResponse"], data.HotkeyID),
+    "ExpressionStateResponse": (
+        Literal["ExpressionStateResponse"],
+        data.ExpressionState,
+    ),
+    "ExpressionActivationResponse": (
+        Literal["ExpressionActivationResponse"],
+        data.Empty,
+    ),
+    "ArtMeshListResponse": (Literal["ArtMeshListResponse"], data.ArtMeshes),
+    "ColorTintResponse": (Literal["ColorTintResponse"], data.TintedArtMeshes),
+    "InjectParameterDataResponse": (Literal["InjectParameterDataResponse"], data.Empty),
+    "EventSubscriptionResponse": (
+        Literal["EventSubscriptionResponse"],
+        data.EventSubscription,
+    ),
+    "Live2DParameterListResponse": (
+        Literal["Live2DParameterListResponse"],
+        data.Live2DParameters,
+    ),
+    "InputParameterListResponse": (
+        Literal["InputParameterListResponse"],
+        data.InputParameters,
+    ),
+    "ParameterValueResponse": (Literal["ParameterValueResponse"], data.InputParameter),
+    "ItemListResponse": (Literal["ItemListResponse"], data.Items),
+    "ItemLoadResponse": (Literal["ItemLoadResponse"], data.LoadedItem),
+    "ItemUnloadResponse": (Literal["ItemUnloadResponse"], data.UnloadedItems),
+    "ItemAnimationControlResponse": (
+        Literal["ItemAnimationControlResponse"],
+        data.ItemAnimation,
+    ),
+    "ItemMoveResponse": (Literal["ItemMoveResponse"], data.MovedItems),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        message_type, data_model = _RESPONSES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    response = Response[message_type, data_model]  # type: ignore[valid-type]
+    globals()[name] = response
+    return response
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_RESPONSES})
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.animation import TintAnimation
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.data import ArtMeshMatcher, ColorTint
+from mentior.models.failure import ErrorID
+
+ALL = ArtMeshMatcher(tint_all=True)
+
+
+def run(test):
+    """Run `test` with a tint animator against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                async with vts.tint_animator(fps=100) as animator:
+                    await test(server, animator)
+
+    asyncio.run(main())
+
+
+def test_frames():
+    animation = TintAnimation(
+        [(1, ColorTint(color_r=0)), (0, ColorTint(color_r=100))], ALL
+    )
+    assert animation.frame_at(-1)[0] == 100
+    assert animation.frame_at(0.25)[0] == 75
+    assert animation.frame_at(2)[0] == 0
+    assert animation.is_over(1) and not animation.is_over(0.5)
+    looped = TintAnimation(
+        [(0, ColorTint(color_r=0)), (1, ColorTint(color_r=100))],
+        ALL,
+        easing="step",
+        loop=True,
+    )
+    assert looped.frame_at(1.5)[0] == 0
+    assert not looped.is_over(10)
+    with pytest.raises(ValueError):
+        TintAnimation([], ALL)
+
+
+def test_only_changed_frames_are_sent():
+    async def test(server, animator):
+        # Two distinct frames, however many ticks it takes.
+        animation = animator.play(
+            [(0, ColorTint(color_r=0)), (0.1, ColorTint(color_r=2))],
+            ALL,
+            easing="step",
+        )
+        await asyncio.wait_for(animation.finished, 2)
+        assert server.requests["ColorTintRequest"] == 2
+
+    run(test)
+
+
+def test_replacing_an_animation_cancels_it():
+    async def test(server, animator):
+        keyframes = [(0, ColorTint(color_r=0)), (1, ColorTint(color_r=255))]
+        first = animator.play(keyframes, ALL)
+        second = animator.play(keyframes, ALL)
+        assert first.finished.cancelled()
+        animator.stop(second)
+        assert second.finished.cancelled()
+
+    run(test)
+
+
+def test_failed_send_ends_the_animation():
+    async def test(server, animator):
+        server.fail("ColorTintRequest", ErrorID.ColorTintRequestNoModelLoaded)
+        animation = animator.play([(0, ColorTint(color_r=0))], ALL)
+        with pytest.raises(APIError):
+            await asyncio.wait_for(animation.finished, 2)
+
+    run(test)
@@ -0,0 +1,52 @@
+import asyncio
+import re
+
+import pytest
+
+import mentior
+from mentior.artmesh import ArtMeshIndex
+from mentior.mock import MockServer
+from mentior.models.data import ArtMeshMatcher
+
+NAMES = ["HairFront", "HairBack", "EyeLeft", "EyeRight", "Mouth", "HairFront"]
+
+
+def test_resolve():
+    index = ArtMeshIndex(NAMES, ["hair", "eyes"])
+    assert index.number("HairFront") == 0
+    assert index.number("Nose") is None
+    assert index.resolve(name_prefix=["Hair"]) == [0, 1, 5]
+    assert index.resolve(name_contains=["Eye"], art_mesh_number=[4, 99]) == [2, 3, 4]
+    assert index.resolve(name_regex=[re.compile("right", re.I)]) == [3]
+    assert index.resolve(name_regex=["right"]) == []
+    assert index.resolve(name_exact=["Mouth"]) == [4]
+    # Resolved selections are copies.
+    index.resolve(name_exact=["Mouth"]).append(0)
+    assert index.resolve(name_exact=["Mouth"]) == [4]
+
+
+def test_resolve_matcher():
+    index = ArtMeshIndex(NAMES, ["hair", "eyes"])
+    assert index.resolve_matcher(ArtMeshMatcher(tint_all=True)) == list(range(6))
+    assert index.resolve_matcher(ArtMeshMatcher(name_contains=["Eye"])) == [2, 3]
+    with pytest.raises(ValueError):
+        index.resolve_matcher(ArtMeshMatcher(tag_exact=["hair"]))
+    assert index.matching_tags(tag_contains=["ye"]) == ["eyes"]
+
+
+def test_matches_vts():
+    async def main():
+        async with MockServer(art_meshes=30) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                index = await vts.art_mesh_index()
+                assert len(index) == 30
+                patterns = {"name_contains": ["1"], "name_exact": ["ArtMesh2"]}
+                expected = len(index.resolve(**patterns))
+                matched = await vts.tint_art_meshes(
+                    art_mesh_matcher=index.matcher(**patterns)
+                )
+                assert matched == expected
+                matcher = ArtMeshMatcher(**patterns)
+                assert await vts.tint_art_meshes(art_mesh_matcher=matcher) == expected
+
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test, **options):
+    """Run `test` with a client authenticated against a fresh mock server."""
+
+    async def main():
+        async with MockServer(**options) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+def test_takes_one_round_trip():
+    async def test(server, vts):
+        start = time.monotonic()
+        async with vts.batch() as batch:
+            items = [batch.inject_parameters({"FaceAngleX": i}) for i in range(5)]
+            status = batch.status()
+        assert time.monotonic() - start < 0.3
+        assert all(item.done() for item in items)
+        assert status.result().active
+        assert server.requests["InjectParameterDataRequest"] == 5
+
+    run(test, latency=0.2)
+
+
+def test_failures_only_affect_their_item():
+    async def test(server, vts):
+        server.fail("VTSFolderInfoRequest", ErrorID.InternalServerError)
+        async with vts.batch() as batch:
+            folders = batch.vts_folder_info()
+            stats = batch.statistics()
+        assert isinstance(folders.error(), APIError)
+        with pytest.raises(APIError):
+            folders.result()
+        assert stats.error() is None
+        assert stats.result().uptime >= 0
+
+    run(test)
+
+
+def test_not_sent_after_an_error():
+    async def test(server, vts):
+        with pytest.raises(KeyError):
+            async with vts.batch() as batch:
+                item = batch.statistics()
+                raise KeyError
+        assert not item.done()
+        assert server.requests["StatisticsRequest"] == 0
+        with pytest.raises(RuntimeError):
+            item.result()
+
+    run(test)
+
+
+def test_only_coroutine_methods():
+    async def test(server, vts):
+        batch = vts.batch()
+        with pytest.raises(AttributeError):
+            batch.injection_stream
+        with pytest.raises(AttributeError):
+            batch._request
+
+    run(test)
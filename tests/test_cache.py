@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import mentior
+from mentior.cache import MetadataCache
+from mentior.mock import MockServer
+
+
+def run(test):
+    """Run `test` with a caching client against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                await vts.enable_cache()
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+async def load_in_vts(server, vts, index):
+    """Load a model as if from the VTS UI, and wait for the event."""
+    model = server.models[index]
+    server.current = model
+    await server.emit(
+        "ModelLoadedEvent",
+        {
+            "modelLoaded": True,
+            "modelName": model["modelName"],
+            "modelID": model["modelID"],
+        },
+    )
+    # The event arrives before the response to a later request.
+    await vts.statistics()
+
+
+def test_expiry_and_eviction():
+    cache = MetadataCache(ttl=0.05, maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    # "b" was used least recently.
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_model_change_invalidates():
+    cache = MetadataCache()
+    cache.observe_model("a")
+    cache.put("key", 1)
+    cache.observe_model("a")
+    assert cache.get("key") == 1
+    cache.observe_model("b")
+    assert cache.get("key") is None
+
+
+def test_caches_until_model_loaded_in_vts():
+    async def test(server, vts):
+        assert server.requests["EventSubscriptionRequest"] == 1
+        await load_in_vts(server, vts, 0)
+        await vts.available_models()
+        await vts.available_models()
+        assert server.requests["AvailableModelsRequest"] == 1
+        await load_in_vts(server, vts, 1)
+        await vts.available_models()
+        assert server.requests["AvailableModelsRequest"] == 2
+
+    run(test)
+
+
+def test_outlives_event_iterators():
+    async def test(server, vts):
+        async def first_event():
+            async for event in vts.events("ModelLoadedEvent"):
+                return event
+
+        task = asyncio.ensure_future(first_event())
+        await asyncio.sleep(0.05)
+        await load_in_vts(server, vts, 0)
+        await asyncio.wait_for(task, 5)
+        # Ending the iterator keeps the subscription of the cache.
+        assert server.requests["EventSubscriptionRequest"] == 1
+        await vts.available_models()
+        await load_in_vts(server, vts, 1)
+        await vts.available_models()
+        assert server.requests["AvailableModelsRequest"] == 2
+
+    run(test)
+
+
+def test_disable_unsubscribes():
+    async def test(server, vts):
+        await vts.disable_cache()
+        assert server.requests["EventSubscriptionRequest"] == 2
+        await vts.available_models()
+        await vts.available_models()
+        assert server.requests["AvailableModelsRequest"] == 2
+
+    run(test)
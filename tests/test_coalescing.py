@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test):
+    """Run `test` with a client against a mock server with some latency."""
+
+    async def main():
+        async with MockServer(latency=0.05) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+def test_identical_reads_share_a_request():
+    async def test(server, vts):
+        results = await asyncio.gather(*(vts.statistics() for _ in range(10)))
+        assert server.requests["StatisticsRequest"] == 1
+        assert all(result is results[0] for result in results)
+        # Different arguments are different reads.
+        await asyncio.gather(
+            vts.parameter_value("MouthOpen"), vts.parameter_value("FaceAngleX")
+        )
+        assert server.requests["ParameterValueRequest"] == 2
+        # Finished reads are not reused.
+        await vts.statistics()
+        assert server.requests["StatisticsRequest"] == 2
+
+    run(test)
+
+
+def test_disabled():
+    async def test(server, vts):
+        vts.coalesce_reads = False
+        await asyncio.gather(*(vts.statistics() for _ in range(3)))
+        assert server.requests["StatisticsRequest"] == 3
+
+    run(test)
+
+
+def test_errors_are_shared():
+    async def test(server, vts):
+        server.fail("StatisticsRequest", ErrorID.InternalServerError)
+        results = await asyncio.gather(
+            *(vts.statistics() for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, APIError) for result in results)
+        assert server.requests["StatisticsRequest"] == 1
+
+    run(test)
+
+
+def test_cancelling_one_caller_keeps_the_read():
+    async def test(server, vts):
+        first = asyncio.ensure_future(vts.statistics())
+        second = asyncio.ensure_future(vts.statistics())
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert (await second).uptime >= 0
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert server.requests["StatisticsRequest"] == 1
+
+    run(test)
@@ -0,0 +1,47 @@
+import asyncio
+from array import array
+from typing import List
+
+from pydantic import BaseModel
+
+import mentior
+from mentior.mock import MockServer
+from mentior.models.compact import decoder
+from mentior.models.data import ItemMove
+
+
+def test_defaults_and_missing_fields():
+    record = decoder(ItemMove)({"itemInstanceID": "item", "size": 0.5})
+    assert record.item_instance_id == "item"
+    assert record.size == 0.5
+    assert record.fade_mode == "linear"
+    assert record.position_x is None
+
+
+def test_records_match_models():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                model = await vts.available_models()
+                current = await vts.current_model()
+                vts.compact_responses = True
+                record = await vts.available_models()
+                assert isinstance(record, tuple)
+                assert record.number_of_models == model.number_of_models
+                first = record.available_models[0]
+                assert first.model_id == model.available_models[0].model_id
+                assert first._asdict() == model.available_models[0].model_dump()
+                position = (await vts.current_model()).model_position
+                assert position.position_x == current.model_position.position_x
+
+    asyncio.run(main())
+
+
+def test_float_lists_become_arrays():
+    class Samples(BaseModel):
+        values: List[float]
+        names: List[str]
+
+    record = decoder(Samples)({"values": [1, 2.5], "names": ["a"]})
+    assert record.values == array("d", [1.0, 2.5])
+    assert record.names == ("a",)
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+import mentior
+from mentior import types
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.base import LazyList
+from mentior.models.data import VTSModel
+
+
+def response(message_type, data):
+    return json.dumps(
+        {
+            "apiName": "VTubeStudioPublicAPI",
+            "apiVersion": "1.0",
+            "requestID": "id",
+            "messageType": message_type,
+            "timestamp": 0,
+            "data": data,
+        }
+    )
+
+
+def test_errors():
+    error = response("APIError", {"errorID": 8, "message": "no"})
+    with pytest.raises(APIError):
+        types.StatusResponse.parse(error)
+    with pytest.raises(ValidationError):
+        types.StatusResponse.parse(response("APIStateResponse", {"active": "?"}))
+    with pytest.raises(ValidationError):
+        types.StatusResponse.parse("not json")
+
+
+def test_lazy_list():
+    items = LazyList(["1", "2", "3"], TypeAdapter(int))
+    assert repr(items) == "LazyList(3 items)"
+    assert items[1] == 2
+    assert list.__getitem__(items, 0) == "1"
+    assert items[-1:] == [3]
+    assert items == [1, 2, 3]
+    assert 2 in items
+    assert list(reversed(items)) == [3, 2, 1]
+
+
+def test_lazy_responses_match_eager_ones():
+    async def main():
+        async with MockServer(art_meshes=50) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                eager = await vts.art_meshes()
+                vts.lazy_responses = True
+                lazy = await vts.art_meshes()
+                assert isinstance(lazy.art_mesh_names, LazyList)
+                assert lazy.art_mesh_names[0] == eager.art_mesh_names[0]
+                assert lazy.model_dump() == eager.model_dump()
+                models = await vts.available_models()
+                assert isinstance(models.available_models[0], VTSModel)
+
+    asyncio.run(main())
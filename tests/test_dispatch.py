@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+import websockets
+
+import mentior
+from mentior.client import UnauthenticatedClient
+from mentior.dispatch import Dispatcher
+from mentior.mock import MockServer
+
+
+async def connect(server, timeout):
+    ws = await websockets.connect(f"ws://127.0.0.1:{server.port}")
+    return UnauthenticatedClient(ws, dispatcher=Dispatcher(ws, timeout))
+
+
+def test_timeout():
+    async def main():
+        async with MockServer(latency=0.2) as server:
+            client = await connect(server, 0.05)
+            try:
+                with pytest.raises(asyncio.TimeoutError):
+                    await client.status()
+                # A late response is discarded, later requests still work.
+                client._dispatcher.timeout = None
+                assert (await client.status()).active
+            finally:
+                await client.close()
+
+    asyncio.run(main())
+
+
+def test_token_request_has_no_timeout():
+    async def main():
+        async with MockServer(latency=0.2) as server:
+            client = await connect(server, 0.05)
+            try:
+                assert await client.request_auth_token() in server.tokens
+            finally:
+                await client.close()
+
+    asyncio.run(main())
+
+
+def test_authenticate_timeout():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(
+                port=server.port, store=None, timeout=0.05
+            ) as vts:
+                server.latency = 0.2
+                with pytest.raises(asyncio.TimeoutError):
+                    await vts.statistics()
+            async with mentior.authenticate(
+                port=server.port, store=None, timeout=None
+            ) as vts:
+                assert (await vts.statistics()).uptime >= 0
+
+    asyncio.run(main())
+
+
+def test_concurrent_requests():
+    async def main():
+        async with MockServer(latency=(0.0, 0.02), seed=1) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                vts.coalesce_reads = False
+                results = await asyncio.gather(*(vts.statistics() for _ in range(50)))
+                assert len(results) == 50
+                assert server.requests["StatisticsRequest"] == 50
+
+    asyncio.run(main())
+
+
+def test_reconnect():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(
+                port=server.port, store=None, reconnect=True
+            ) as vts:
+                await vts.status()
+                await server.disconnect_all()
+                status = await asyncio.wait_for(vts.status(), 5)
+                assert status.current_session_authenticated
+                assert server.requests["AuthenticationRequest"] == 2
+
+    asyncio.run(main())
+
+
+def test_reconnect_does_not_retry_timed_out_hooks():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(
+                port=server.port, store=None, reconnect=True, timeout=0.05
+            ) as vts:
+                server.latency = 0.2
+                await server.disconnect_all()
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(vts.status(), 5)
+                # Reauthenticating was attempted once, and not retried.
+                assert server.requests["AuthenticationRequest"] == 2
+
+    asyncio.run(main())
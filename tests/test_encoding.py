@@ -0,0 +1,56 @@
+import asyncio
+
+import mentior
+from mentior.mock import MockServer
+from mentior.models.base import Request, dump_trusted, encode_request
+from mentior.models.data import ItemMove, MoveModel
+
+
+def dumped(message_type, data):
+    request = Request(message_type=message_type, data=data, requestID="id")
+    return request.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def test_matches_request_model():
+    move = MoveModel(
+        time_in_seconds=0.5,
+        values_are_relative_to_model=False,
+        position_x=0.1,
+        position_y=None,
+        position_z=None,
+        rotation=None,
+        size=None,
+    )
+    for message_type, data in [
+        ("APIStateRequest", None),
+        ("MoveModelRequest", move),
+        ("InjectParameterDataRequest", {"parameterValues": [], "mode": None}),
+    ]:
+        request_id, payload = encode_request(message_type, data, "id")
+        assert request_id == "id"
+        assert payload == dumped(message_type, data)
+
+
+def test_fresh_request_ids():
+    first, _ = encode_request("APIStateRequest")
+    second, _ = encode_request("APIStateRequest")
+    assert first != second
+
+
+def test_dump_trusted_matches_model_dump():
+    fields = {"item_instance_id": "item", "time_in_seconds": 1.0, "size": 0.5}
+    assert dump_trusted(ItemMove, **fields) == ItemMove(**fields).model_dump(
+        by_alias=True, exclude_none=True
+    )
+
+
+def test_unvalidated_requests():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                vts.validate_requests = False
+                await vts.move_model(0.1, position_x=0.5, rotation=10)
+                assert server.position["positionX"] == 0.5
+                assert server.position["rotation"] == 10
+
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.events import Event, EventQueue
+from mentior.mock import MockServer
+
+
+def events(count):
+    return [
+        Event.model_validate({"messageType": "TestEvent", "timestamp": i})
+        for i in range(count)
+    ]
+
+
+async def drain(queue):
+    return [(await queue.get()).timestamp for _ in range(len(queue))]
+
+
+def test_drop_oldest():
+    async def main():
+        queue = EventQueue(maxsize=2, overflow="drop_oldest")
+        for event in events(4):
+            await queue.put(event)
+        assert queue.dropped == 2
+        assert await drain(queue) == [2, 3]
+
+    asyncio.run(main())
+
+
+def test_drop_newest():
+    async def main():
+        queue = EventQueue(maxsize=2, overflow="drop_newest")
+        for event in events(4):
+            await queue.put(event)
+        assert queue.dropped == 2
+        assert await drain(queue) == [0, 1]
+
+    asyncio.run(main())
+
+
+def test_block_waits_for_room():
+    async def main():
+        queue = EventQueue(maxsize=1, overflow="block")
+        first, second = events(2)
+        await queue.put(first)
+        put = asyncio.ensure_future(queue.put(second))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+        assert (await queue.get()).timestamp == 0
+        await asyncio.wait_for(put, 1)
+        assert queue.dropped == 0
+        assert (await queue.get()).timestamp == 1
+
+    asyncio.run(main())
+
+
+def test_close_ends_blocked_put_and_get():
+    async def main():
+        queue = EventQueue(maxsize=1, overflow="block")
+        first, second = events(2)
+        await queue.put(first)
+        put = asyncio.ensure_future(queue.put(second))
+        await asyncio.sleep(0.01)
+        queue.close(ConnectionError())
+        await asyncio.wait_for(put, 1)
+        assert (await queue.get()).timestamp == 0
+        with pytest.raises(ConnectionError):
+            await queue.get()
+
+    asyncio.run(main())
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        EventQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        EventQueue(overflow="drop_all")
+
+
+def test_bad_events_do_not_stop_the_reader():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+
+                def fail(event):
+                    raise RuntimeError("listener failed")
+
+                vts._dispatcher.add_listener(fail)
+                received = asyncio.Queue()
+
+                async def record():
+                    async for event in vts.events("TestEvent"):
+                        await received.put(event)
+
+                listener = asyncio.ensure_future(record())
+                while not server.requests["EventSubscriptionRequest"]:
+                    await asyncio.sleep(0.01)
+                await server.emit("TestEvent", "not an object")
+                await server.emit("TestEvent", {"yourTestMessage": "hi"})
+                event = await asyncio.wait_for(received.get(), 5)
+                assert event.data["yourTestMessage"] == "hi"
+                assert (await vts.status()).active
+                listener.cancel()
+
+    asyncio.run(main())
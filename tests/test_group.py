@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def test_broadcast():
+    async def main():
+        async with MockServer() as first, MockServer() as second:
+            endpoints = [("127.0.0.1", first.port), ("127.0.0.1", second.port)]
+            async with mentior.authenticate_many(*endpoints, store=None) as group:
+                results = await group.status()
+                assert len(results) == 2
+                assert all(status.current_session_authenticated for status in results)
+        assert first.requests["APIStateRequest"] == 1
+        assert second.requests["APIStateRequest"] == 1
+
+    asyncio.run(main())
+
+
+def test_failure_closes_other_connections():
+    async def main():
+        async with MockServer(latency=0.2) as slow, MockServer() as failing:
+            failing.fail("AuthenticationTokenRequest", ErrorID.TokenRequestDenied)
+            endpoints = [("127.0.0.1", slow.port), ("127.0.0.1", failing.port)]
+            with pytest.raises(APIError):
+                async with mentior.authenticate_many(*endpoints, store=None):
+                    pass
+            await asyncio.sleep(0.6)
+            assert slow.requests["AuthenticationRequest"] == 0
+            assert not slow._sessions
+
+    asyncio.run(main())
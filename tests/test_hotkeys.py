@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test, **options):
+    """Run `test` with the first hotkey of the model loaded in the mock."""
+
+    async def main():
+        async with MockServer(hotkey_cooldown=0.2) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                hotkey = server.current["hotkeys"][0]["HotkeyID"]
+                async with vts.hotkey_scheduler(cooldown=0.2, **options) as hotkeys:
+                    await test(server, hotkeys, hotkey)
+
+    asyncio.run(main())
+
+
+def test_flood_is_merged_and_spaced_out():
+    async def test(server, hotkeys, hotkey):
+        await hotkeys.trigger(hotkey)
+        assert hotkeys.cooldown_left(hotkey) > 0
+        triggers = [hotkeys.trigger(hotkey) for _ in range(10)]
+        assert hotkeys.pending(hotkey) == 1
+        await asyncio.wait_for(asyncio.gather(*triggers), 2)
+        # Sent once the cooldown was over, so the mock accepted it.
+        assert server.requests["HotkeyTriggerRequest"] == 2
+
+    run(test)
+
+
+def test_retries_when_queue_is_full():
+    async def test(server, hotkeys, hotkey):
+        server.fail("HotkeyTriggerRequest", ErrorID.HotkeyQueueFull, times=2)
+        await asyncio.wait_for(hotkeys.trigger(hotkey), 2)
+        assert server.requests["HotkeyTriggerRequest"] == 3
+
+    run(test, retry_delay=0.01)
+
+
+def test_reports_other_errors():
+    async def test(server, hotkeys, hotkey):
+        with pytest.raises(APIError) as info:
+            await asyncio.wait_for(hotkeys.trigger("missing"), 2)
+        assert info.value.error_id == ErrorID.HotkeyIDNotFoundInModel
+
+    run(test)
+
+
+def test_close_cancels_waiting_triggers():
+    async def test(server, hotkeys, hotkey):
+        await hotkeys.trigger(hotkey)
+        waiting = hotkeys.trigger(hotkey)
+        await hotkeys.close()
+        assert waiting.cancelled()
+        assert server.requests["HotkeyTriggerRequest"] == 1
+
+    run(test)
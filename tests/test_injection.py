@@ -0,0 +1,60 @@
+import asyncio
+
+import mentior
+from mentior.mock import MockServer
+
+
+def run(test):
+    """Run `test` with a client authenticated against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+def test_flush_sends_latest_values_at_once():
+    async def test(server, vts):
+        stream = vts.injection_stream()
+        for value in range(10):
+            stream.set("FaceAngleX", float(value))
+        stream.set("MouthOpen", 0.5, weight=0.8)
+        await stream.flush()
+        assert server.requests["InjectParameterDataRequest"] == 1
+        assert server.parameters == {"FaceAngleX": 9.0, "MouthOpen": 0.5}
+        # Nothing changed since.
+        await stream.flush()
+        assert server.requests["InjectParameterDataRequest"] == 1
+
+    run(test)
+
+
+def test_keep_alive_resends_values():
+    async def test(server, vts):
+        stream = vts.injection_stream(keep_alive=0.05)
+        stream.set("FaceAngleX", 1.0)
+        await stream.flush()
+        await asyncio.sleep(0.06)
+        await stream.flush()
+        assert server.requests["InjectParameterDataRequest"] == 2
+        stream.discard("FaceAngleX")
+        await asyncio.sleep(0.06)
+        await stream.flush()
+        assert server.requests["InjectParameterDataRequest"] == 2
+
+    run(test)
+
+
+def test_background_stream():
+    async def test(server, vts):
+        async with vts.injection_stream(rate=100) as stream:
+            stream.set("FaceAngleX", 1.0)
+            await asyncio.sleep(0.05)
+            stream.set("FaceAngleX", 2.0)
+            await asyncio.sleep(0.05)
+        assert server.parameters["FaceAngleX"] == 2.0
+        assert server.requests["InjectParameterDataRequest"] == 2
+
+    run(test)
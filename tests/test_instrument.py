@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.instrument import Histogram, MetricsCollector, RequestHook
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+class Recorder(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_serialize(self, info):
+        self.calls.append(("before_serialize", info.message_type))
+
+    def after_send(self, info):
+        self.calls.append(("after_send", info.message_type))
+
+    def on_receive(self, info):
+        self.calls.append(("on_receive", info.message_type))
+
+    def after_parse(self, info):
+        assert info.started_at <= info.sent_at <= info.received_at <= info.parsed_at
+        self.calls.append(("after_parse", info.message_type))
+
+    def on_error(self, info, error):
+        self.calls.append(("on_error", type(error).__name__))
+
+
+def test_histogram():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.add(value / 1000)
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["min"] == 0.001 and summary["max"] == 0.1
+    assert summary["p50"] == pytest.approx(0.05, rel=0.2)
+    assert Histogram().summary() == {"count": 0}
+
+
+def test_hooks_and_metrics():
+    async def main():
+        async with MockServer(latency=0.01) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                recorder = Recorder()
+                metrics = MetricsCollector()
+                vts.add_hook(recorder)
+                vts.add_hook(metrics)
+                await vts.statistics()
+                server.fail("StatisticsRequest", ErrorID.InternalServerError)
+                with pytest.raises(APIError):
+                    await vts.statistics()
+                vts.remove_hook(recorder)
+                await vts.statistics()
+
+        stages = ["before_serialize", "after_send", "on_receive", "after_parse"]
+        assert recorder.calls[:4] == [(stage, "StatisticsRequest") for stage in stages]
+        assert recorder.calls[-1] == ("on_error", "APIError")
+        assert len(recorder.calls) == 8
+        snapshot = metrics.snapshot()["StatisticsRequest"]
+        assert snapshot["round_trip"]["count"] == 3
+        assert snapshot["round_trip"]["min"] >= 0.01
+        assert snapshot["total"]["count"] == 2
+        assert snapshot["errors"] == {"APIError": 1}
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    asyncio.run(main())
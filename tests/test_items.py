@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test, **options):
+    """Run `test` with an item mover against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                async with vts.item_mover(**options) as mover:
+                    await test(server, mover)
+
+    asyncio.run(main())
+
+
+def test_moves_are_sent_in_bulk():
+    async def test(server, mover):
+        items = [await mover.load("Hat.png") for _ in range(10)]
+        moves = [mover.move(item, position_x=i / 10) for i, item in enumerate(items)]
+        await asyncio.wait_for(asyncio.gather(*moves), 2)
+        assert server.requests["ItemMoveRequest"] == 3
+        assert [server.items[item]["positionX"] for item in items] == [
+            i / 10 for i in range(10)
+        ]
+
+    run(test, max_per_request=4)
+
+
+def test_later_moves_supersede_waiting_ones():
+    async def test(server, mover):
+        item = await mover.load("Hat.png")
+        first = mover.move(item, position_x=0.5, size=0.2)
+        second = mover.move(item, position_x=-0.5, flip=True)
+        assert first is second
+        assert mover.pending() == 1
+        await mover.flush()
+        assert server.requests["ItemMoveRequest"] == 1
+        moved = server.items[item]
+        assert (moved["positionX"], moved["size"], moved["flipped"]) == (
+            -0.5,
+            0.2,
+            True,
+        )
+
+    run(test)
+
+
+def test_unknown_items():
+    async def test(server, mover):
+        with pytest.raises(KeyError):
+            mover.move("missing")
+        item = await mover.load("Hat.png")
+        del server.items[item]
+        with pytest.raises(APIError) as info:
+            await mover.move(item, size=0.5)
+        assert info.value.error_id == ErrorID.ItemMoveRequestInstanceIDNotFound
+        assert item not in mover.instances
+
+    run(test)
+
+
+def test_refresh_and_unload():
+    async def test(server, mover):
+        item = await mover.load("Star.gif")
+        mover.forget(item)
+        assert await mover.refresh() == {item: "Star.gif"}
+        assert await mover.unload(item) == [item]
+        assert not mover.instances
+        assert not server.items
+
+    run(test)
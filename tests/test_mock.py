@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test):
+    """Run `test` with a client authenticated against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+def test_round_trip():
+    async def test(server, vts):
+        status = await vts.status()
+        assert status.active and status.current_session_authenticated
+        models = await vts.available_models()
+        assert models.number_of_models == len(server.models)
+        await vts.load_model(models.available_models[1].model_id)
+        current = await vts.current_model()
+        assert current.model_id == models.available_models[1].model_id
+        assert server.requests["ModelLoadRequest"] == 1
+
+    run(test)
+
+
+def test_error_injection():
+    async def test(server, vts):
+        server.fail("StatisticsRequest", ErrorID.InternalServerError)
+        with pytest.raises(APIError) as info:
+            await vts.statistics()
+        assert info.value.error_id == ErrorID.InternalServerError
+        # Only the next request fails.
+        assert (await vts.statistics()).uptime >= 0
+
+    run(test)
+
+
+def test_events():
+    async def test(server, vts):
+        async def first_event():
+            async for event in vts.events("TestEvent"):
+                return event
+
+        task = asyncio.ensure_future(first_event())
+        while not server.requests["EventSubscriptionRequest"]:
+            await asyncio.sleep(0.01)
+        assert await server.emit("TestEvent", {"yourTestMessage": "hi"}) == 1
+        event = await asyncio.wait_for(task, 5)
+        assert event.message_type == "TestEvent"
+        assert event.data["yourTestMessage"] == "hi"
+
+    run(test)
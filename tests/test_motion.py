@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.mock import MockServer
+from mentior.motion import MoveKeyframe, MoveSegment, plan_path
+
+
+def test_splits_long_stretches():
+    segments = plan_path(
+        [MoveKeyframe(0, position_x=0.0), MoveKeyframe(3, position_x=0.6)],
+        max_segment=1.0,
+    )
+    assert [segment.start for segment in segments] == [0, 0, 1, 2]
+    assert [segment.duration for segment in segments] == [0, 1, 1, 1]
+    assert [segment.values["position_x"] for segment in segments] == pytest.approx(
+        [0.0, 0.2, 0.4, 0.6]
+    )
+
+
+def test_single_keyframe_interpolates_from_start():
+    segments = plan_path([MoveKeyframe(5, position_x=0.5)], start={"position_x": -0.5})
+    assert len(segments) == 3
+    assert sum(segment.duration for segment in segments) == pytest.approx(5)
+    assert [segment.values["position_x"] for segment in segments] == pytest.approx(
+        [-1 / 6, 1 / 6, 0.5]
+    )
+
+
+def test_single_keyframe_without_start_sends_no_empty_moves():
+    segments = plan_path([MoveKeyframe(5, position_x=0.5)])
+    assert segments == [MoveSegment(5 * 2 / 3, 5 / 3, {"position_x": 0.5})]
+
+
+def test_rejects_invalid_paths():
+    with pytest.raises(ValueError):
+        plan_path([MoveKeyframe(1, size=0)], max_segment=3)
+    with pytest.raises(ValueError):
+        plan_path([MoveKeyframe(-1, size=0)])
+
+
+def test_scheduler_moves_from_model_position():
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                server.position["positionX"] = -0.5
+                moved = []
+
+                async def record():
+                    async for event in vts.events("ModelMovedEvent"):
+                        moved.append(event.data["modelPosition"]["positionX"])
+
+                listener = asyncio.ensure_future(record())
+                while not server.requests["EventSubscriptionRequest"]:
+                    await asyncio.sleep(0.01)
+                motion = vts.motion_scheduler(max_segment=0.1)
+                await motion.play([MoveKeyframe(0.3, position_x=0.5)])
+                listener.cancel()
+                assert server.requests["CurrentModelRequest"] == 1
+                assert moved == pytest.approx([-1 / 6, 1 / 6, 0.5])
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.mock import MockServer
+from mentior.polling import ParameterPoller
+
+
+def run(test, compact=False):
+    """Run `test` with a client authenticated against a fresh mock server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                vts.compact_responses = compact
+                await test(server, vts)
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_reports_changes(compact):
+    async def test(server, vts):
+        poller = vts.parameter_poller(threshold=0.1)
+        first = await poller.poll()
+        assert first == poller.snapshot()
+        assert first["ParamEyeLOpen"] == 1.0
+        assert await poller.poll() == {}
+        await vts.inject_parameters({"FaceAngleX": 12.0})
+        assert await poller.poll() == {"ParamAngleX": 12.0}
+        # Drifts below the threshold add up until they are reported.
+        await vts.inject_parameters({"FaceAngleX": 12.06})
+        assert await poller.poll() == {}
+        await vts.inject_parameters({"FaceAngleX": 12.12})
+        assert await poller.poll() == {"ParamAngleX": pytest.approx(12.12)}
+
+    run(test, compact)
+
+
+def test_input_parameters():
+    async def test(server, vts):
+        poller = vts.parameter_poller(source="input")
+        assert "FaceAngleX" in await poller.poll()
+        await vts.inject_parameters({"MouthOpen": 0.5})
+        assert await poller.poll() == {"MouthOpen": 0.5}
+
+    run(test)
+
+
+def test_iterates_over_change_sets():
+    async def test(server, vts):
+        changes = vts.parameter_poller(rate=100).changes()
+        assert len(await changes.__anext__()) > 1
+        await vts.inject_parameters({"FaceAngleY": -5.0})
+        assert await asyncio.wait_for(changes.__anext__(), 2) == {"ParamAngleY": -5.0}
+        await changes.aclose()
+
+    run(test)
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        ParameterPoller(None, rate=0)
+    with pytest.raises(ValueError):
+        ParameterPoller(None, source="output")
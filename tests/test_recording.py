@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+from mentior.recording import (
+    REQUEST,
+    RESPONSE,
+    SessionLog,
+    SessionRecorder,
+    replay,
+)
+
+
+def record_session(path):
+    """Record a short session with one failed request, returning the server."""
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                with SessionRecorder(str(path)) as recorder:
+                    vts.add_hook(recorder)
+                    await vts.statistics()
+                    await vts.inject_parameters({"MouthOpen": 0.5})
+                    server.fail("StatisticsRequest", ErrorID.InternalServerError)
+                    with pytest.raises(APIError):
+                        await vts.statistics()
+
+    asyncio.run(main())
+
+
+def test_log_holds_requests_and_responses(tmp_path):
+    path = tmp_path / "session.mtrc"
+    record_session(path)
+    with SessionLog(str(path)) as log:
+        records = list(log)
+    assert [record.kind for record in records] == [REQUEST, RESPONSE] * 3
+    assert [record.message_type for record in records[::2]] == [
+        "StatisticsRequest",
+        "InjectParameterDataRequest",
+        "StatisticsRequest",
+    ]
+    assert records[0].request_id == records[1].request_id
+    assert '"APIError"' in records[-1].message
+    times = [record.time for record in records]
+    assert times == sorted(times)
+
+
+def test_truncated_and_invalid_logs(tmp_path):
+    path = tmp_path / "session.mtrc"
+    record_session(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-5])
+    with SessionLog(str(path)) as log:
+        assert len(list(log)) == 5
+    path.write_bytes(b"not a log" * 4)
+    with pytest.raises(ValueError):
+        SessionLog(str(path))
+
+
+def test_replay(tmp_path):
+    path = tmp_path / "session.mtrc"
+    record_session(path)
+
+    async def main():
+        async with MockServer() as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                results = await replay(vts, str(path), speed=None)
+                assert results["requests"] == 3
+                assert results["errors"] == {}
+                assert "lag" not in results
+                assert server.parameters == {"MouthOpen": 0.5}
+                results = await replay(vts, str(path), speed=10)
+                assert results["lag"]["count"] == 3
+
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+import multiprocessing
+
+import pytest
+
+from mentior.shm import ParameterIngest, ParameterRing
+
+
+def write_values(name, count):
+    with ParameterRing.attach(name) as ring:
+        for i in range(count):
+            while not ring.write("FaceAngleX", float(i)):
+                pass
+
+
+def test_round_trip():
+    with ParameterRing.create(["FaceAngleX", "MouthOpen"], capacity=4) as ring:
+        assert ring.write("MouthOpen", 0.5, weight=0.25)
+        assert ring.write(0, 12.0)
+        assert len(ring) == 2
+        assert list(ring.read()) == [
+            ("MouthOpen", 0.5, 0.25),
+            ("FaceAngleX", 12.0, None),
+        ]
+        assert len(ring) == 0
+        assert list(ring.read()) == []
+
+
+def test_wraparound():
+    with ParameterRing.create(["A", "B", "C"], capacity=4) as ring:
+        assert ring.write_many({"A": 1.0, "B": 2.0, "C": 3.0}) == 3
+        assert [value for _, value, _ in ring.read()] == [1.0, 2.0, 3.0]
+        # Starts at slot 3 and continues at slot 0.
+        assert ring.write_many({"C": 4.0, "A": 5.0, "B": 6.0}) == 3
+        assert list(ring.read()) == [
+            ("C", 4.0, None),
+            ("A", 5.0, None),
+            ("B", 6.0, None),
+        ]
+
+
+def test_full_ring_drops_new_records():
+    with ParameterRing.create(["A", "B", "C"], capacity=2) as ring:
+        assert ring.write_many({"A": 1.0, "B": 2.0, "C": 3.0}) == 2
+        assert not ring.write("A", 4.0)
+        assert ring.dropped == 2
+        assert [value for _, value, _ in ring.read()] == [1.0, 2.0]
+        assert ring.write("C", 5.0)
+        assert ring.dropped == 2
+
+
+def test_attach():
+    with ParameterRing.create(["A"], capacity=2) as ring:
+        with ParameterRing.attach(ring.name) as other:
+            assert other.parameters == ("A",)
+            assert not other.owner
+            other.write("A", 1.0)
+        assert list(ring.read()) == [("A", 1.0, None)]
+
+
+def test_invalid_rings():
+    with pytest.raises(ValueError):
+        ParameterRing.create(["A"], capacity=0)
+    with pytest.raises(ValueError):
+        ParameterRing.create(["A\nB"])
+    with ParameterRing.create(["A"]) as ring:
+        with pytest.raises(IndexError):
+            ring.write(1, 0.0)
+        with pytest.raises(KeyError):
+            ring.write("B", 0.0)
+
+
+def test_worker_process():
+    with ParameterRing.create(["FaceAngleX"], capacity=8) as ring:
+        worker = multiprocessing.get_context("spawn").Process(
+            target=write_values, args=(ring.name, 100)
+        )
+        worker.start()
+        values = []
+        while worker.is_alive() or len(ring):
+            values.extend(value for _, value, _ in ring.read())
+        worker.join()
+        assert worker.exitcode == 0
+        # Writes to the full ring were retried, so none are missing.
+        assert values == [float(i) for i in range(100)]
+
+
+def test_ingest_drains_rings():
+    class Injector:
+        def __init__(self):
+            self.values = {}
+
+        def set(self, parameter, value, weight=None):
+            self.values[parameter] = (value, weight)
+
+    injector = Injector()
+    ingest = ParameterIngest(injector)
+    try:
+        first = ingest.add_ring(["A"])
+        second = ingest.add_ring(["B"])
+        first.write("A", 1.0)
+        first.write("A", 2.0)
+        second.write("B", 3.0, weight=0.5)
+        assert ingest.drain() == 3
+        assert injector.values == {"A": (2.0, None), "B": (3.0, 0.5)}
+    finally:
+        ingest.close()
+    assert not ingest.rings
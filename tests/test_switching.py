@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+import mentior
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+
+
+def run(test, **options):
+    async def main():
+        async with MockServer(**options) as server:
+            async with mentior.authenticate(port=server.port, store=None) as vts:
+                models = [
+                    m.model_id for m in (await vts.available_models()).available_models
+                ]
+                await test(server, vts, models)
+
+    asyncio.run(main())
+
+
+def test_burst_loads_last_model():
+    async def test(server, vts, models):
+        async with vts.model_switcher(cooldown=0.0) as switcher:
+            results = await asyncio.gather(*(switcher.switch(m) for m in models))
+        assert results == [models[-1]] * len(models)
+        assert server.requests["ModelLoadRequest"] == 1
+
+    run(test)
+
+
+def test_waits_out_cooldown():
+    async def test(server, vts, models):
+        async with vts.model_switcher(cooldown=0.2) as switcher:
+            await switcher.switch(models[1])
+            assert switcher.cooldown_left() > 0
+            assert await switcher.switch(models[2]) == models[2]
+        assert (await vts.current_model()).model_id == models[2]
+
+    run(test, model_load_cooldown=0.2)
+
+
+def test_retries_transient_errors():
+    async def test(server, vts, models):
+        server.fail("ModelLoadRequest", ErrorID.ModelLoadCooldownNotOver, times=2)
+        async with vts.model_switcher(retry_delay=0.01) as switcher:
+            assert await switcher.switch(models[1]) == models[1]
+        assert server.requests["ModelLoadRequest"] == 3
+
+    run(test)
+
+
+def test_reports_other_errors():
+    async def test(server, vts, models):
+        async with vts.model_switcher() as switcher:
+            with pytest.raises(APIError):
+                await switcher.switch("missing")
+
+    run(test)
+
+
+def test_close_during_load_cancels_switch():
+    async def test(server, vts, models):
+        switcher = vts.model_switcher()
+        future = switcher.switch(models[1])
+        while not server.requests["ModelLoadRequest"]:
+            await asyncio.sleep(0.01)
+        await switcher.close()
+        assert future.cancelled()
+
+    run(test, latency=0.2)
@@ -0,0 +1,65 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from mentior.errors import APIError
+from mentior.mock import MockServer
+from mentior.models.failure import ErrorID
+from mentior.sync import SyncClient
+
+
+@pytest.fixture
+def server():
+    """A mock server running on a thread of its own."""
+    loop = asyncio.new_event_loop()
+    server = MockServer()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_blocking_calls(server):
+    with SyncClient(port=server.port, store=None) as vts:
+        assert vts.status().current_session_authenticated
+        assert vts.call("statistics").uptime >= 0
+        future = vts.submit(
+            lambda client, name: client.parameter_value(name), "MouthOpen"
+        )
+        assert future.result(5).name == "MouthOpen"
+        with pytest.raises(AttributeError):
+            vts.injection_stream
+        with pytest.raises(AttributeError):
+            vts.submit("_request")
+    with pytest.raises(RuntimeError):
+        vts.post("statistics")
+
+
+def test_calls_from_many_threads(server):
+    with SyncClient(port=server.port, store=None) as vts:
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: vts.statistics(), range(32)))
+        assert len(results) == 32
+
+
+def test_posted_errors_go_to_on_error(server):
+    errors = []
+    failed = threading.Event()
+
+    def on_error(exc):
+        errors.append(exc)
+        failed.set()
+
+    with SyncClient(port=server.port, store=None, on_error=on_error) as vts:
+        server.fail("InjectParameterDataRequest", ErrorID.InternalServerError)
+        vts.post("inject_parameters", {"MouthOpen": 0.5})
+        assert failed.wait(5)
+        assert isinstance(errors[0], APIError)
+        with pytest.raises(APIError):
+            vts.submit("inject_parameters", {}).result(5)
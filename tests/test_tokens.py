@@ -0,0 +1,86 @@
+import asyncio
+
+import mentior
+from mentior.mock import MockServer
+from mentior.tokens import FileTokenStore, MemoryTokenStore
+
+
+def test_file_store(tmp_path):
+    store = FileTokenStore(tmp_path / "tokens.json")
+    assert store.load("ws://a") is None
+    store.save("ws://a", "1")
+    store.save("ws://b", "2")
+    assert FileTokenStore(store.path).load("ws://a") == "1"
+    store.delete("ws://a")
+    assert store.load("ws://a") is None
+    assert store.load("ws://b") == "2"
+
+
+def test_file_store_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("not json")
+    store = FileTokenStore(path)
+    assert store.load("ws://a") is None
+    store.save("ws://a", "1")
+    assert store.load("ws://a") == "1"
+
+
+def test_stored_token_is_reused():
+    async def main():
+        store = MemoryTokenStore()
+        async with MockServer() as server:
+            for _ in range(2):
+                async with mentior.authenticate(port=server.port, store=store):
+                    pass
+            assert server.requests["AuthenticationTokenRequest"] == 1
+
+    asyncio.run(main())
+
+
+def test_rejected_stored_token_is_replaced():
+    async def main():
+        store = MemoryTokenStore()
+        async with MockServer() as server:
+            key = f"ws://127.0.0.1:{server.port}"
+            store.save(key, "revoked")
+            async with mentior.authenticate(port=server.port, store=store):
+                pass
+            assert server.requests["AuthenticationTokenRequest"] == 1
+            assert store.load(key) in server.tokens
+
+    asyncio.run(main())
+
+
+def test_reconnect_keeps_explicit_token():
+    async def main():
+        async with MockServer(tokens={"given"}) as server:
+            async with mentior.authenticate(
+                port=server.port,
+                token="given",
+                store=MemoryTokenStore(),
+                reconnect=True,
+            ) as vts:
+                await server.disconnect_all()
+                await asyncio.wait_for(vts.status(), 5)
+                assert server.requests["AuthenticationRequest"] == 2
+                assert server.requests["AuthenticationTokenRequest"] == 0
+
+    asyncio.run(main())
+
+
+def test_reconnect_replaces_revoked_token():
+    async def main():
+        store = MemoryTokenStore()
+        async with MockServer() as server:
+            key = f"ws://127.0.0.1:{server.port}"
+            async with mentior.authenticate(
+                port=server.port, store=store, reconnect=True
+            ) as vts:
+                server.tokens.clear()
+                await server.disconnect_all()
+                status = await asyncio.wait_for(vts.status(), 5)
+                assert status.current_session_authenticated
+                assert server.requests["AuthenticationTokenRequest"] == 2
+                assert store.load(key) in server.tokens
+
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mentior import types
+from mentior.models.base import Response
+
+
+def test_response_types_are_built_on_access():
+    for name in types._RESPONSES:
+        assert name in dir(types)
+        response = getattr(types, name)
+        assert issubclass(response, Response)
+        assert getattr(types, name) is response
+    with pytest.raises(AttributeError):
+        types.MissingResponse
+
+
+def test_import_is_lazy():
+    code = "import sys, mentior; print('pydantic' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+    assert out.stdout.strip() == "False"